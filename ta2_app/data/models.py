@@ -8,7 +8,7 @@ market data after normalization from raw exchange formats.
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Protocol
 
 from ta2_app.config.defaults import DataStoreParams
 
@@ -25,6 +25,13 @@ class Candle:
     is_closed: bool    # True if bar is closed/confirmed
 
 
+class ClosedCandle(Protocol):
+    """Candle fields read by fakeout invalidation checks."""
+    ts: datetime
+    close: float
+    is_closed: bool
+
+
 @dataclass(frozen=True)
 class BookLevel:
     """Single order book level with price and size."""
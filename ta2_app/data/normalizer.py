@@ -6,7 +6,9 @@ and normalization of market data while maintaining instrument-specific data stor
 """
 
 import logging
-from typing import Any, Optional
+from typing import Any, Optional, Union
+
+import numpy as np
 
 from ..errors import (
     DataQualityError,
@@ -22,6 +24,7 @@ from .models import BookSnap, Candle, InstrumentDataStore, NormalizationResult
 from .parsers import (
     ParseError,
     PriceSpikeError,
+    parse_candle_array,
     parse_candlestick_payload,
     parse_json_payload,
     parse_orderbook_payload,
@@ -111,7 +114,7 @@ class DataNormalizer:
 
     def normalize_tick(self,
                       instrument_id: str,
-                      raw_data: str,
+                      raw_data: Union[str, bytes],
                       data_type: str,
                       timeframe: str = "1s") -> NormalizationResult:
         """
@@ -119,7 +122,7 @@ class DataNormalizer:
 
         Args:
             instrument_id: Trading instrument identifier
-            raw_data: Raw JSON data from exchange
+            raw_data: Raw JSON data from exchange (str, or bytes as received)
             data_type: Type of data ("candle" or "book")
             timeframe: Timeframe for candle data
 
@@ -171,13 +174,14 @@ class DataNormalizer:
 
     def _normalize_candle_tick(self,
                               instrument_id: str,
-                              payload: dict[str, Any],
+                              payload: Union[dict[str, Any], np.ndarray],
                               store: InstrumentDataStore,
                               timeframe: str) -> NormalizationResult:
-        """Normalize candlestick tick data."""
+        """Normalize candlestick tick data (raw OKX payload or preparsed CANDLE_DTYPE rows)."""
         try:
             # Validate payload structure
-            if not isinstance(payload, dict):
+            is_array = isinstance(payload, np.ndarray)
+            if not is_array and not isinstance(payload, dict):
                 raise MalformedDataError("Payload must be a dictionary", raw_data=str(payload)[:100])
 
             # Get context for spike filtering
@@ -188,7 +192,8 @@ class DataNormalizer:
             spike_filtering_enabled = self.enable_spike_filter and last_price is not None
 
             # Parse candlestick payload with spike filtering
-            candles = parse_candlestick_payload(
+            parse = parse_candle_array if is_array else parse_candlestick_payload
+            candles = parse(
                 payload,
                 enable_spike_filter=spike_filtering_enabled,
                 last_price=last_price,
@@ -495,6 +500,30 @@ class DataNormalizer:
             logger.error(f"Error in normalize_candlesticks: {e}")
             return NormalizationResult.error(f"Normalization error: {e}")
 
+    def normalize_candle_array(self, instrument_id: str, candles: np.ndarray) -> NormalizationResult:
+        """
+        Normalize preparsed candle rows - fast-path counterpart of normalize_candlesticks.
+
+        Args:
+            instrument_id: Trading instrument identifier
+            candles: Structured array with dtype CANDLE_DTYPE
+
+        Returns:
+            NormalizationResult with normalized candle data
+        """
+        try:
+            return self._normalize_candle_tick(instrument_id, candles, self.get_or_create_store(instrument_id), "1m")
+
+        except DataQualityError as e:
+            logger.warning(f"Data quality error in normalize_candle_array: {e}")
+            return NormalizationResult.error(f"Data quality error: {e}")
+        except GracefulDegradationError as e:
+            logger.info(f"Graceful degradation in normalize_candle_array: {e}")
+            return NormalizationResult.skipped(f"Graceful degradation: {e}")
+        except Exception as e:
+            logger.error(f"Error in normalize_candle_array: {e}")
+            return NormalizationResult.error(f"Normalization error: {e}")
+
     def normalize_orderbook(self, payload: dict[str, Any]) -> NormalizationResult:
         """
         Normalize order book payload - compatibility method for engine.
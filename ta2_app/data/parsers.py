@@ -8,7 +8,9 @@ canonical data structures with proper type conversion and error handling.
 import json
 import time
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, Union
+
+import numpy as np
 
 try:
     import orjson
@@ -148,6 +150,9 @@ def parse_candlestick_payload(payload: dict[str, Any], *,
 
     Inner array format: [ts_ms, open, high, low, close, vol_base, vol_quote?, vol_quote_alt?, confirm_flag]
 
+    Rows already decoded to numbers (e.g. [1597026383085, 3.721, ..., 1]) are accepted
+    as well; conversion is then a no-op and the confirm flag may be 1/0.
+
     Args:
         payload: Raw OKX candlestick payload
         enable_spike_filter: Whether to enable ATR-based spike filtering
@@ -200,11 +205,7 @@ def parse_candlestick_payload(payload: dict[str, Any], *,
 
                 # Apply spike filtering if enabled
                 if enable_spike_filter:
-                    # Check each OHLC price against spike filter
-                    for price_name, price_value in [("open", candle.open), ("high", candle.high),
-                                                  ("low", candle.low), ("close", candle.close)]:
-                        if not validate_atr_spike_filter(price_value, last_price, atr, spike_multiplier):
-                            raise PriceSpikeError(f"Price spike detected in {price_name}: {price_value} vs last_price={last_price}, atr={atr}, multiplier={spike_multiplier}")
+                    _check_price_spike(candle, last_price, atr, spike_multiplier)
 
                 candles.append(candle)
             except (InvalidPriceError, InvalidTimestampError, InvalidVolumeError, OHLCConsistencyError, PriceSpikeError):
@@ -256,29 +257,11 @@ def _parse_single_candle(candle_data: list[str]) -> Candle:
         except ValueError as e:
             raise InvalidVolumeError(f"Invalid volume '{candle_data[5]}': {e}")
 
-        # Parse confirmation flag
+        # Parse confirmation flag (wire string "1" or decoded 1)
         confirm_flag = candle_data[8]
-        is_closed = confirm_flag == "1"
-
-        # Enhanced validation with specific error types
-        if any(price <= 0 for price in [open_price, high_price, low_price, close_price]):
-            raise InvalidPriceError(f"All prices must be positive: O={open_price}, H={high_price}, L={low_price}, C={close_price}")
-
-        if volume < 0:
-            raise InvalidVolumeError(f"Volume must be non-negative: {volume}")
+        is_closed = confirm_flag == "1" or confirm_flag == 1
 
-        if high_price < max(open_price, close_price) or low_price > min(open_price, close_price):
-            raise OHLCConsistencyError(f"High/low prices inconsistent with open/close: O={open_price}, H={high_price}, L={low_price}, C={close_price}")
-
-        return Candle(
-            ts=ts,
-            open=open_price,
-            high=high_price,
-            low=low_price,
-            close=close_price,
-            volume=volume,
-            is_closed=is_closed
-        )
+        return _build_candle(ts, open_price, high_price, low_price, close_price, volume, is_closed)
 
     except (InvalidPriceError, InvalidTimestampError, InvalidVolumeError, OHLCConsistencyError):
         raise  # Re-raise specific parsing errors
@@ -286,6 +269,102 @@ def _parse_single_candle(candle_data: list[str]) -> Candle:
         raise ParseError(f"Failed to parse candle data: {e}")
 
 
+def _build_candle(ts: datetime, open_price: float, high_price: float, low_price: float,
+                  close_price: float, volume: float, is_closed: bool) -> Candle:
+    """Validate already-numeric candle fields and build the Candle."""
+    # Enhanced validation with specific error types
+    if any(price <= 0 for price in [open_price, high_price, low_price, close_price]):
+        raise InvalidPriceError(f"All prices must be positive: O={open_price}, H={high_price}, L={low_price}, C={close_price}")
+
+    if volume < 0:
+        raise InvalidVolumeError(f"Volume must be non-negative: {volume}")
+
+    if high_price < max(open_price, close_price) or low_price > min(open_price, close_price):
+        raise OHLCConsistencyError(f"High/low prices inconsistent with open/close: O={open_price}, H={high_price}, L={low_price}, C={close_price}")
+
+    return Candle(
+        ts=ts,
+        open=open_price,
+        high=high_price,
+        low=low_price,
+        close=close_price,
+        volume=volume,
+        is_closed=is_closed
+    )
+
+
+def _check_price_spike(candle: Candle, last_price: float, atr: float, spike_multiplier: float) -> None:
+    """Raise PriceSpikeError if any OHLC price fails the ATR spike filter."""
+    for price_name, price_value in [("open", candle.open), ("high", candle.high),
+                                  ("low", candle.low), ("close", candle.close)]:
+        if not validate_atr_spike_filter(price_value, last_price, atr, spike_multiplier):
+            raise PriceSpikeError(f"Price spike detected in {price_name}: {price_value} vs last_price={last_price}, atr={atr}, multiplier={spike_multiplier}")
+
+
+# Preparsed candle rows: the numeric columns of an OKX candle array plus the confirm flag
+CANDLE_DTYPE = np.dtype([
+    ("ts", "i8"),        # Epoch milliseconds
+    ("o", "f8"),
+    ("h", "f8"),
+    ("l", "f8"),
+    ("c", "f8"),
+    ("v", "f8"),         # Base volume
+    ("vq", "f8"),        # Quote volume
+    ("confirm", "?"),    # True if bar is closed
+])
+
+
+def parse_candle_array(candles: np.ndarray, *,
+                       enable_spike_filter: bool = False,
+                       last_price: float = None,
+                       atr: float = None,
+                       spike_multiplier: float = 10.0) -> list[Candle]:
+    """
+    Convert preparsed candle rows into normalized Candle objects.
+
+    Fast path for callers that already hold numeric candle data: skips the
+    string-to-number conversion of parse_candlestick_payload but applies the
+    same price, volume, OHLC and spike checks.
+
+    Args:
+        candles: Structured array with dtype CANDLE_DTYPE
+        enable_spike_filter: Whether to enable ATR-based spike filtering
+        last_price: Previous price for spike detection (required if enable_spike_filter=True)
+        atr: Average True Range for spike detection (None uses fallback filter)
+        spike_multiplier: ATR multiplier for spike threshold (default: 10.0)
+
+    Returns:
+        List of normalized Candle objects
+
+    Raises:
+        ParseError: If the array dtype is not CANDLE_DTYPE or spike filter arguments are invalid
+        PriceSpikeError: If spike filtering is enabled and spike is detected
+        InvalidPriceError: If price data is invalid
+        InvalidTimestampError: If timestamp data is invalid
+        InvalidVolumeError: If volume data is invalid
+        OHLCConsistencyError: If OHLC prices are inconsistent
+    """
+    if enable_spike_filter and last_price is None:
+        raise ParseError("last_price is required when enable_spike_filter=True")
+
+    if not isinstance(candles, np.ndarray) or candles.dtype != CANDLE_DTYPE:
+        raise ParseError(f"Candle array must have dtype CANDLE_DTYPE, got {getattr(candles, 'dtype', type(candles))}")
+
+    result = []
+    for ts_ms, o, h, l, c, v, _vq, confirm in candles.tolist():
+        try:
+            ts = datetime.fromtimestamp(ts_ms / 1000.0, tz=UTC)
+        except (ValueError, OSError, OverflowError) as e:
+            raise InvalidTimestampError(f"Invalid timestamp '{ts_ms}': {e}")
+
+        candle = _build_candle(ts, o, h, l, c, v, confirm)
+        if enable_spike_filter:
+            _check_price_spike(candle, last_price, atr, spike_multiplier)
+        result.append(candle)
+
+    return result
+
+
 def parse_orderbook_payload(payload: dict[str, Any], max_levels: int = 5) -> BookSnap:
     """
     Parse OKX order book payload into normalized BookSnap object.
@@ -388,14 +467,14 @@ def _parse_book_levels(levels_data: list[list[str]], side: str, max_levels: int)
     return levels
 
 
-def parse_json_payload(raw_data: str) -> dict[str, Any]:
+def parse_json_payload(raw_data: Union[str, bytes]) -> dict[str, Any]:
     """
     Parse raw JSON string into dictionary.
 
     Uses orjson for better performance when available, falls back to standard json.
 
     Args:
-        raw_data: Raw JSON string from exchange
+        raw_data: Raw JSON from exchange, as str or undecoded bytes
 
     Returns:
         Parsed dictionary
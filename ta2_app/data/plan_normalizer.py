@@ -8,9 +8,11 @@ including JSON string parsing and field name standardization.
 import json
 import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Optional
 
+from ..utils.time import to_epoch_ns
+
 logger = logging.getLogger(__name__)
 
 
@@ -125,6 +127,22 @@ class PlanNormalizer:
                 except (ValueError, TypeError) as e:
                     return PlanNormalizationResult.error(f"Invalid created_at timestamp: {e}")
 
+            # Keep creation time as epoch nanoseconds too, so per-tick time-limit checks
+            # subtract integers instead of datetimes; an explicit created_at_epoch
+            # (seconds, fractions kept) wins over created_at
+            try:
+                if normalized_plan.get('created_at_epoch') is not None:
+                    normalized_plan['created_at_epoch'] = float(normalized_plan['created_at_epoch'])
+                    created_from_epoch = datetime.fromtimestamp(normalized_plan['created_at_epoch'], tz=timezone.utc)
+                    normalized_plan['created_at_epoch_ns'] = to_epoch_ns(created_from_epoch)
+                    if normalized_plan.get('created_at') is None:
+                        normalized_plan['created_at'] = created_from_epoch
+                elif isinstance(normalized_plan.get('created_at'), datetime):
+                    if normalized_plan['created_at'].tzinfo is not None:
+                        normalized_plan['created_at_epoch_ns'] = to_epoch_ns(normalized_plan['created_at'])
+            except (ValueError, TypeError, OverflowError, OSError) as e:
+                return PlanNormalizationResult.error(f"Invalid created_at_epoch: {e}")
+
             # Validate invalidation conditions format if present
             extra_data = normalized_plan.get('extra_data', {})
             if 'invalidation_conditions' in extra_data:
@@ -5,8 +5,10 @@ Orchestrates the breakout plan evaluation pipeline, coordinating data ingestion,
 metrics calculation, state machine evaluation, and signal emission.
 """
 
-from typing import TYPE_CHECKING, Any, Optional
+import logging
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
 
+import numpy as np
 import structlog
 
 from .config.loader import ConfigLoader
@@ -26,11 +28,11 @@ from .errors import (
     RecoverableError,
     GracefulDegradationError,
 )
-from .logging.config import get_gating_logger
+from .logging.config import get_gating_logger, is_enabled_for
 from .metrics.calculator import MetricsCalculator
 from .state.models import BreakoutParameters, MarketContext
 from .state.runtime import state_manager
-from .utils.time import get_market_time_with_latency
+from .utils.time import calculate_latency_fast, get_market_time
 
 if TYPE_CHECKING:
     from .models.metrics import MetricsSnapshot
@@ -61,13 +63,34 @@ class BreakoutEvaluationEngine:
         self.data_stores: dict[str, InstrumentDataStore] = {}
         self.metrics_calculators: dict[str, MetricsCalculator] = {}
 
-        # Active plans tracking
+        # Active plans tracking, plus the same plans grouped by instrument
         self.active_plans: list[dict[str, Any]] = []
+        self.plans_by_instrument: dict[str, list[dict[str, Any]]] = {}
 
         self.logger.info("Breakout evaluation engine initialized")
 
     def add_plan(self, plan_data: dict[str, Any]) -> None:
         """Add a new breakout plan for evaluation."""
+        normalized_plan = self._prepare_plan(plan_data)
+        if normalized_plan is not None:
+            self._register_plans([normalized_plan])
+
+    def add_plans(self, plans: Iterable[dict[str, Any]]) -> None:
+        """
+        Add several breakout plans in one batch.
+
+        Invalid plans are skipped as in add_plan. Valid plans are grouped by
+        instrument and appended to each instrument's plan list once per batch.
+        """
+        normalized_plans = [
+            normalized_plan for normalized_plan in map(self._prepare_plan, plans)
+            if normalized_plan is not None
+        ]
+        if normalized_plans:
+            self._register_plans(normalized_plans)
+
+    def _prepare_plan(self, plan_data: dict[str, Any]) -> Optional[dict[str, Any]]:
+        """Validate and normalize a raw plan; returns None (after logging) if rejected."""
         plan_id = plan_data.get('id')
         instrument_id = plan_data.get('instrument_id')
 
@@ -77,7 +100,7 @@ class BreakoutEvaluationEngine:
                 plan_id=plan_id,
                 instrument_id=instrument_id
             )
-            return
+            return None
 
         # Validate plan type
         if plan_data.get('entry_type') != 'breakout':
@@ -86,7 +109,7 @@ class BreakoutEvaluationEngine:
                 plan_id=plan_id,
                 entry_type=plan_data.get('entry_type')
             )
-            return
+            return None
 
         # Normalize plan data
         normalization_result = self.plan_normalizer.normalize_plan(plan_data)
@@ -97,7 +120,7 @@ class BreakoutEvaluationEngine:
                 plan_id=plan_id,
                 error=normalization_result.error_msg
             )
-            return
+            return None
 
         normalized_plan = normalization_result.normalized_plan
 
@@ -112,35 +135,74 @@ class BreakoutEvaluationEngine:
                     plan_id=plan_id,
                     errors=error_msgs
                 )
-                return
+                return None
 
-        self.active_plans.append(normalized_plan)
+        return normalized_plan
 
-        # Ensure instrument data store exists
-        if instrument_id not in self.data_stores:
-            self.data_stores[instrument_id] = InstrumentDataStore()
-            self.metrics_calculators[instrument_id] = MetricsCalculator()
+    def _register_plans(self, normalized_plans: list[dict[str, Any]]) -> None:
+        """Track validated plans and set up data stores for new instruments."""
+        self.active_plans.extend(normalized_plans)
 
-        self.logger.info(
-            "Added breakout plan for evaluation",
-            plan_id=plan_id,
-            instrument_id=instrument_id,
-            entry_price=plan_data.get('entry_price'),
-            direction=plan_data.get('direction')
-        )
+        by_instrument: dict[str, list[dict[str, Any]]] = {}
+        for plan in normalized_plans:
+            by_instrument.setdefault(plan['instrument_id'], []).append(plan)
+
+        for instrument_id, plans in by_instrument.items():
+            self.plans_by_instrument.setdefault(instrument_id, []).extend(plans)
+
+            # Ensure instrument data store exists
+            if instrument_id not in self.data_stores:
+                self.data_stores[instrument_id] = InstrumentDataStore()
+                self.metrics_calculators[instrument_id] = MetricsCalculator()
+
+        for plan in normalized_plans:
+            self.logger.info(
+                "Added breakout plan for evaluation",
+                plan_id=plan.get('id'),
+                instrument_id=plan['instrument_id'],
+                entry_price=plan.get('entry_price'),
+                direction=plan.get('direction')
+            )
 
     def remove_plan(self, plan_id: str) -> None:
         """Remove a plan from evaluation."""
+        removed = [p for p in self.active_plans if p.get('id') == plan_id]
         self.active_plans = [p for p in self.active_plans if p.get('id') != plan_id]
+        for instrument_id in {p['instrument_id'] for p in removed}:
+            remaining = [
+                p for p in self.plans_by_instrument.get(instrument_id, [])
+                if p.get('id') != plan_id
+            ]
+            if remaining:
+                self.plans_by_instrument[instrument_id] = remaining
+            else:
+                self.plans_by_instrument.pop(instrument_id, None)
         state_manager.remove_plan(plan_id)
 
         self.logger.info("Removed plan from evaluation", plan_id=plan_id)
 
+    def reset(self) -> None:
+        """
+        Drop all plans and per-instrument market data.
+
+        Leaves the engine as freshly constructed, without reloading config or
+        rebuilding the normalizers; plan runtime state is removed from the
+        global state manager as in remove_plan.
+        """
+        for plan in self.active_plans:
+            state_manager.remove_plan(plan['id'])
+        self.active_plans.clear()
+        self.plans_by_instrument.clear()
+        self.data_stores.clear()
+        self.metrics_calculators.clear()
+        self.normalizer.stores.clear()
+
     def evaluate_tick(
         self,
         candlestick_payload: Optional[dict[str, Any]] = None,
         orderbook_payload: Optional[dict[str, Any]] = None,
-        instrument_id: Optional[str] = None
+        instrument_id: Optional[str] = None,
+        candles_np: Optional[np.ndarray] = None
     ) -> list[dict[str, Any]]:
         """
         Evaluate a single market data tick.
@@ -149,6 +211,8 @@ class BreakoutEvaluationEngine:
             candlestick_payload: Raw candlestick data from exchange
             orderbook_payload: Raw order book data from exchange
             instrument_id: Target instrument (if processing single instrument)
+            candles_np: Preparsed candle rows (dtype CANDLE_DTYPE); used instead of
+                candlestick_payload to skip string parsing
 
         Returns:
             List of generated trading signals
@@ -157,11 +221,15 @@ class BreakoutEvaluationEngine:
             return []
 
         try:
+            if candles_np is not None:
+                candlestick_payload = candles_np
+
             # Validate input data
-            if not candlestick_payload and not orderbook_payload:
+            has_candles = candlestick_payload is not None and len(candlestick_payload) > 0
+            if not has_candles and not orderbook_payload:
                 raise MissingDataError("No market data provided for evaluation")
 
-            if candlestick_payload and not instrument_id:
+            if has_candles and not instrument_id:
                 raise MissingDataError("instrument_id required for candlestick data")
 
             if orderbook_payload and not instrument_id:
@@ -172,7 +240,7 @@ class BreakoutEvaluationEngine:
             processed_instruments = set()
 
             # Process candlestick data
-            if candlestick_payload and instrument_id:
+            if has_candles and instrument_id:
                 candle_signals = self._process_candlestick_update(
                     candlestick_payload, instrument_id
                 )
@@ -224,22 +292,40 @@ class BreakoutEvaluationEngine:
             )
             return []
 
+    def evaluate_ticks(self, ticks: Iterable[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        """
+        Evaluate a sequence of market data ticks in order.
+
+        Args:
+            ticks: One dict per tick holding evaluate_tick keyword arguments
+                (candlestick_payload, orderbook_payload, instrument_id, candles_np)
+
+        Returns:
+            Signals generated by each tick, in tick order
+        """
+        evaluate_tick = self.evaluate_tick
+        return [evaluate_tick(**tick) for tick in ticks]
+
     def _process_candlestick_update(
         self,
-        payload: dict[str, Any],
+        payload: Union[dict[str, Any], np.ndarray],
         instrument_id: str
     ) -> list[dict[str, Any]]:
-        """Process candlestick data update."""
+        """Process candlestick data update (raw payload or preparsed candle rows)."""
         try:
-            # Validate payload structure
-            if not isinstance(payload, dict):
-                raise MalformedDataError(
-                    f"Candlestick payload must be dict, got {type(payload)}", 
-                    raw_data=str(payload)[:100]
-                )
+            # Preparsed rows skip payload structure checks and string parsing
+            if isinstance(payload, np.ndarray):
+                result = self.normalizer.normalize_candle_array(instrument_id, payload)
+            else:
+                # Validate payload structure
+                if not isinstance(payload, dict):
+                    raise MalformedDataError(
+                        f"Candlestick payload must be dict, got {type(payload)}", 
+                        raw_data=str(payload)[:100]
+                    )
 
-            # Normalize candlestick data
-            result = self.normalizer.normalize_candlesticks(payload)
+                # Normalize candlestick data
+                result = self.normalizer.normalize_candlesticks(payload)
 
             if not result.success or not result.candle:
                 # Convert normalization failure to appropriate error type
@@ -362,10 +448,7 @@ class BreakoutEvaluationEngine:
     def _evaluate_plans_for_instrument(self, instrument_id: str) -> list[dict[str, Any]]:
         """Evaluate all plans for a specific instrument."""
         # Get plans for this instrument
-        instrument_plans = [
-            p for p in self.active_plans
-            if p.get('instrument_id') == instrument_id
-        ]
+        instrument_plans = self.plans_by_instrument.get(instrument_id, [])
 
         if not instrument_plans:
             return []
@@ -385,17 +468,19 @@ class BreakoutEvaluationEngine:
         # Build market context with proper time semantics
         # Note: Market time from data feeds is authoritative for all evaluations
         # Wall-clock time is only used as fallback when market time unavailable
-        market_timestamp, latency = get_market_time_with_latency(data_store.last_update)
-
-        # Log time semantics information
-        if latency is not None:
-            self.logger.debug(
-                "Using market time for evaluation",
-                instrument_id=instrument_id,
-                market_time=market_timestamp.isoformat(),
-                latency_ms=int(latency * 1000)
-            )
+        market_timestamp = data_store.last_update
+
+        # Log time semantics information (latency is only worth computing when DEBUG is on)
+        if market_timestamp is not None:
+            if is_enabled_for(self.logger, logging.DEBUG):
+                self.logger.debug(
+                    "Using market time for evaluation",
+                    instrument_id=instrument_id,
+                    market_time=market_timestamp.isoformat(),
+                    latency_ms=int(calculate_latency_fast(market_timestamp) * 1000)
+                )
         else:
+            market_timestamp = get_market_time()
             self.logger.warning(
                 "No market time available - using wall-clock fallback",
                 instrument_id=instrument_id,
@@ -525,7 +610,7 @@ class BreakoutEvaluationEngine:
                 "retest_band_pct": breakout_config.retest_band_pct,
                 "fakeout_close_invalidate": breakout_config.fakeout_close_invalidate
             },
-            event="plan_evaluation_start"
+            eval_event="plan_evaluation_start"
         )
 
         # Convert MarketContext to dict for compatibility
@@ -558,7 +643,7 @@ class BreakoutEvaluationEngine:
             plan_id=plan_id,
             signals_generated=len(signals),
             signal_types=[signal.get('signal_type') for signal in signals] if signals else [],
-            event="plan_evaluation_complete"
+            eval_event="plan_evaluation_complete"
         )
 
         return signals
@@ -598,6 +683,11 @@ class BreakoutEvaluationEngine:
         """Get count of active plans."""
         return len(self.active_plans)
 
+    @property
+    def active_plan_ids(self) -> set[str]:
+        """IDs of the plans currently under evaluation."""
+        return {p['id'] for p in self.active_plans}
+
     def get_runtime_stats(self) -> dict[str, Any]:
         """Get runtime statistics."""
         return {
@@ -138,6 +138,27 @@ def get_state_logger(name: str) -> FilteringBoundLogger:
     )
 
 
+def is_enabled_for(logger: Any, level: int) -> bool:
+    """
+    Check whether a logger would emit records at the given level.
+
+    Works with both structlog's filtering bound loggers (``is_enabled_for``)
+    and stdlib-backed loggers (``isEnabledFor``). Loggers exposing neither
+    are assumed to be enabled.
+
+    Args:
+        logger: Structlog or stdlib logger instance
+        level: Standard library logging level (e.g. ``logging.DEBUG``)
+
+    Returns:
+        True if a record at ``level`` would be processed
+    """
+    check = getattr(logger, "is_enabled_for", None) or getattr(logger, "isEnabledFor", None)
+    if check is None:
+        return True
+    return bool(check(level))
+
+
 def log_gate_decision(
     logger: FilteringBoundLogger,
     gate_name: str,
@@ -11,6 +11,28 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dumps_signal(signal: dict[str, Any]) -> str:
+    """Serialize a signal for the signal_data column, using orjson when available."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(signal).decode()
+        except TypeError:
+            # numpy scalars and non-str keys are left to the stdlib encoder
+            pass
+    return json.dumps(signal)
+
+
+def _loads_signal(data: str) -> dict[str, Any]:
+    """Deserialize a signal_data column value."""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
 
 @dataclass
 class StoredSignal:
@@ -31,13 +53,27 @@ class SignalStore:
     """SQLite-based signal persistence layer."""
 
     def __init__(self, db_path: str = "signals.db"):
-        self.db_path = Path(db_path)
+        # SQLite URI filenames (e.g. "file:signals?mode=memory&cache=shared") are passed as-is
+        self._is_uri = str(db_path).startswith("file:")
+        self.db_path = db_path if self._is_uri else Path(db_path)
         self.logger = logging.getLogger("signal.store")
         self._lock = threading.Lock()
+        self._local = threading.local()
+
+        # A shared in-memory database only lives while a connection to it is open
+        self._keepalive = (
+            sqlite3.connect(db_path, uri=True) if self._is_uri and "mode=memory" in db_path else None
+        )
 
         # Create database and tables
         self._init_database()
 
+    def close(self) -> None:
+        """Release the connection holding an in-memory database open."""
+        if self._keepalive is not None:
+            self._keepalive.close()
+            self._keepalive = None
+
     def _generate_signal_hash(self, signal: dict[str, Any]) -> str:
         """Generate unique hash for signal deduplication."""
         # Use plan_id, state, and timestamp for uniqueness
@@ -136,9 +172,15 @@ class SignalStore:
     @contextmanager
     def _get_connection(self):
         """Get database connection with proper error handling."""
+        # Inside transaction() the thread reuses its open connection
+        tx_conn = getattr(self._local, "conn", None)
+        if tx_conn is not None:
+            yield tx_conn
+            return
+
         conn = None
         try:
-            conn = sqlite3.connect(self.db_path, timeout=30.0)
+            conn = sqlite3.connect(self.db_path, timeout=30.0, uri=self._is_uri)
             conn.row_factory = sqlite3.Row
             yield conn
         except sqlite3.Error as e:
@@ -150,6 +192,37 @@ class SignalStore:
             if conn:
                 conn.close()
 
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        """Commit unless the connection belongs to an open transaction()."""
+        if conn is not getattr(self._local, "conn", None):
+            conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group writes made on this thread into a single commit.
+
+        Stores and updates issued inside the block share one connection and
+        are committed together on exit, or rolled back if the block raises.
+        Nested calls join the outer transaction.
+        """
+        if getattr(self._local, "conn", None) is not None:
+            yield
+            return
+
+        with self._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            self._local.conn = conn
+            try:
+                yield
+            except BaseException:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+            finally:
+                self._local.conn = None
+
     def store_signal(self, signal: dict[str, Any]) -> Optional[int]:
         """
         Store a signal in the database.
@@ -158,7 +231,8 @@ class SignalStore:
             signal: Signal dictionary to store
 
         Returns:
-            Signal ID if stored successfully, None otherwise
+            Signal ID if stored successfully (the existing row's ID when the
+            plan_id/state/timestamp key is already stored), None otherwise
         """
         with self._lock:
             try:
@@ -166,23 +240,36 @@ class SignalStore:
                     now = datetime.now(timezone.utc).isoformat()
 
                     signal_hash = self._generate_signal_hash(signal)
+                    plan_id = signal.get("plan_id")
+                    state = signal.get("state")
+                    timestamp = signal.get("timestamp", now)
 
+                    # The UNIQUE(plan_id, state, timestamp) constraint does the dedup
                     cursor = conn.execute("""
-                        INSERT OR REPLACE INTO signals (
+                        INSERT INTO signals (
                             plan_id, state, protocol_version, timestamp,
                             signal_data, created_at, signal_hash
                         ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(plan_id, state, timestamp) DO NOTHING
                     """, (
-                        signal.get("plan_id"),
-                        signal.get("state"),
+                        plan_id,
+                        state,
                         signal.get("protocol_version", "unknown"),
-                        signal.get("timestamp", now),
-                        json.dumps(signal),
+                        timestamp,
+                        _dumps_signal(signal),
                         now,
                         signal_hash
                     ))
 
-                    conn.commit()
+                    self._commit(conn)
+
+                    if cursor.rowcount == 0:
+                        # Duplicate key: the first stored signal is kept
+                        return conn.execute("""
+                            SELECT id FROM signals
+                            WHERE plan_id = ? AND state = ? AND timestamp = ?
+                        """, (plan_id, state, timestamp)).fetchone()[0]
+
                     signal_id = cursor.lastrowid
 
                     self.logger.info(
@@ -213,11 +300,8 @@ class SignalStore:
         Returns:
             List of signal IDs (None for failed stores)
         """
-        results = []
-        for signal in signals:
-            result = self.store_signal(signal)
-            results.append(result)
-        return results
+        with self.transaction():
+            return [self.store_signal(signal) for signal in signals]
 
     def get_signal(self, signal_id: int) -> Optional[StoredSignal]:
         """Get a signal by ID."""
@@ -249,6 +333,18 @@ class SignalStore:
             self.logger.error(f"Failed to get signals for plan {plan_id}: {str(e)}")
             return []
 
+    def count_by_plan(self, plan_id: str) -> int:
+        """Count stored signals for a plan without loading them."""
+        try:
+            with self._get_connection() as conn:
+                return conn.execute("""
+                    SELECT COUNT(*) FROM signals WHERE plan_id = ?
+                """, (plan_id,)).fetchone()[0]
+
+        except Exception as e:
+            self.logger.error(f"Failed to count signals for plan {plan_id}: {str(e)}")
+            return 0
+
     def get_signals_by_state(self, state: str, limit: int = 100) -> list[StoredSignal]:
         """Get signals by state."""
         try:
@@ -312,7 +408,7 @@ class SignalStore:
                         WHERE id = ?
                     """, (now, status, signal_id))
 
-                conn.commit()
+                self._commit(conn)
                 return True
 
         except Exception as e:
@@ -366,7 +462,7 @@ class SignalStore:
                     DELETE FROM signals WHERE created_at < ?
                 """, (cutoff_str,))
 
-                conn.commit()
+                self._commit(conn)
                 deleted_count = cursor.rowcount
 
                 self.logger.info(f"Cleaned up {deleted_count} old signals")
@@ -401,7 +497,7 @@ class SignalStore:
             state=row["state"],
             protocol_version=row["protocol_version"],
             timestamp=row["timestamp"],
-            signal_data=json.loads(row["signal_data"]),
+            signal_data=_loads_signal(row["signal_data"]),
             created_at=row["created_at"],
             delivery_attempts=row["delivery_attempts"],
             last_delivery_attempt=row["last_delivery_attempt"],
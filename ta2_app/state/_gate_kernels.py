@@ -0,0 +1,104 @@
+"""
+Numeric kernels for breakout gate and invalidation decisions.
+
+These functions hold only the float arithmetic and comparisons behind the
+gate validators in ``transitions``; logging stays in the Python wrappers.
+Kernels take plain floats/bools (missing values as NaN, never None) so they
+can be compiled with Numba when it is installed. Without Numba they run as
+regular Python functions with identical results.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# fastmath is deliberately off: it lets LLVM assume no NaNs, and NaN is the
+# "missing value" sentinel the kernels rely on to fail a gate.
+
+@njit(cache=True)
+def penetration_passed(
+    current_price: float,
+    entry_price: float,
+    penetration_distance: float,
+    is_short: bool
+) -> bool:
+    """Price moved beyond entry by the penetration distance."""
+    if is_short:
+        return current_price <= entry_price - penetration_distance
+    return current_price >= entry_price + penetration_distance
+
+
+@njit(cache=True)
+def volatility_passed(bar_range: float, atr: float, min_break_range_atr: float) -> bool:
+    """Bar range is at least min_break_range_atr x ATR (NaN inputs fail)."""
+    return bar_range >= min_break_range_atr * atr
+
+
+@njit(cache=True)
+def time_confirmation_passed(elapsed_seconds: float, confirm_seconds: float) -> bool:
+    """Enough time has elapsed since the break was first seen."""
+    return elapsed_seconds >= confirm_seconds
+
+
+@njit(cache=True)
+def price_invalidation_scan(current_price: float, levels: np.ndarray, above: np.ndarray) -> int:
+    """
+    Find the first crossed price invalidation level.
+
+    Args:
+        current_price: Latest traded price
+        levels: Invalidation price levels, in condition order
+        above: True where the level is a price_above limit, False for price_below
+
+    Returns:
+        Index of the first crossed level, or -1 if none was crossed
+    """
+    for i in range(levels.shape[0]):
+        level = levels[i]
+        if above[i]:
+            if current_price > level:
+                return i
+        elif current_price < level:
+            return i
+    return -1
+
+
+@njit(cache=True)
+def elapsed_seconds_ns(current_ns: int, start_ns: int) -> float:
+    """Seconds between two epoch-nanosecond timestamps (current - start)."""
+    return (current_ns - start_ns) * 1e-9
+
+
+@njit(cache=True)
+def time_limit_exceeded(elapsed_seconds: float, limit_seconds: float) -> bool:
+    """Elapsed time is strictly past the invalidation time limit."""
+    return elapsed_seconds > limit_seconds
+
+
+def warmup() -> None:
+    """
+    Compile every kernel once with representative argument types.
+
+    With ``cache=True`` the compiled code is written to Numba's on-disk cache,
+    so later processes load it instead of recompiling on the first tick.
+    Harmless without Numba (the calls just run as Python).
+    """
+    levels = np.array([1.0])
+    above = np.array([True])
+    penetration_passed(1.0, 1.0, 0.0, False)
+    volatility_passed(1.0, 1.0, 1.0)
+    time_confirmation_passed(1.0, 1.0)
+    price_invalidation_scan(1.0, levels, above)
+    elapsed_seconds_ns(1, 0)
+    time_limit_exceeded(1.0, 1.0)
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Optional
 
 from ..data.models import Candle
 from ..logging.config import get_gating_logger, get_state_logger, log_state_transition
+from ..utils.time import to_epoch_ns
 from .models import (
     BreakoutParameters,
     BreakoutSubState,
@@ -258,9 +259,10 @@ def check_pre_invalidations(
 ) -> Optional[InvalidationReason]:
     """Check pre-trigger invalidation conditions."""
 
-    # Time limit check
+    # Time limit check (normalized plans with an aware creation time carry created_at_epoch_ns)
     created_at = plan_data.get('created_at')
-    if created_at:
+    created_at_ns = plan_data.get('created_at_epoch_ns')
+    if created_at or created_at_ns is not None:
         extra_data = plan_data.get('extra_data', {})
         invalidation_conditions = extra_data.get('invalidation_conditions', [])
 
@@ -268,7 +270,10 @@ def check_pre_invalidations(
             if isinstance(condition, dict):
                 if condition.get('type') == 'time_limit':
                     duration = condition.get('duration_seconds', 0)
-                    elapsed = (current_time - created_at).total_seconds()
+                    if created_at_ns is not None:
+                        elapsed = (to_epoch_ns(current_time) - created_at_ns) * 1e-9
+                    else:
+                        elapsed = (current_time - created_at).total_seconds()
                     if elapsed > duration:
                         return InvalidationReason.TIME_LIMIT
 
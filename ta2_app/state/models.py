@@ -155,6 +155,44 @@ class PlanRuntimeState:
             signal_emitted=True
         )
 
+    def with_transition_applied(self, transition: 'StateTransition') -> 'PlanRuntimeState':
+        """Create new state with all fields affected by a transition updated at once."""
+        new_state = transition.new_state
+        substate = transition.new_substate or self.substate
+        timestamp = transition.timestamp
+
+        break_ts = self.break_ts
+        break_seen = self.break_seen
+        armed_at = self.armed_at
+        break_confirmed = self.break_confirmed
+        triggered_at = self.triggered_at
+
+        if new_state == PlanLifecycleState.PENDING:
+            if substate == BreakoutSubState.BREAK_SEEN:
+                break_ts = timestamp
+                break_seen = True
+        elif new_state == PlanLifecycleState.ARMED:
+            if substate in (BreakoutSubState.BREAK_CONFIRMED, BreakoutSubState.RETEST_ARMED):
+                # RETEST_ARMED is kept so eval_breakout_tick can reach its retest branch
+                armed_at = timestamp
+                break_confirmed = True
+            elif timestamp:
+                armed_at = timestamp
+        elif new_state == PlanLifecycleState.TRIGGERED and timestamp:
+            triggered_at = timestamp
+
+        return PlanRuntimeState(
+            state=new_state,
+            substate=substate,
+            break_ts=break_ts,
+            armed_at=armed_at,
+            triggered_at=triggered_at,
+            invalid_reason=transition.invalid_reason,
+            break_seen=break_seen,
+            break_confirmed=break_confirmed,
+            signal_emitted=self.signal_emitted or transition.should_emit_signal
+        )
+
 
 @dataclass(frozen=True)
 class StateTransition:
@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING, Any, Optional
 
 import structlog
 
-from ..utils.time import format_market_time, get_market_time
+from ..utils.time import format_market_time, get_market_time, parse_market_time
 
 if TYPE_CHECKING:
     from ..models.metrics import MetricsSnapshot
@@ -32,7 +32,7 @@ from .models import (
     PlanRuntimeState,
     StateTransition,
 )
-from .transitions import transition_handler
+from .transitions import invalidation_checker, transition_handler
 
 logger = structlog.get_logger(__name__)
 
@@ -82,7 +82,9 @@ class PlanRuntimeManager:
             emit_signal=emit_signal
         )
 
-        if emit_signal and not new_state.signal_emitted:
+        # new_state already carries signal_emitted for this transition; a signal
+        # is queued unless one was emitted before it
+        if emit_signal and not (old_state and old_state.signal_emitted):
             self._queue_signal(plan_id, new_state, signal_context, market_context)
 
     def process_plan_tick(
@@ -538,6 +540,11 @@ class StateManager:
         """
         emitted_signals = []
 
+        # Parse a string timestamp once per tick rather than once per plan
+        market_ts = market_data.get("timestamp")
+        if isinstance(market_ts, str):
+            market_data = {**market_data, "timestamp": parse_market_time(market_ts)}
+
         for plan in active_plans:
             plan_id = plan.get('id')
             if not plan_id:
@@ -582,6 +589,7 @@ class StateManager:
         """Remove plan from tracking."""
         self.runtime_manager.remove_plan(plan_id)
         self.signal_emitter.clear_plan_signals(plan_id)
+        invalidation_checker.clear_plan_cache(plan_id)
 
     def get_active_plan_count(self) -> int:
         """Get count of plans in non-terminal states."""
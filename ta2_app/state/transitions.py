@@ -5,12 +5,18 @@ This module provides clean orchestration of state changes with proper
 validation and logging support.
 """
 
+import logging
+import math
+from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence, Union
 
+import numpy as np
 import structlog
 
 if TYPE_CHECKING:
+    from ..data.models import ClosedCandle
     from ..models.metrics import MetricsSnapshot
 from ..errors import (
     StateTransitionError,
@@ -20,12 +26,27 @@ from ..errors import (
     TemporalDataError,
     InsufficientDataError,
 )
-from ..logging.config import get_gating_logger, get_state_logger, log_gate_decision
+from ..logging.config import (
+    get_gating_logger,
+    get_state_logger,
+    is_enabled_for,
+    log_gate_decision,
+)
+from ..utils.time import from_epoch_ns, get_market_time
+from ._gate_kernels import (
+    elapsed_seconds_ns,
+    penetration_passed,
+    price_invalidation_scan,
+    time_confirmation_passed,
+    time_limit_exceeded,
+    volatility_passed,
+)
 from .machine import eval_breakout_tick
 from .models import (
     BreakoutParameters,
     BreakoutSubState,
     InvalidationReason,
+    MarketContext,
     PlanLifecycleState,
     PlanRuntimeState,
     StateTransition,
@@ -35,10 +56,189 @@ logger = structlog.get_logger(__name__)
 gating_logger = get_gating_logger(__name__)
 state_logger = get_state_logger(__name__)
 
+# Lifecycle transitions that are never allowed
+_INVALID_TRANSITIONS = frozenset({
+    # Cannot go from triggered states back to earlier states
+    (PlanLifecycleState.TRIGGERED, PlanLifecycleState.PENDING),
+    (PlanLifecycleState.TRIGGERED, PlanLifecycleState.ARMED),
+    # Cannot go from invalid state to any other state
+    (PlanLifecycleState.INVALID, PlanLifecycleState.PENDING),
+    (PlanLifecycleState.INVALID, PlanLifecycleState.ARMED),
+    (PlanLifecycleState.INVALID, PlanLifecycleState.TRIGGERED),
+})
+
+# Substates allowed for each non-terminal lifecycle state
+_VALID_PENDING_SUB = frozenset({BreakoutSubState.NONE, BreakoutSubState.BREAK_SEEN})
+_VALID_ARMED_SUB = frozenset({BreakoutSubState.BREAK_CONFIRMED, BreakoutSubState.RETEST_ARMED})
+_VALID_SUBSTATES = {
+    PlanLifecycleState.PENDING: _VALID_PENDING_SUB,
+    PlanLifecycleState.ARMED: _VALID_ARMED_SUB,
+}
+
+_VALID_DIRECTIONS = frozenset({'long', 'short'})
+_NUMERIC_TYPES = (int, float)
+_MARKET_CONTEXT_FIELDS = tuple(MarketContext.__dataclass_fields__)
+
+# Price invalidation outcomes, indexed by "is a price_above condition"
+_PRICE_INVALIDATIONS = (
+    (InvalidationReason.PRICE_BELOW, 'price_deficit'),
+    (InvalidationReason.PRICE_ABOVE, 'price_excess'),
+)
+_PRICE_CONDITION_TYPES = frozenset({'price_above', 'price_below'})
+
+
+def _close_beyond_long(close_price: float, entry_price: float) -> bool:
+    """Long close confirmation: close above entry."""
+    return close_price > entry_price
+
+
+def _close_beyond_short(close_price: float, entry_price: float) -> bool:
+    """Short close confirmation: close below entry."""
+    return close_price < entry_price
+
+
+def _stop_hit_long(current_price: float, stop_loss_price: float) -> bool:
+    """Long stop: price at or below stop loss."""
+    return current_price <= stop_loss_price
+
+
+def _stop_hit_short(current_price: float, stop_loss_price: float) -> bool:
+    """Short stop: price at or above stop loss."""
+    return current_price >= stop_loss_price
+
+
+def _fakeout_long(close_price: float, entry_price: float) -> bool:
+    """Long fakeout: close back below entry."""
+    return close_price < entry_price
+
+
+def _fakeout_short(close_price: float, entry_price: float) -> bool:
+    """Short fakeout: close back above entry."""
+    return close_price > entry_price
+
+
+# Direction-dependent checks and log text, indexed by is_short
+_CLOSE_BEYOND = (_close_beyond_long, _close_beyond_short)
+_STOP_HIT = (_stop_hit_long, _stop_hit_short)
+_FAKEOUT = (_fakeout_long, _fakeout_short)
+_DIRECTION_DESC = ("long", "short")
+_BREAK_SIDE_DESC = ("above", "below")
+_STOP_DESC = ("price below stop loss (long position)", "price above stop loss (short position)")
+_FAKEOUT_DESC = ("close below entry (long breakout)", "close above entry (short breakout)")
+
+
+@dataclass(frozen=True)
+class ParsedConditions:
+    """A plan's invalidation conditions split into per-type columns."""
+
+    price_levels: np.ndarray  # float64 levels, in condition order
+    price_above: np.ndarray  # bool, True for price_above, False for price_below
+    price_indices: np.ndarray  # int64 position of each level in the original list
+    min_time_limit: float  # tightest time_limit duration, inf if none
+    time_limit_index: int  # position of that time_limit, -1 if none
+
+
+@dataclass(frozen=True)
+class InvalidationCtx:
+    """Per-tick inputs for InvalidationChecker.evaluate_invalidation."""
+
+    plan_id: str
+    current_price: float
+    current_time: datetime
+    entry_price: float
+    is_short: bool
+    stop_loss: Optional[float] = None
+    last_closed_candle: Optional["ClosedCandle"] = None
+    plan_created_at: Optional[datetime] = None
+    invalidation_conditions: Sequence[dict] = ()
+
+
+def _invalidation_timestamp(market_context: Optional[dict[str, Any]]) -> datetime:
+    """Timestamp for error-path invalidations, preferring market time."""
+    market_ts = market_context.get('timestamp') if market_context else None
+    return get_market_time(market_ts if isinstance(market_ts, datetime) else None)
+
+
+def _as_market_context(market_context: dict[str, Any]) -> MarketContext:
+    """Build the MarketContext eval_breakout_tick reads from a market data dict."""
+    return MarketContext(**{
+        field: market_context[field] for field in _MARKET_CONTEXT_FIELDS if field in market_context
+    })
+
+
+def _require_rvol(metrics: Optional["MetricsSnapshot"]) -> None:
+    if not metrics or metrics.rvol is None:
+        raise InsufficientDataError(
+            "RVOL metrics required but not available",
+            required_count=1,
+            available_count=0
+        )
+
+
+def _require_atr(metrics: Optional["MetricsSnapshot"]) -> None:
+    if not metrics or metrics.atr is None:
+        raise InsufficientDataError(
+            "ATR metrics required but not available",
+            required_count=1,
+            available_count=0
+        )
+
+
+def _check_metric_ranges(metrics: Optional["MetricsSnapshot"]) -> None:
+    if not metrics:
+        return
+
+    if metrics.rvol is not None and (metrics.rvol < 0 or metrics.rvol > 1000):
+        raise MalformedDataError(f"Invalid RVOL value: {metrics.rvol}")
+
+    if metrics.atr is not None and (metrics.atr <= 0 or metrics.atr > 1e6):
+        raise MalformedDataError(f"Invalid ATR value: {metrics.atr}")
+
+    if metrics.natr_pct is not None and (metrics.natr_pct < 0 or metrics.natr_pct > 100):
+        raise MalformedDataError(f"Invalid NATR percentage: {metrics.natr_pct}")
+
+
+@lru_cache(maxsize=256)
+def _build_metrics_validator(
+    cfg: BreakoutParameters
+) -> Callable[[Optional["MetricsSnapshot"]], None]:
+    """Compose a metrics validator from the checks the config enables."""
+    checks = []
+    if cfg.min_rvol > 0:
+        checks.append(_require_rvol)
+    if cfg.min_break_range_atr > 0:
+        checks.append(_require_atr)
+
+    if not checks:
+        return _check_metric_ranges
+
+    checks.append(_check_metric_ranges)
+    checks = tuple(checks)
+
+    def validate(metrics: Optional["MetricsSnapshot"]) -> None:
+        for check in checks:
+            check(metrics)
+
+    return validate
+
+
+def _state_values(runtime_state: Optional[PlanRuntimeState]) -> tuple[Optional[str], Optional[str]]:
+    """Lifecycle and substate values of a runtime state for error logs."""
+    if not runtime_state:
+        return None, None
+    return runtime_state.state.value, runtime_state.substate.value
+
+
+def _gate_log_enabled(gate_logger: Any, passed: bool) -> bool:
+    """Check if a gate decision would be logged (INFO on pass, WARNING on fail)."""
+    return is_enabled_for(gate_logger, logging.INFO if passed else logging.WARNING)
+
 
 class StateTransitionHandler:
     """Handles state transitions for breakout plans with logging and validation."""
 
+    __slots__ = ('logger',)
+
     def __init__(self):
         self.logger = logger
 
@@ -73,55 +273,24 @@ class StateTransitionHandler:
             )
 
         # Validate state consistency
-        self._validate_state_consistency(current_state, transition, plan_id)
-
-    def _validate_state_consistency(
-        self,
-        current_state: PlanRuntimeState,
-        transition: StateTransition,
-        plan_id: str
-    ) -> None:
-        """Validate state transition consistency rules."""
         current_lifecycle = current_state.state
-        current_sub = current_state.substate
         new_lifecycle = transition.new_state
         new_sub = transition.new_substate
 
         # Check for invalid transitions
-        invalid_transitions = [
-            # Cannot go from triggered states back to earlier states
-            (PlanLifecycleState.TRIGGERED, PlanLifecycleState.PENDING),
-            (PlanLifecycleState.TRIGGERED, PlanLifecycleState.ARMED),
-            # Cannot go from invalid state to any other state
-            (PlanLifecycleState.INVALID, PlanLifecycleState.PENDING),
-            (PlanLifecycleState.INVALID, PlanLifecycleState.ARMED),
-            (PlanLifecycleState.INVALID, PlanLifecycleState.TRIGGERED),
-        ]
-
-        for invalid_from, invalid_to in invalid_transitions:
-            if current_lifecycle == invalid_from and new_lifecycle == invalid_to:
-                raise StateTransitionError(
-                    f"Invalid state transition from {invalid_from.value} to {invalid_to.value}",
-                    current_state=current_lifecycle.value,
-                    attempted_transition=new_lifecycle.value
-                )
-
-        # Validate substate consistency
-        if new_lifecycle == PlanLifecycleState.PENDING and new_sub not in [
-            BreakoutSubState.NONE, BreakoutSubState.BREAK_SEEN
-        ]:
+        if (current_lifecycle, new_lifecycle) in _INVALID_TRANSITIONS:
             raise StateTransitionError(
-                f"Invalid substate {new_sub.value} for PENDING state",
-                current_state=f"{current_lifecycle.value}:{current_sub.value}",
-                attempted_transition=f"{new_lifecycle.value}:{new_sub.value}"
+                f"Invalid state transition from {current_lifecycle.value} to {new_lifecycle.value}",
+                current_state=current_lifecycle.value,
+                attempted_transition=new_lifecycle.value
             )
 
-        if new_lifecycle == PlanLifecycleState.ARMED and new_sub not in [
-            BreakoutSubState.BREAK_CONFIRMED, BreakoutSubState.RETEST_ARMED
-        ]:
+        # Validate substate consistency
+        allowed_subs = _VALID_SUBSTATES.get(new_lifecycle)
+        if allowed_subs is not None and new_sub not in allowed_subs:
             raise StateTransitionError(
-                f"Invalid substate {new_sub.value} for ARMED state",
-                current_state=f"{current_lifecycle.value}:{current_sub.value}",
+                f"Invalid substate {new_sub.value} for {new_lifecycle.name} state",
+                current_state=f"{current_lifecycle.value}:{current_state.substate.value}",
                 attempted_transition=f"{new_lifecycle.value}:{new_sub.value}"
             )
 
@@ -136,39 +305,45 @@ class StateTransitionHandler:
         if not market_context:
             raise MissingDataError("Market context is required", data_type="market_context")
 
-        required_market_fields = ['last_price', 'timestamp']
-        for field in required_market_fields:
-            if field not in market_context or market_context[field] is None:
-                raise MissingDataError(
-                    f"Market context missing required field: {field}",
-                    data_type="market_context"
-                )
+        try:
+            last_price, timestamp = market_context['last_price'], market_context['timestamp']
+        except KeyError as e:
+            raise MissingDataError(
+                f"Market context missing required field: {e.args[0]}",
+                data_type="market_context"
+            ) from None
+        if last_price is None or timestamp is None:
+            field = 'last_price' if last_price is None else 'timestamp'
+            raise MissingDataError(
+                f"Market context missing required field: {field}",
+                data_type="market_context"
+            )
 
         # Validate plan data
         if not plan_data:
             raise MissingDataError("Plan data is required", data_type="plan_data")
 
-        required_plan_fields = ['id', 'entry_price', 'direction']
-        for field in required_plan_fields:
-            if field not in plan_data or plan_data[field] is None:
-                raise MissingDataError(
-                    f"Plan data missing required field: {field}",
-                    data_type="plan_data"
-                )
-
-        # Validate price data
-        last_price = market_context.get('last_price')
-        entry_price = plan_data.get('entry_price')
-        
-        if not isinstance(last_price, (int, float)) or last_price <= 0:
+        try:
+            plan_id_value, entry_price, direction = (
+                plan_data['id'], plan_data['entry_price'], plan_data['direction']
+            )
+        except KeyError as e:
+            raise MissingDataError(
+                f"Plan data missing required field: {e.args[0]}", data_type="plan_data"
+            ) from None
+        if plan_id_value is None or entry_price is None or direction is None:
+            field = 'id' if plan_id_value is None else 'entry_price' if entry_price is None else 'direction'
+            raise MissingDataError(f"Plan data missing required field: {field}", data_type="plan_data")
+
+        # Validate price data (prices normally arrive as float, so check that first)
+        if (type(last_price) is not float and not isinstance(last_price, _NUMERIC_TYPES)) or last_price <= 0:
             raise MalformedDataError(f"Invalid last_price: {last_price}")
-        
-        if not isinstance(entry_price, (int, float)) or entry_price <= 0:
+
+        if (type(entry_price) is not float and not isinstance(entry_price, _NUMERIC_TYPES)) or entry_price <= 0:
             raise MalformedDataError(f"Invalid entry_price: {entry_price}")
 
         # Validate direction
-        direction = plan_data.get('direction')
-        if direction not in ['long', 'short']:
+        if direction not in _VALID_DIRECTIONS:
             raise MalformedDataError(f"Invalid direction: {direction}. Must be 'long' or 'short'")
 
     def _validate_metrics_data(
@@ -178,31 +353,25 @@ class StateTransitionHandler:
         plan_id: str
     ) -> None:
         """Validate metrics data for state evaluation."""
-        # Check if metrics are required but missing
-        if cfg.min_rvol > 0 and (not metrics or metrics.rvol is None):
-            raise InsufficientDataError(
-                "RVOL metrics required but not available",
-                required_count=1,
-                available_count=0
-            )
+        self.build_specialized_validator(cfg)(metrics)
 
-        if cfg.min_break_range_atr > 0 and (not metrics or metrics.atr is None):
-            raise InsufficientDataError(
-                "ATR metrics required but not available",
-                required_count=1,
-                available_count=0
-            )
+    def build_specialized_validator(
+        self,
+        cfg: BreakoutParameters
+    ) -> Callable[[Optional["MetricsSnapshot"]], None]:
+        """
+        Build a metrics validator containing only the checks enabled by cfg.
+
+        Validators are cached per configuration value, so repeated ticks with
+        the same breakout parameters reuse the same closure.
 
-        # Validate metrics values if present
-        if metrics:
-            if metrics.rvol is not None and (metrics.rvol < 0 or metrics.rvol > 1000):
-                raise MalformedDataError(f"Invalid RVOL value: {metrics.rvol}")
-            
-            if metrics.atr is not None and (metrics.atr <= 0 or metrics.atr > 1e6):
-                raise MalformedDataError(f"Invalid ATR value: {metrics.atr}")
+        Args:
+            cfg: Breakout configuration parameters
 
-            if metrics.natr_pct is not None and (metrics.natr_pct < 0 or metrics.natr_pct > 100):
-                raise MalformedDataError(f"Invalid NATR percentage: {metrics.natr_pct}")
+        Returns:
+            Callable raising on missing or malformed metrics
+        """
+        return _build_metrics_validator(cfg)
 
     def _validate_breakout_config(
         self,
@@ -253,6 +422,8 @@ class StateTransitionHandler:
             # Validate the transition
             self._validate_state_transition(current_state, transition, plan_id)
 
+            invalid_reason = transition.invalid_reason
+
             self.logger.info(
                 "Applying state transition",
                 plan_id=plan_id,
@@ -262,59 +433,26 @@ class StateTransitionHandler:
                 new_substate=transition.new_substate.value,
                 timestamp=transition.timestamp,
                 should_emit_signal=transition.should_emit_signal,
-                invalid_reason=transition.invalid_reason.value if transition.invalid_reason else None
-            )
-
-            # Create new state based on transition
-            new_state = current_state.with_state(
-                new_state=transition.new_state,
-                substate=transition.new_substate,
-                timestamp=transition.timestamp,
-                invalid_reason=transition.invalid_reason
+                invalid_reason=invalid_reason.value if invalid_reason else None
             )
 
-            # Handle specific transition logic
-            if transition.new_state == PlanLifecycleState.PENDING and transition.new_substate == BreakoutSubState.BREAK_SEEN:
-                new_state = new_state.with_break_seen(transition.timestamp)
-
-            elif transition.new_state == PlanLifecycleState.ARMED and transition.new_substate == BreakoutSubState.BREAK_CONFIRMED:
-                new_state = new_state.with_break_confirmed(transition.timestamp)
-
-            elif transition.new_state == PlanLifecycleState.ARMED and transition.new_substate == BreakoutSubState.RETEST_ARMED:
-                new_state = new_state.with_break_confirmed(transition.timestamp)
-
-            # Mark signal emission if required
-            if transition.should_emit_signal:
-                new_state = new_state.with_signal_emitted()
-
-            return new_state
+            # Create new state based on transition in a single allocation
+            return current_state.with_transition_applied(transition)
 
         except (StateTransitionError, TemporalDataError) as e:
             # Log the error with context and re-raise
+            state_v, substate_v = _state_values(current_state)
             self.logger.error(
                 "State transition validation failed",
                 plan_id=plan_id,
-                current_state=current_state.state.value if current_state else None,
-                current_substate=current_state.substate.value if current_state else None,
-                attempted_transition=f"{transition.new_state.value}:{transition.new_substate.value}" if transition else None,
+                current_state=state_v,
+                current_substate=substate_v,
+                new_state=transition.new_state.value if transition else None,
+                new_substate=transition.new_substate.value if transition else None,
                 error=str(e),
                 error_type=type(e).__name__
             )
             raise
-        except Exception as e:
-            # Wrap unexpected errors in StateTransitionError
-            self.logger.error(
-                "Unexpected error during state transition",
-                plan_id=plan_id,
-                current_state=current_state.state.value if current_state else None,
-                error=str(e),
-                error_type=type(e).__name__
-            )
-            raise StateTransitionError(
-                f"Unexpected error during state transition: {e}",
-                current_state=current_state.state.value if current_state else None,
-                attempted_transition=f"{transition.new_state.value}:{transition.new_substate.value}" if transition else None
-            )
 
     def evaluate_and_transition(
         self,
@@ -343,7 +481,7 @@ class StateTransitionHandler:
             # Validate all input data
             self._validate_context_data(market_context, plan_data, plan_id)
             self._validate_breakout_config(cfg, plan_id)
-            self._validate_metrics_data(metrics, cfg, plan_id)
+            self.build_specialized_validator(cfg)(metrics)
 
             # Validate current state
             if not current_state:
@@ -352,85 +490,92 @@ class StateTransitionHandler:
                     current_state=None,
                     attempted_transition="evaluation"
                 )
+        except (StateTransitionError, MissingDataError, MalformedDataError, InsufficientDataError) as e:
+            # Log structured errors with full context
+            if is_enabled_for(self.logger, logging.ERROR):
+                state_v, substate_v = _state_values(current_state)
+                self.logger.error(
+                    "Data validation error during breakout evaluation",
+                    plan_id=plan_id,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    current_state=state_v,
+                    current_substate=substate_v,
+                    market_context_keys=list(market_context) if market_context else None,
+                    has_metrics=metrics is not None
+                )
+            # Return invalidation on validation errors
+            return StateTransition(
+                new_state=PlanLifecycleState.INVALID,
+                new_substate=BreakoutSubState.NONE,
+                timestamp=_invalidation_timestamp(market_context),
+                should_emit_signal=True,
+                invalid_reason=InvalidationReason.TIME_LIMIT  # Generic error reason
+            )
 
+        try:
             # Use the core evaluation logic
             transition = eval_breakout_tick(
                 plan_rt=current_state,
-                market=market_context,
+                market=_as_market_context(market_context),
                 cfg=cfg,
                 plan_data=plan_data,
                 metrics=metrics
             )
-
-            if transition:
-                self.logger.debug(
-                    "State transition required",
+        except Exception as e:
+            # Log unexpected errors with comprehensive context; inputs have
+            # already passed validation here, so context, cfg and plan are set
+            if is_enabled_for(self.logger, logging.ERROR):
+                self.logger.error(
+                    "Unexpected error during breakout evaluation",
                     plan_id=plan_id,
-                    transition_type=f"{current_state.state.value}->{transition.new_state.value}",
-                    substate=transition.new_substate.value,
-                    should_emit_signal=transition.should_emit_signal
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    current_state=current_state.state.value,
+                    current_substate=current_state.substate.value,
+                    market_context_summary={
+                        "last_price": market_context.get('last_price'),
+                        "timestamp": str(market_context.get('timestamp')),
+                        "atr": market_context.get('atr'),
+                        "rvol": market_context.get('rvol')
+                    },
+                    config_summary={
+                        "penetration_pct": cfg.penetration_pct,
+                        "min_rvol": cfg.min_rvol,
+                        "confirm_close": cfg.confirm_close
+                    },
+                    plan_summary={
+                        "entry_price": plan_data.get('entry_price'),
+                        "direction": plan_data.get('direction')
+                    }
                 )
-
-            return transition
-
-        except (StateTransitionError, MissingDataError, MalformedDataError, InsufficientDataError) as e:
-            # Log structured errors with full context
-            self.logger.error(
-                "Data validation error during breakout evaluation",
-                plan_id=plan_id,
-                error=str(e),
-                error_type=type(e).__name__,
-                current_state=current_state.state.value if current_state else None,
-                current_substate=current_state.substate.value if current_state else None,
-                market_context_keys=list(market_context.keys()) if market_context else None,
-                has_metrics=metrics is not None
-            )
-            # Return invalidation on validation errors
+            # Return invalidation on unexpected errors
             return StateTransition(
                 new_state=PlanLifecycleState.INVALID,
                 new_substate=BreakoutSubState.NONE,
-                timestamp=datetime.utcnow(),
+                timestamp=_invalidation_timestamp(market_context),
                 should_emit_signal=True,
                 invalid_reason=InvalidationReason.TIME_LIMIT  # Generic error reason
             )
-        except Exception as e:
-            # Log unexpected errors with comprehensive context
-            self.logger.error(
-                "Unexpected error during breakout evaluation",
+
+        if transition:
+            self.logger.debug(
+                "State transition required",
                 plan_id=plan_id,
-                error=str(e),
-                error_type=type(e).__name__,
-                current_state=current_state.state.value if current_state else None,
-                current_substate=current_state.substate.value if current_state else None,
-                market_context_summary={
-                    "last_price": market_context.get('last_price') if market_context else None,
-                    "timestamp": str(market_context.get('timestamp')) if market_context else None,
-                    "atr": market_context.get('atr') if market_context else None,
-                    "rvol": market_context.get('rvol') if market_context else None
-                },
-                config_summary={
-                    "penetration_pct": cfg.penetration_pct if cfg else None,
-                    "min_rvol": cfg.min_rvol if cfg else None,
-                    "confirm_close": cfg.confirm_close if cfg else None
-                } if cfg else None,
-                plan_summary={
-                    "entry_price": plan_data.get('entry_price') if plan_data else None,
-                    "direction": plan_data.get('direction') if plan_data else None
-                } if plan_data else None
-            )
-            # Return invalidation on unexpected errors
-            return StateTransition(
-                new_state=PlanLifecycleState.INVALID,
-                new_substate=BreakoutSubState.NONE,
-                timestamp=datetime.utcnow(),
-                should_emit_signal=True,
-                invalid_reason=InvalidationReason.TIME_LIMIT  # Generic error reason
+                from_state=current_state.state.value,
+                to_state=transition.new_state.value,
+                substate=transition.new_substate.value,
+                should_emit_signal=transition.should_emit_signal
             )
 
+        return transition
+
 
 class BreakoutGateValidator:
     """Validates specific breakout gating conditions with detailed logging."""
 
+    __slots__ = ('logger', 'gating_logger')
+
     def __init__(self):
         self.logger = logger
         self.gating_logger = gating_logger
@@ -443,15 +588,7 @@ class BreakoutGateValidator:
     ) -> bool:
         """Validate RVOL gate with logging."""
         if min_rvol <= 0:
-            log_gate_decision(
-                self.gating_logger,
-                gate_name="rvol",
-                passed=True,
-                plan_id=plan_id,
-                reason="Gate disabled (min_rvol <= 0)",
-                context={"min_rvol": min_rvol}
-            )
-            return True  # Gate disabled
+            return True  # Gate disabled: no-op decision, not logged per tick
 
         if rvol is None:
             log_gate_decision(
@@ -466,19 +603,20 @@ class BreakoutGateValidator:
 
         passed = rvol >= min_rvol
 
-        log_gate_decision(
-            self.gating_logger,
-            gate_name="rvol",
-            passed=passed,
-            plan_id=plan_id,
-            reason=f"RVOL {rvol:.2f} {'≥' if passed else '<'} threshold {min_rvol}",
-            context={
-                "rvol": rvol,
-                "min_rvol": min_rvol,
-                "difference": rvol - min_rvol,
-                "multiplier": rvol / min_rvol if min_rvol > 0 else None
-            }
-        )
+        if _gate_log_enabled(self.gating_logger, passed):
+            log_gate_decision(
+                self.gating_logger,
+                gate_name="rvol",
+                passed=passed,
+                plan_id=plan_id,
+                reason=f"RVOL {rvol:.2f} {'≥' if passed else '<'} threshold {min_rvol}",
+                context={
+                    "rvol": rvol,
+                    "min_rvol": min_rvol,
+                    "difference": rvol - min_rvol,
+                    "multiplier": rvol / min_rvol if min_rvol > 0 else None
+                }
+            )
 
         return passed
 
@@ -491,15 +629,7 @@ class BreakoutGateValidator:
     ) -> bool:
         """Validate volatility gate with logging."""
         if min_break_range_atr <= 0:
-            log_gate_decision(
-                self.gating_logger,
-                gate_name="volatility",
-                passed=True,
-                plan_id=plan_id,
-                reason="Gate disabled (min_break_range_atr <= 0)",
-                context={"min_break_range_atr": min_break_range_atr}
-            )
-            return True  # Gate disabled
+            return True  # Gate disabled: no-op decision, not logged per tick
 
         if bar_range is None or atr is None:
             log_gate_decision(
@@ -516,23 +646,24 @@ class BreakoutGateValidator:
             )
             return False
 
-        min_range = min_break_range_atr * atr
-        passed = bar_range >= min_range
+        passed = volatility_passed(bar_range, atr, min_break_range_atr)
 
-        log_gate_decision(
-            self.gating_logger,
-            gate_name="volatility",
-            passed=passed,
-            plan_id=plan_id,
-            reason=f"Bar range {bar_range:.6f} {'≥' if passed else '<'} min range {min_range:.6f} ({min_break_range_atr}x ATR)",
-            context={
-                "bar_range": bar_range,
-                "atr": atr,
-                "min_range": min_range,
-                "min_break_range_atr": min_break_range_atr,
-                "range_ratio": bar_range / min_range if min_range > 0 else None
-            }
-        )
+        if _gate_log_enabled(self.gating_logger, passed):
+            min_range = min_break_range_atr * atr
+            log_gate_decision(
+                self.gating_logger,
+                gate_name="volatility",
+                passed=passed,
+                plan_id=plan_id,
+                reason=f"Bar range {bar_range:.6f} {'≥' if passed else '<'} min range {min_range:.6f} ({min_break_range_atr}x ATR)",
+                context={
+                    "bar_range": bar_range,
+                    "atr": atr,
+                    "min_range": min_range,
+                    "min_break_range_atr": min_break_range_atr,
+                    "range_ratio": bar_range / min_range if min_range > 0 else None
+                }
+            )
 
         return passed
 
@@ -597,17 +728,13 @@ class BreakoutGateValidator:
         plan_id: str
     ) -> bool:
         """Validate price penetration gate with logging."""
-        if is_short:
-            # Short: price must be below entry by penetration distance
-            target_price = entry_price - penetration_distance
-            passed = current_price <= target_price
-            direction_desc = "below"
-        else:
-            # Long: price must be above entry by penetration distance
-            target_price = entry_price + penetration_distance
-            passed = current_price >= target_price
-            direction_desc = "above"
+        passed = penetration_passed(current_price, entry_price, penetration_distance, is_short)
+
+        if not _gate_log_enabled(self.gating_logger, passed):
+            return passed
 
+        # Short: price must be below entry; long: above entry
+        target_price = entry_price - penetration_distance if is_short else entry_price + penetration_distance
         actual_penetration = abs(current_price - entry_price)
 
         log_gate_decision(
@@ -615,7 +742,7 @@ class BreakoutGateValidator:
             gate_name="penetration",
             passed=passed,
             plan_id=plan_id,
-            reason=f"Price {current_price} must be {direction_desc} {target_price} (penetration {actual_penetration:.6f} {'≥' if passed else '<'} {penetration_distance:.6f})",
+            reason=f"Price {current_price} must be {_BREAK_SIDE_DESC[is_short]} {target_price} (penetration {actual_penetration:.6f} {'≥' if passed else '<'} {penetration_distance:.6f})",
             context={
                 "current_price": current_price,
                 "entry_price": entry_price,
@@ -631,40 +758,50 @@ class BreakoutGateValidator:
 
     def validate_time_confirmation_gate(
         self,
-        break_seen_time: datetime,
-        current_time: datetime,
+        break_seen_time: Union[datetime, int],
+        current_time: Union[datetime, int],
         confirm_seconds: float,
         plan_id: str
     ) -> bool:
-        """Validate time-based confirmation gate with logging."""
+        """
+        Validate time-based confirmation gate with logging.
+
+        Timestamps may be datetimes or integer epoch nanoseconds; when both
+        are ints the elapsed time is computed with integer arithmetic, and a
+        mixed pair is compared as datetimes.
+        """
         if confirm_seconds <= 0:
+            return True  # Gate disabled: no-op decision, not logged per tick
+
+        if type(break_seen_time) is int and type(current_time) is int:
+            elapsed_seconds = elapsed_seconds_ns(current_time, break_seen_time)
+        else:
+            if type(break_seen_time) is int:
+                break_seen_time = from_epoch_ns(break_seen_time)
+            if type(current_time) is int:
+                current_time = from_epoch_ns(current_time)
+            elapsed_seconds = current_time.timestamp() - break_seen_time.timestamp()
+        passed = time_confirmation_passed(elapsed_seconds, confirm_seconds)
+
+        if _gate_log_enabled(self.gating_logger, passed):
+            if type(break_seen_time) is int:
+                break_seen_time = from_epoch_ns(break_seen_time)
+            if type(current_time) is int:
+                current_time = from_epoch_ns(current_time)
             log_gate_decision(
                 self.gating_logger,
                 gate_name="time_confirmation",
-                passed=True,
+                passed=passed,
                 plan_id=plan_id,
-                reason="Gate disabled (confirm_seconds <= 0)",
-                context={"confirm_seconds": confirm_seconds}
+                reason=f"Elapsed time {elapsed_seconds:.1f}s {'≥' if passed else '<'} confirmation time {confirm_seconds}s",
+                context={
+                    "break_seen_time": break_seen_time.isoformat(),
+                    "current_time": current_time.isoformat(),
+                    "elapsed_seconds": elapsed_seconds,
+                    "confirm_seconds": confirm_seconds,
+                    "completion_ratio": elapsed_seconds / confirm_seconds
+                }
             )
-            return True  # Gate disabled
-
-        elapsed_seconds = (current_time - break_seen_time).total_seconds()
-        passed = elapsed_seconds >= confirm_seconds
-
-        log_gate_decision(
-            self.gating_logger,
-            gate_name="time_confirmation",
-            passed=passed,
-            plan_id=plan_id,
-            reason=f"Elapsed time {elapsed_seconds:.1f}s {'≥' if passed else '<'} confirmation time {confirm_seconds}s",
-            context={
-                "break_seen_time": break_seen_time.isoformat(),
-                "current_time": current_time.isoformat(),
-                "elapsed_seconds": elapsed_seconds,
-                "confirm_seconds": confirm_seconds,
-                "completion_ratio": elapsed_seconds / confirm_seconds if confirm_seconds > 0 else None
-            }
-        )
 
         return passed
 
@@ -693,21 +830,17 @@ class BreakoutGateValidator:
             )
             return False
 
-        if is_short:
-            # Short: close must be below entry
-            passed = candle_close < entry_price
-            direction_desc = "below"
-        else:
-            # Long: close must be above entry
-            passed = candle_close > entry_price
-            direction_desc = "above"
+        passed = _CLOSE_BEYOND[is_short](candle_close, entry_price)
+
+        if not _gate_log_enabled(self.gating_logger, passed):
+            return passed
 
         log_gate_decision(
             self.gating_logger,
             gate_name="close_confirmation",
             passed=passed,
             plan_id=plan_id,
-            reason=f"Candle close {candle_close} must be {direction_desc} entry {entry_price}",
+            reason=f"Candle close {candle_close} must be {_BREAK_SIDE_DESC[is_short]} entry {entry_price}",
             context={
                 "candle_close": candle_close,
                 "entry_price": entry_price,
@@ -724,9 +857,62 @@ class BreakoutGateValidator:
 class InvalidationChecker:
     """Checks invalidation conditions with detailed logging."""
 
+    __slots__ = ('logger', 'gating_logger', '_parsed')
+
     def __init__(self):
         self.logger = logger
         self.gating_logger = gating_logger
+        # plan_id -> (snapshot of the conditions the entry was parsed from, parsed conditions)
+        self._parsed: dict[str, tuple[tuple, ParsedConditions]] = {}
+
+    def clear_plan_cache(self, plan_id: str) -> None:
+        """Drop preparsed invalidation data for a plan."""
+        self._parsed.pop(plan_id, None)
+
+    def preparse_conditions(self, plan_id: str, invalidation_conditions: list) -> ParsedConditions:
+        """
+        Split a plan's invalidation conditions into per-type columns.
+
+        Parsed columns are cached per plan against a snapshot of the
+        conditions' contents, so a list that is replaced or edited in place
+        is parsed again. Non-dict entries, unknown condition types and price
+        conditions without a level are dropped.
+        """
+        snapshot = tuple(
+            tuple(condition.items()) if isinstance(condition, dict) else condition
+            for condition in invalidation_conditions
+        )
+        cached = self._parsed.get(plan_id)
+        if cached is not None and cached[0] == snapshot:
+            return cached[1]
+
+        levels, above, indices = [], [], []
+        min_duration, min_index = math.inf, -1
+        for i, condition in enumerate(invalidation_conditions):
+            if not isinstance(condition, dict):
+                continue
+
+            condition_type = condition.get('condition_type')
+            if condition_type in _PRICE_CONDITION_TYPES:
+                level = condition.get('level')
+                if level:
+                    levels.append(level)
+                    above.append(condition_type == 'price_above')
+                    indices.append(i)
+            elif condition_type == 'time_limit':
+                duration_seconds = condition.get('duration_seconds', 0)
+                if duration_seconds < min_duration:
+                    min_duration, min_index = duration_seconds, i
+
+        parsed = ParsedConditions(
+            price_levels=np.array(levels, dtype=np.float64),
+            price_above=np.array(above, dtype=np.bool_),
+            price_indices=np.array(indices, dtype=np.int64),
+            min_time_limit=min_duration,
+            time_limit_index=min_index
+        )
+        self._parsed[plan_id] = (snapshot, parsed)
+        return parsed
 
     def check_price_invalidation(
         self,
@@ -735,143 +921,120 @@ class InvalidationChecker:
         plan_id: str
     ) -> Optional[InvalidationReason]:
         """Check price-based invalidation conditions."""
-        for i, condition in enumerate(invalidation_conditions):
-            if isinstance(condition, dict):
-                condition_type = condition.get('condition_type')
-                level = condition.get('level')
+        parsed = self.preparse_conditions(plan_id, invalidation_conditions)
+        hit = price_invalidation_scan(float(current_price), parsed.price_levels, parsed.price_above)
 
-                if condition_type == 'price_above' and level:
-                    if current_price > level:
-                        self.gating_logger.warning(
-                            "Price invalidation triggered",
-                            plan_id=plan_id,
-                            invalidation_type="price_above",
-                            current_price=current_price,
-                            limit_level=level,
-                            price_excess=current_price - level,
-                            condition_index=i,
-                            event="invalidation_triggered"
-                        )
-                        return InvalidationReason.PRICE_ABOVE
-                    else:
-                        self.gating_logger.bind(
-                            plan_id=plan_id,
-                            invalidation_type="price_above",
-                            current_price=current_price,
-                            limit_level=level,
-                            price_margin=level - current_price,
-                            condition_index=i,
-                            event="invalidation_check"
-                        ).debug("Price invalidation check passed")
-
-                elif condition_type == 'price_below' and level:
-                    if current_price < level:
-                        self.gating_logger.warning(
-                            "Price invalidation triggered",
-                            plan_id=plan_id,
-                            invalidation_type="price_below",
-                            current_price=current_price,
-                            limit_level=level,
-                            price_deficit=level - current_price,
-                            condition_index=i,
-                            event="invalidation_triggered"
-                        )
-                        return InvalidationReason.PRICE_BELOW
-                    else:
-                        self.gating_logger.debug(
-                            "Price invalidation check passed",
-                            plan_id=plan_id,
-                            invalidation_type="price_below",
-                            current_price=current_price,
-                            limit_level=level,
-                            price_margin=current_price - level,
-                            condition_index=i,
-                            event="invalidation_check"
-                        )
+        if hit >= 0:
+            level = float(parsed.price_levels[hit])
+            reason, excess_field = _PRICE_INVALIDATIONS[bool(parsed.price_above[hit])]
+            self.gating_logger.warning(
+                "Price invalidation triggered",
+                plan_id=plan_id,
+                invalidation_type=reason.value,
+                current_price=current_price,
+                limit_level=level,
+                condition_index=int(parsed.price_indices[hit]),
+                check_event="invalidation_triggered",
+                **{excess_field: abs(current_price - level)}
+            )
+            return reason
+
+        if is_enabled_for(self.gating_logger, logging.DEBUG):
+            # Fields shared by every level's record are bound once per call
+            template = {"plan_id": plan_id, "current_price": current_price, "check_event": "invalidation_check"}
+            for level, is_above, i in zip(
+                parsed.price_levels.tolist(), parsed.price_above.tolist(), parsed.price_indices.tolist()
+            ):
+                fields = template.copy()
+                fields["invalidation_type"] = _PRICE_INVALIDATIONS[is_above][0].value
+                fields["limit_level"] = level
+                fields["price_margin"] = abs(current_price - level)
+                fields["condition_index"] = i
+                self.gating_logger.debug("Price invalidation check passed", **fields)
 
         return None
 
     def check_time_invalidation(
         self,
-        current_time: datetime,
-        plan_created_at: datetime,
+        current_time: Union[datetime, int],
+        plan_created_at: Union[datetime, int],
         invalidation_conditions: list,
         plan_id: str
     ) -> bool:
-        """Check time-based invalidation conditions."""
-        for i, condition in enumerate(invalidation_conditions):
-            if isinstance(condition, dict):
-                if condition.get('condition_type') == 'time_limit':
-                    duration_seconds = condition.get('duration_seconds', 0)
-                    elapsed = (current_time - plan_created_at).total_seconds()
-
-                    if elapsed > duration_seconds:
-                        self.gating_logger.warning(
-                            "Time invalidation triggered",
-                            plan_id=plan_id,
-                            invalidation_type="time_limit",
-                            elapsed_seconds=elapsed,
-                            limit_seconds=duration_seconds,
-                            time_excess=elapsed - duration_seconds,
-                            condition_index=i,
-                            plan_created_at=plan_created_at.isoformat(),
-                            current_time=current_time.isoformat(),
-                            event="invalidation_triggered"
-                        )
-                        return True
-                    else:
-                        self.gating_logger.debug(
-                            "Time invalidation check passed",
-                            plan_id=plan_id,
-                            invalidation_type="time_limit",
-                            elapsed_seconds=elapsed,
-                            limit_seconds=duration_seconds,
-                            time_remaining=duration_seconds - elapsed,
-                            condition_index=i,
-                            completion_ratio=elapsed / duration_seconds if duration_seconds > 0 else 0,
-                            event="invalidation_check"
-                        )
+        """
+        Check time-based invalidation conditions.
+
+        Timestamps may be datetimes or integer epoch nanoseconds; when both
+        are ints the elapsed time is computed with integer arithmetic, and a
+        mixed pair is compared as datetimes.
+        """
+        parsed = self.preparse_conditions(plan_id, invalidation_conditions)
+        duration_seconds, i = parsed.min_time_limit, parsed.time_limit_index
+        if i < 0:
+            return False
+
+        if type(current_time) is int and type(plan_created_at) is int:
+            elapsed = elapsed_seconds_ns(current_time, plan_created_at)
+        else:
+            if type(plan_created_at) is int:
+                plan_created_at = from_epoch_ns(plan_created_at)
+            if type(current_time) is int:
+                current_time = from_epoch_ns(current_time)
+            elapsed = current_time.timestamp() - plan_created_at.timestamp()
+        if time_limit_exceeded(elapsed, duration_seconds):
+            if type(plan_created_at) is int:
+                plan_created_at = from_epoch_ns(plan_created_at)
+            if type(current_time) is int:
+                current_time = from_epoch_ns(current_time)
+            self.gating_logger.warning(
+                "Time invalidation triggered",
+                plan_id=plan_id,
+                invalidation_type="time_limit",
+                elapsed_seconds=elapsed,
+                limit_seconds=duration_seconds,
+                time_excess=elapsed - duration_seconds,
+                condition_index=i,
+                plan_created_at=plan_created_at.isoformat(),
+                current_time=current_time.isoformat(),
+                check_event="invalidation_triggered"
+            )
+            return True
+
+        if is_enabled_for(self.gating_logger, logging.DEBUG):
+            self.gating_logger.debug(
+                "Time invalidation check passed",
+                plan_id=plan_id,
+                invalidation_type="time_limit",
+                elapsed_seconds=elapsed,
+                limit_seconds=duration_seconds,
+                time_remaining=duration_seconds - elapsed,
+                condition_index=i,
+                completion_ratio=elapsed / duration_seconds if duration_seconds > 0 else 0,
+                check_event="invalidation_check"
+            )
 
         return False
 
     def check_fakeout_invalidation(
         self,
-        last_closed_candle: Any,
+        last_closed_candle: Optional["ClosedCandle"],
         entry_price: float,
         is_short: bool,
         plan_id: str
     ) -> bool:
         """Check fakeout close invalidation."""
-        if not last_closed_candle or not hasattr(last_closed_candle, 'close'):
-            self.gating_logger.debug(
-                "Fakeout invalidation check skipped - no closed candle data",
-                plan_id=plan_id,
-                has_candle=last_closed_candle is not None,
-                has_close_attr=hasattr(last_closed_candle, 'close') if last_closed_candle else False,
-                event="invalidation_check"
-            )
-            return False
-
-        if not last_closed_candle.is_closed:
-            self.gating_logger.debug(
-                "Fakeout invalidation check skipped - candle not closed",
-                plan_id=plan_id,
-                is_closed=last_closed_candle.is_closed,
-                event="invalidation_check"
-            )
+        if last_closed_candle is None or not getattr(last_closed_candle, 'is_closed', False):
+            if is_enabled_for(self.gating_logger, logging.DEBUG):
+                self.gating_logger.debug(
+                    "Fakeout invalidation check skipped - no closed candle data",
+                    plan_id=plan_id,
+                    has_candle=last_closed_candle is not None,
+                    check_event="invalidation_check"
+                )
             return False
 
-        is_fakeout = False
-        direction_desc = "short" if is_short else "long"
-
-        if is_short:
-            # Short breakout fakeout: close back above entry
-            is_fakeout = last_closed_candle.close > entry_price
-            fakeout_desc = "close above entry (short breakout)"
-        else:
-            # Long breakout fakeout: close back below entry
-            is_fakeout = last_closed_candle.close < entry_price
-            fakeout_desc = "close below entry (long breakout)"
+        close_price = last_closed_candle.close
+        is_fakeout = _FAKEOUT[is_short](close_price, entry_price)
 
         if is_fakeout:
             self.gating_logger.warning(
@@ -879,24 +1042,24 @@ class InvalidationChecker:
                 plan_id=plan_id,
                 invalidation_type="fakeout_close",
                 entry_price=entry_price,
-                close_price=last_closed_candle.close,
-                direction=direction_desc,
-                fakeout_distance=abs(last_closed_candle.close - entry_price),
-                fakeout_description=fakeout_desc,
-                candle_timestamp=last_closed_candle.ts.isoformat() if hasattr(last_closed_candle, 'ts') else None,
-                event="invalidation_triggered"
+                close_price=close_price,
+                direction=_DIRECTION_DESC[is_short],
+                fakeout_distance=abs(close_price - entry_price),
+                fakeout_description=_FAKEOUT_DESC[is_short],
+                candle_timestamp=last_closed_candle.ts.isoformat(),
+                check_event="invalidation_triggered"
             )
-        else:
+        elif is_enabled_for(self.gating_logger, logging.DEBUG):
             self.gating_logger.debug(
                 "Fakeout invalidation check passed",
                 plan_id=plan_id,
                 invalidation_type="fakeout_close",
                 entry_price=entry_price,
-                close_price=last_closed_candle.close,
-                direction=direction_desc,
-                close_distance_from_entry=abs(last_closed_candle.close - entry_price),
+                close_price=close_price,
+                direction=_DIRECTION_DESC[is_short],
+                close_distance_from_entry=abs(close_price - entry_price),
                 close_beyond_entry=True,
-                event="invalidation_check"
+                check_event="invalidation_check"
             )
 
         return is_fakeout
@@ -910,24 +1073,15 @@ class InvalidationChecker:
     ) -> bool:
         """Check stop loss invalidation with detailed logging."""
         if not stop_loss_price:
-            self.gating_logger.debug(
-                "Stop loss invalidation check skipped - no stop loss set",
-                plan_id=plan_id,
-                event="invalidation_check"
-            )
+            if is_enabled_for(self.gating_logger, logging.DEBUG):
+                self.gating_logger.debug(
+                    "Stop loss invalidation check skipped - no stop loss set",
+                    plan_id=plan_id,
+                    check_event="invalidation_check"
+                )
             return False
 
-        is_stopped = False
-        direction_desc = "short" if is_short else "long"
-
-        if is_short:
-            # Short position stop: price above stop loss
-            is_stopped = current_price >= stop_loss_price
-            stop_desc = "price above stop loss (short position)"
-        else:
-            # Long position stop: price below stop loss
-            is_stopped = current_price <= stop_loss_price
-            stop_desc = "price below stop loss (long position)"
+        is_stopped = _STOP_HIT[is_short](current_price, stop_loss_price)
 
         if is_stopped:
             self.gating_logger.warning(
@@ -936,25 +1090,52 @@ class InvalidationChecker:
                 invalidation_type="stop_loss",
                 current_price=current_price,
                 stop_loss_price=stop_loss_price,
-                direction=direction_desc,
+                direction=_DIRECTION_DESC[is_short],
                 stop_distance=abs(current_price - stop_loss_price),
-                stop_description=stop_desc,
-                event="invalidation_triggered"
+                stop_description=_STOP_DESC[is_short],
+                check_event="invalidation_triggered"
             )
-        else:
+        elif is_enabled_for(self.gating_logger, logging.DEBUG):
             self.gating_logger.debug(
                 "Stop loss invalidation check passed",
                 plan_id=plan_id,
                 invalidation_type="stop_loss",
                 current_price=current_price,
                 stop_loss_price=stop_loss_price,
-                direction=direction_desc,
+                direction=_DIRECTION_DESC[is_short],
                 distance_to_stop=abs(current_price - stop_loss_price),
-                event="invalidation_check"
+                check_event="invalidation_check"
             )
 
         return is_stopped
 
+    def evaluate_invalidation(self, ctx: InvalidationCtx) -> Optional[InvalidationReason]:
+        """
+        Run all invalidation checks for one tick, stopping at the first hit.
+
+        Checks run in order of expected hit rate: stop loss, price levels,
+        fakeout close, time limit.
+        """
+        if self.check_stop_loss_invalidation(ctx.current_price, ctx.stop_loss, ctx.is_short, ctx.plan_id):
+            return InvalidationReason.STOP_LOSS
+
+        conditions = ctx.invalidation_conditions
+        if conditions:
+            reason = self.check_price_invalidation(ctx.current_price, conditions, ctx.plan_id)
+            if reason is not None:
+                return reason
+
+        if self.check_fakeout_invalidation(ctx.last_closed_candle, ctx.entry_price, ctx.is_short, ctx.plan_id):
+            return InvalidationReason.FAKEOUT_CLOSE
+
+        if (
+            conditions and ctx.plan_created_at is not None
+            and self.check_time_invalidation(ctx.current_time, ctx.plan_created_at, conditions, ctx.plan_id)
+        ):
+            return InvalidationReason.TIME_LIMIT
+
+        return None
+
     def log_invalidation_context(
         self,
         plan_id: str,
@@ -964,22 +1145,29 @@ class InvalidationChecker:
         context: dict = None
     ) -> None:
         """Log comprehensive invalidation context for audit trail."""
+        if not is_enabled_for(self.gating_logger, logging.INFO):
+            return
+
         invalidation_conditions = plan_data.get('extra_data', {}).get('invalidation_conditions', [])
         created_at = plan_data.get('created_at')
-        stop_loss = plan_data.get('stop_loss')
+        if created_at:
+            created_at_iso = created_at.isoformat()
+            elapsed_seconds = (current_time - created_at).total_seconds()
+        else:
+            created_at_iso = elapsed_seconds = None
 
         self.gating_logger.info(
             "Invalidation context evaluation",
             plan_id=plan_id,
             current_price=current_price,
             current_time=current_time.isoformat(),
-            plan_created_at=created_at.isoformat() if created_at else None,
-            elapsed_seconds=(current_time - created_at).total_seconds() if created_at else None,
-            stop_loss_price=stop_loss,
+            plan_created_at=created_at_iso,
+            elapsed_seconds=elapsed_seconds,
+            stop_loss_price=plan_data.get('stop_loss'),
             invalidation_conditions_count=len(invalidation_conditions),
             invalidation_conditions=invalidation_conditions,
             additional_context=context or {},
-            event="invalidation_context"
+            check_event="invalidation_context"
         )
 
 
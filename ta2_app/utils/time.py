@@ -6,8 +6,17 @@ market timestamps are authoritative and wall-clock time is only used
 for operational purposes like latency monitoring.
 """
 
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from time import time as _wall_time
+from time import time_ns as _wall_time_ns
+from typing import Optional, Union
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# validate_market_time window: default maximum age, and allowed future clock skew
+MAX_MARKET_AGE_SECONDS = 300
+MAX_CLOCK_SKEW_NS = 30 * 1_000_000_000
 
 
 def get_market_time(market_ts: Optional[datetime] = None) -> datetime:
@@ -65,6 +74,22 @@ def calculate_latency(market_ts: datetime, wall_clock_ts: Optional[datetime] = N
     return (wall_clock_ts - market_ts).total_seconds()
 
 
+def calculate_latency_fast(market_ts: datetime) -> float:
+    """
+    Calculate latency between market timestamp and the current wall clock.
+
+    Float-only variant of calculate_latency for per-tick callers: reads the
+    system clock directly instead of building a datetime for "now".
+
+    Args:
+        market_ts: Timezone-aware market timestamp from data feed
+
+    Returns:
+        Latency in seconds (positive means market time is older)
+    """
+    return _wall_time() - market_ts.timestamp()
+
+
 def get_market_time_with_latency(market_ts: Optional[datetime] = None) -> tuple[datetime, Optional[float]]:
     """
     Get market time and calculate latency metrics.
@@ -86,29 +111,35 @@ def get_market_time_with_latency(market_ts: Optional[datetime] = None) -> tuple[
     return wall_clock_now, None
 
 
-def validate_market_time(market_ts: datetime, max_age_seconds: int = 300) -> bool:
+def validate_market_time(
+    market_ts: datetime,
+    max_age_seconds: int = MAX_MARKET_AGE_SECONDS,
+    now: Optional[datetime] = None
+) -> bool:
     """
     Validate that market timestamp is reasonable (not too old/future).
 
     Args:
         market_ts: Market timestamp to validate
         max_age_seconds: Maximum age in seconds (default 5 minutes)
+        now: Reference wall-clock time; callers validating several timestamps
+            can pass one value to share it (default: current UTC time)
 
     Returns:
         True if timestamp is valid, False otherwise
     """
-    now = datetime.now(timezone.utc)
-    age_seconds = (now - market_ts).total_seconds()
-
-    # Check if timestamp is too old
-    if age_seconds > max_age_seconds:
-        return False
+    if now is None:
+        # A fresh clock reading never repeats, so skip the memoized path
+        age_ns = _wall_time_ns() - to_epoch_ns(market_ts)
+        return -MAX_CLOCK_SKEW_NS <= age_ns <= max_age_seconds * 1_000_000_000
+    return _market_time_in_window(to_epoch_ns(market_ts), to_epoch_ns(now), max_age_seconds)
 
-    # Check if timestamp is too far in future (allow 30 seconds for clock skew)
-    if age_seconds < -30:
-        return False
 
-    return True
+@lru_cache(maxsize=4096)
+def _market_time_in_window(market_ns: int, now_ns: int, max_age_seconds: int) -> bool:
+    """Age check behind validate_market_time, memoized on exact epoch-ns pairs."""
+    # Not older than max_age_seconds, and at most the allowed skew in the future
+    return -MAX_CLOCK_SKEW_NS <= now_ns - market_ns <= max_age_seconds * 1_000_000_000
 
 
 def format_market_time(market_ts: datetime) -> str:
@@ -124,6 +155,48 @@ def format_market_time(market_ts: datetime) -> str:
     return market_ts.isoformat()
 
 
+def parse_market_time(market_ts: Union[datetime, str]) -> datetime:
+    """
+    Coerce a market timestamp to a datetime, parsing ISO8601 strings.
+
+    Args:
+        market_ts: Datetime (returned as-is) or ISO8601 string, 'Z' suffix allowed
+
+    Returns:
+        Market timestamp as a datetime
+    """
+    if isinstance(market_ts, str):
+        return datetime.fromisoformat(market_ts.replace('Z', '+00:00'))
+    return market_ts
+
+
+def to_epoch_ns(market_ts: datetime) -> int:
+    """
+    Convert a market timestamp to integer nanoseconds since the Unix epoch.
+
+    Args:
+        market_ts: Timezone-aware market timestamp
+
+    Returns:
+        Epoch nanoseconds
+    """
+    delta = market_ts - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+def from_epoch_ns(epoch_ns: int) -> datetime:
+    """
+    Convert integer epoch nanoseconds to a UTC datetime (microsecond precision).
+
+    Args:
+        epoch_ns: Nanoseconds since the Unix epoch
+
+    Returns:
+        UTC datetime
+    """
+    return _EPOCH + timedelta(microseconds=epoch_ns // 1_000)
+
+
 def time_elapsed_seconds(start_time: datetime, end_time: Optional[datetime] = None) -> float:
     """
     Calculate elapsed time in seconds between two market timestamps.
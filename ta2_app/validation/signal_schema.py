@@ -1,13 +1,34 @@
 """JSON schema validation for signal format according to dev_proto.md."""
 
 import logging
-from datetime import datetime
-from typing import Any
+import re
+from datetime import datetime, timezone
+from typing import Any, Optional
 
-from ..utils.time import validate_market_time
+import numpy as np
+
+from ..utils.time import MAX_CLOCK_SKEW_NS, MAX_MARKET_AGE_SECONDS, to_epoch_ns, validate_market_time
 
 logger = logging.getLogger(__name__)
 
+_NUMERIC_TYPES = (int, float)
+_PROTOCOL_RE = re.compile(r"^breakout-v\d+(?:\.\d+)*$")
+_VALID_STATES = frozenset({"triggered", "invalid", "expired"})
+_VALID_STATE_ARRAY = np.array(sorted(_VALID_STATES))
+_VALID_ENTRY_MODES = frozenset({"momentum", "retest"})
+_RUNTIME_TS_FIELDS = ("armed_at", "triggered_at", "break_ts")
+_NON_NEGATIVE_METRICS = ("rvol", "natr_pct", "atr")
+_IMBALANCE_METRICS = ("ob_imbalance_long", "ob_imbalance_short")
+
+# Same window as validate_market_time's defaults
+_MAX_AGE_NS = MAX_MARKET_AGE_SECONDS * 1_000_000_000
+_NAT_NS = np.iinfo(np.int64).min
+
+# Below this many signals the per-signal checks are faster than building columns
+_VECTORIZED_MIN_BATCH = 40
+# Below this many entries per-entry parsing is faster than a datetime64 column
+_DATETIME64_MIN_COLUMN = 8
+
 
 # Signal JSON schema according to dev_proto.md section 10
 SIGNAL_SCHEMA = {
@@ -91,7 +112,7 @@ SIGNAL_SCHEMA = {
                 },
                 "pinbar_type": {
                     "type": ["string", "null"],
-                    "enum": ["hammer", "shooting_star", "doji", None],
+                    "enum": ["bullish", "bearish", None],
                     "description": "Type of pinbar if detected"
                 },
                 "ob_sweep_detected": {
@@ -133,6 +154,99 @@ SIGNAL_SCHEMA = {
     "additionalProperties": True
 }
 
+_REQUIRED_FIELDS = frozenset(SIGNAL_SCHEMA["required"])
+
+
+def _parse_iso(ts: str) -> datetime:
+    """Parse an ISO 8601 timestamp, accepting a trailing 'Z' on Python < 3.11."""
+    if ts.endswith('Z'):
+        return datetime.fromisoformat(ts[:-1] + '+00:00')
+    return datetime.fromisoformat(ts)
+
+
+def _parse_timestamp_ns(value: Any) -> Optional[int]:
+    """Parse an ISO timestamp string to epoch ns, or None if it is not a valid aware timestamp."""
+    if not isinstance(value, str):
+        return None
+    try:
+        parsed = _parse_iso(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return None
+    return to_epoch_ns(parsed)
+
+
+def _timestamp_ns_column(values: list[Any]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parse optional ISO timestamps into an int64 epoch-ns column.
+
+    Strings ending in 'Z' or '+00:00' are parsed together as numpy
+    datetime64; other offsets, and columns shorter than
+    _DATETIME64_MIN_COLUMN, fall back to per-entry parsing.
+
+    Returns:
+        (epoch ns with _NAT_NS for None/unparseable, mask of entries that are None or valid)
+    """
+    n = len(values)
+    slow = []
+    if n < _DATETIME64_MIN_COLUMN:
+        column = np.full(n, _NAT_NS, dtype=np.int64)
+        slow = [i for i, value in enumerate(values) if value is not None]
+    else:
+        utc_strings = ['NaT'] * n
+        for i, value in enumerate(values):
+            if value is None:
+                continue
+            if isinstance(value, str) and len(value) > 16:
+                if value.endswith('Z'):
+                    utc_strings[i] = value[:-1]
+                    continue
+                if value.endswith('+00:00'):
+                    utc_strings[i] = value[:-6]
+                    continue
+            slow.append(i)
+
+        try:
+            column = np.array(utc_strings, dtype='datetime64[us]').astype('datetime64[ns]').view(np.int64)
+        except ValueError:
+            column = np.full(n, _NAT_NS, dtype=np.int64)
+            slow = [i for i, value in enumerate(values) if value is not None]
+
+    parsed = np.ones(n, dtype=bool)
+    for i in slow:
+        epoch_ns = _parse_timestamp_ns(values[i])
+        if epoch_ns is None:
+            parsed[i] = False
+        else:
+            column[i] = epoch_ns
+    return column, parsed
+
+
+def _in_age_window(epoch_ns: np.ndarray, now_ns: int) -> np.ndarray:
+    """Column-wise validate_market_time with the default window."""
+    age_ns = now_ns - epoch_ns
+    return (age_ns <= _MAX_AGE_NS) & (age_ns >= -MAX_CLOCK_SKEW_NS)
+
+
+def _float_column(values: list[Any]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Build a float column from optional numeric values.
+
+    Returns:
+        (values with None as NaN, mask of entries that are None or numeric)
+    """
+    column = np.full(len(values), np.nan)
+    typed = np.ones(len(values), dtype=bool)
+    for i, value in enumerate(values):
+        if value is None:
+            continue
+        if isinstance(value, _NUMERIC_TYPES):
+            column[i] = value
+        else:
+            typed[i] = False
+    return column, typed
+
 
 class SignalValidationError(Exception):
     """Signal validation error."""
@@ -142,6 +256,8 @@ class SignalValidationError(Exception):
 class SignalValidator:
     """Validates signals against JSON schema."""
 
+    __slots__ = ('logger', 'schema')
+
     def __init__(self):
         self.logger = logger
         self.schema = SIGNAL_SCHEMA
@@ -160,53 +276,55 @@ class SignalValidator:
             SignalValidationError: If validation fails
         """
         try:
+            runtime = signal.get("runtime", {})
+            metrics = signal.get("metrics", {})
+
             # Basic type and required field validation
             self._validate_required_fields(signal)
-            self._validate_field_types(signal)
-            self._validate_field_values(signal)
+            self._validate_field_types(signal, runtime, metrics)
+            self._validate_field_values(metrics)
 
             # Validate timestamps
-            self._validate_timestamps(signal)
+            self._validate_timestamps(signal, runtime)
 
             # State-specific validation
-            self._validate_state_specific(signal)
+            self._validate_state_specific(signal, runtime)
 
             return True
 
         except Exception as e:
             error_msg = f"Signal validation failed: {str(e)}"
-            self.logger.error(error_msg, plan_id=signal.get("plan_id"))
+            self.logger.error(error_msg, extra={"plan_id": signal.get("plan_id")})
             raise SignalValidationError(error_msg) from e
 
     def _validate_required_fields(self, signal: dict[str, Any]) -> None:
         """Validate required fields are present."""
-        required_fields = self.schema["required"]
-        missing_fields = [field for field in required_fields if field not in signal]
+        missing_fields = _REQUIRED_FIELDS.difference(signal)
 
         if missing_fields:
-            raise ValueError(f"Missing required fields: {missing_fields}")
+            raise ValueError(f"Missing required fields: {sorted(missing_fields)}")
 
-    def _validate_field_types(self, signal: dict[str, Any]) -> None:
+    def _validate_field_types(self, signal: dict[str, Any], runtime: Any, metrics: Any) -> None:
         """Validate field types match schema."""
         # Plan ID
         if not isinstance(signal.get("plan_id"), str) or len(signal["plan_id"]) == 0:
             raise ValueError("plan_id must be a non-empty string")
 
         # State
-        if signal.get("state") not in ["triggered", "invalid", "expired"]:
+        if signal.get("state") not in _VALID_STATES:
             raise ValueError(f"Invalid state: {signal.get('state')}")
 
         # Protocol version
         protocol_version = signal.get("protocol_version")
-        if not isinstance(protocol_version, str) or not protocol_version.startswith("breakout-v"):
+        if not isinstance(protocol_version, str) or _PROTOCOL_RE.match(protocol_version) is None:
             raise ValueError(f"Invalid protocol_version: {protocol_version}")
 
         # Runtime
-        if not isinstance(signal.get("runtime", {}), dict):
+        if not isinstance(runtime, dict):
             raise ValueError("runtime must be an object")
 
         # Metrics
-        if not isinstance(signal.get("metrics", {}), dict):
+        if not isinstance(metrics, dict):
             raise ValueError("metrics must be an object")
 
         # Strength score
@@ -214,9 +332,8 @@ class SignalValidator:
         if not isinstance(strength_score, (int, float)) or not (0 <= strength_score <= 100):
             raise ValueError(f"strength_score must be a number between 0-100, got: {strength_score}")
 
-    def _validate_field_values(self, signal: dict[str, Any]) -> None:
+    def _validate_field_values(self, metrics: dict[str, Any]) -> None:
         """Validate field values are within acceptable ranges."""
-        metrics = signal.get("metrics", {})
 
         # RVOL should be positive
         if "rvol" in metrics and metrics["rvol"] is not None:
@@ -240,46 +357,42 @@ class SignalValidator:
                 if not isinstance(value, (int, float)) or not (-1 <= value <= 1):
                     raise ValueError(f"{field} must be between -1 and 1, got: {value}")
 
-    def _validate_timestamps(self, signal: dict[str, Any]) -> None:
+    def _validate_timestamps(self, signal: dict[str, Any], runtime: dict[str, Any]) -> None:
         """Validate timestamp formats and market time consistency."""
+        now = datetime.now(timezone.utc)
+
         # Main timestamp
         timestamp = signal.get("timestamp")
+        main_ts = None
         if timestamp:
             try:
-                main_ts = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+                main_ts = _parse_iso(timestamp)
                 # Validate that main timestamp is reasonable (market time validation)
-                if not validate_market_time(main_ts):
+                if not validate_market_time(main_ts, now=now):
                     raise ValueError(f"Signal timestamp appears invalid (too old or future): {timestamp}")
             except ValueError:
                 raise ValueError(f"Invalid timestamp format: {timestamp}")
 
         # Runtime timestamps
-        runtime = signal.get("runtime", {})
-        for ts_field in ["armed_at", "triggered_at", "break_ts"]:
-            if ts_field in runtime and runtime[ts_field] is not None:
-                try:
-                    ts = datetime.fromisoformat(runtime[ts_field].replace('Z', '+00:00'))
-                    # Validate that runtime timestamps are reasonable
-                    if not validate_market_time(ts):
-                        raise ValueError(f"Runtime timestamp {ts_field} appears invalid (too old or future): {runtime[ts_field]}")
-                except ValueError:
-                    raise ValueError(f"Invalid {ts_field} timestamp format: {runtime[ts_field]}")
-
-        # Validate timestamp consistency (runtime timestamps should be before or equal to main timestamp)
-        if timestamp:
-            main_ts = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            runtime = signal.get("runtime", {})
+        for ts_field in _RUNTIME_TS_FIELDS:
+            value = runtime.get(ts_field)
+            if value is None:
+                continue
+            try:
+                ts = _parse_iso(value)
+                # Validate that runtime timestamps are reasonable
+                if not validate_market_time(ts, now=now):
+                    raise ValueError(f"Runtime timestamp {ts_field} appears invalid (too old or future): {value}")
+            except ValueError:
+                raise ValueError(f"Invalid {ts_field} timestamp format: {value}")
 
-            for ts_field in ["armed_at", "triggered_at", "break_ts"]:
-                if ts_field in runtime and runtime[ts_field] is not None:
-                    runtime_ts = datetime.fromisoformat(runtime[ts_field].replace('Z', '+00:00'))
-                    if runtime_ts > main_ts:
-                        raise ValueError(f"Runtime timestamp {ts_field} ({runtime[ts_field]}) is after signal timestamp ({timestamp})")
+            # Runtime timestamps should be before or equal to main timestamp
+            if main_ts is not None and ts > main_ts:
+                raise ValueError(f"Runtime timestamp {ts_field} ({value}) is after signal timestamp ({timestamp})")
 
-    def _validate_state_specific(self, signal: dict[str, Any]) -> None:
+    def _validate_state_specific(self, signal: dict[str, Any], runtime: dict[str, Any]) -> None:
         """Validate state-specific requirements."""
         state = signal.get("state")
-        runtime = signal.get("runtime", {})
 
         if state == "triggered":
             # Triggered signals should have triggered_at timestamp
@@ -290,7 +403,7 @@ class SignalValidator:
             if "entry_mode" not in signal:
                 raise ValueError("triggered signals must have entry_mode")
 
-            if signal["entry_mode"] not in ["momentum", "retest"]:
+            if signal["entry_mode"] not in _VALID_ENTRY_MODES:
                 raise ValueError(f"Invalid entry_mode: {signal['entry_mode']}")
 
         elif state == "invalid":
@@ -307,12 +420,18 @@ class SignalValidator:
         """
         Validate multiple signals.
 
+        Batches of _VECTORIZED_MIN_BATCH or more are validated column-wise by
+        validate_signals_vectorized; smaller ones run validate_signal per entry.
+
         Args:
             signals: List of signal dictionaries
 
         Returns:
             List of boolean validation results
         """
+        if len(signals) >= _VECTORIZED_MIN_BATCH:
+            return self.validate_signals_vectorized(signals)
+
         results = []
         for signal in signals:
             try:
@@ -322,6 +441,120 @@ class SignalValidator:
                 results.append(False)
         return results
 
+    def validate_signals_vectorized(self, signals: list[dict[str, Any]]) -> list[bool]:
+        """
+        Validate a batch of signals column-wise.
+
+        Fields are gathered into per-field columns in one pass and the range,
+        membership, timestamp age/ordering and state-specific rules are then
+        evaluated as NumPy masks over the whole batch. Applies the same rules
+        as validate_signal; use validate_signal on a failing entry to get the
+        detailed error.
+
+        Args:
+            signals: List of signal dictionaries
+
+        Returns:
+            List of boolean validation results
+        """
+        n = len(signals)
+        if n == 0:
+            return []
+
+        row_ok = np.ones(n, dtype=bool)
+        states: list[Any] = [None] * n
+        scores: list[Any] = [None] * n
+        metric_values: dict[str, list[Any]] = {
+            field: [None] * n for field in _NON_NEGATIVE_METRICS + _IMBALANCE_METRICS
+        }
+        has_triggered_at = np.zeros(n, dtype=bool)
+        has_invalid_reason = np.zeros(n, dtype=bool)
+        has_armed_at = np.zeros(n, dtype=bool)
+        entry_mode_ok = np.zeros(n, dtype=bool)
+
+        for i, signal in enumerate(signals):
+            plan_id = signal.get("plan_id")
+            protocol_version = signal.get("protocol_version")
+            runtime = signal.get("runtime", {})
+            metrics = signal.get("metrics", {})
+            if (
+                not signal.keys() >= _REQUIRED_FIELDS
+                or not isinstance(plan_id, str) or not plan_id
+                or not isinstance(protocol_version, str)
+                or _PROTOCOL_RE.match(protocol_version) is None
+                or not isinstance(runtime, dict)
+                or not isinstance(metrics, dict)
+            ):
+                row_ok[i] = False
+                continue
+
+            states[i] = signal["state"]
+            scores[i] = signal["strength_score"]
+            for field, column in metric_values.items():
+                column[i] = metrics.get(field)
+
+            has_triggered_at[i] = bool(runtime.get("triggered_at"))
+            has_invalid_reason[i] = bool(runtime.get("invalid_reason"))
+            has_armed_at[i] = bool(runtime.get("armed_at"))
+            entry_mode_ok[i] = signal.get("entry_mode") in _VALID_ENTRY_MODES
+
+        state_column = np.array(states, dtype=object)
+        valid = row_ok & np.isin(state_column.astype(str), _VALID_STATE_ARRAY)
+
+        score_column, score_typed = _float_column(scores)
+        valid &= score_typed & (score_column >= 0) & (score_column <= 100)
+
+        for field in _NON_NEGATIVE_METRICS:
+            column, typed = _float_column(metric_values[field])
+            valid &= typed & ~(column < 0)
+        for field in _IMBALANCE_METRICS:
+            column, typed = _float_column(metric_values[field])
+            valid &= typed & ~((column < -1) | (column > 1))
+
+        valid &= self.validate_timestamps_batch(signals)
+
+        state_specific_ok = np.select(
+            [state_column == "triggered", state_column == "invalid", state_column == "expired"],
+            [has_triggered_at & entry_mode_ok, has_invalid_reason, has_armed_at],
+            default=True
+        )
+        valid &= state_specific_ok
+
+        return valid.tolist()
+
+    def validate_timestamps_batch(self, signals: list[dict[str, Any]]) -> np.ndarray:
+        """
+        Vectorized form of the timestamp checks in validate_signal.
+
+        Each timestamp field is parsed into one epoch-ns column (UTC strings
+        via numpy datetime64, anything else per entry), then the age window
+        and "runtime timestamp not after signal timestamp" rules are applied
+        column-wise.
+
+        Args:
+            signals: List of signal dictionaries
+
+        Returns:
+            Boolean mask, True where all of a signal's timestamps are valid
+        """
+        now_ns = to_epoch_ns(datetime.now(timezone.utc))
+        runtimes = [signal.get("runtime") for signal in signals]
+
+        # A falsy main timestamp is not validated (the schema checks presence)
+        main_ns, valid = _timestamp_ns_column([signal.get("timestamp") or None for signal in signals])
+        has_main = main_ns != _NAT_NS
+        valid &= ~has_main | _in_age_window(main_ns, now_ns)
+
+        for field in _RUNTIME_TS_FIELDS:
+            ts_ns, parsed = _timestamp_ns_column(
+                [runtime.get(field) if isinstance(runtime, dict) else None for runtime in runtimes]
+            )
+            present = ts_ns != _NAT_NS
+            valid &= parsed & (~present | _in_age_window(ts_ns, now_ns))
+            valid &= ~(has_main & present & (ts_ns > main_ns))
+
+        return valid
+
     def get_schema(self) -> dict[str, Any]:
         """Get the JSON schema for signals."""
         return self.schema.copy()
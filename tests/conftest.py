@@ -1,9 +1,33 @@
-"""Pytest configuration and shared fixtures."""
+"""
+Pytest configuration and shared fixtures.
 
+Tests keep no cross-process state (databases are in-memory or under tmp_path,
+the integration engine is per session), so they can run in parallel with
+pytest-xdist (a dev dependency)::
+
+    pytest -n auto --dist=loadfile tests/integration/
+
+loadfile keeps each module on one worker, so module-scoped fixtures are built once.
+"""
+
+import os
 import pytest
 from typing import Dict, Any
 from datetime import datetime, timezone
 
+# Numba kernels run as plain Python unless TA2_JIT=1; Numba reads this at import,
+# so it must be set before any test module imports ta2_app
+if not os.environ.get("TA2_JIT"):
+    os.environ.setdefault("NUMBA_DISABLE_JIT", "1")
+
+# Unit-only runs: TA2_SKIP_INTEGRATION=1 skips collecting (and importing) integration tests
+collect_ignore_glob = ["integration/*"] if os.environ.get("TA2_SKIP_INTEGRATION") else []
+
+
+def pytest_configure(config):
+    """Register the jit marker used by the compiled-kernel suite in tests/jit."""
+    config.addinivalue_line("markers", "jit: needs Numba JIT enabled (run with TA2_JIT=1)")
+
 
 @pytest.fixture
 def sample_candlestick() -> Dict[str, Any]:
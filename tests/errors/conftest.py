@@ -0,0 +1,36 @@
+"""Shared component fixtures for error handling tests."""
+
+import pytest
+
+from ta2_app.data.normalizer import DataNormalizer
+from ta2_app.engine import BreakoutEvaluationEngine
+from ta2_app.metrics.calculator import MetricsCalculator
+from ta2_app.state.transitions import StateTransitionHandler
+
+
+# Components are built fresh per test rather than copied from a session
+# template: a deepcopy costs more than construction, and a shallow copy
+# would share plan lists and duplicate-candle tracking between tests.
+
+@pytest.fixture
+def engine() -> BreakoutEvaluationEngine:
+    """Fresh evaluation engine with no active plans."""
+    return BreakoutEvaluationEngine()
+
+
+@pytest.fixture
+def calculator() -> MetricsCalculator:
+    """Fresh metrics calculator."""
+    return MetricsCalculator()
+
+
+@pytest.fixture
+def normalizer() -> DataNormalizer:
+    """Fresh data normalizer."""
+    return DataNormalizer()
+
+
+@pytest.fixture
+def handler() -> StateTransitionHandler:
+    """Fresh state transition handler."""
+    return StateTransitionHandler()
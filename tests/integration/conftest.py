@@ -0,0 +1,20 @@
+"""Shared fixtures for integration tests."""
+
+from typing import Iterator
+
+import pytest
+
+from ta2_app.engine import BreakoutEvaluationEngine
+
+
+@pytest.fixture(scope="session")
+def shared_engine() -> BreakoutEvaluationEngine:
+    """Evaluation engine constructed once per test session."""
+    return BreakoutEvaluationEngine()
+
+
+@pytest.fixture
+def engine(shared_engine: BreakoutEvaluationEngine) -> Iterator[BreakoutEvaluationEngine]:
+    """Session engine with plans and per-instrument data cleared after each test."""
+    yield shared_engine
+    shared_engine.reset()
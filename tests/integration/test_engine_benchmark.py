@@ -0,0 +1,47 @@
+"""
+Micro-benchmark for the evaluate_tick hot path.
+
+Uses the pytest-benchmark dev dependency; the module is skipped in
+environments installed without dev dependencies.
+Deselect with ``-m "not benchmark"``; keep a baseline for comparison with
+``pytest tests/integration/test_engine_benchmark.py --benchmark-save=engine``
+and check later runs with ``--benchmark-compare``.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from ta2_app.engine import BreakoutEvaluationEngine
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark(group="engine")
+
+# Stamped at import so the bar passes the staleness check; price stays below entry
+_TS = int(datetime.now(timezone.utc).timestamp() * 1000)
+PAYLOAD_NO_BREAK = {
+    "code": "0",
+    "msg": "",
+    "data": [[_TS, 49800.0, 49900.0, 49700.0, 49800.0, 1000.0, 49800000.0, 49800000.0, 1]]
+}
+
+_PLAN = {
+    "id": "bench-001",
+    "instrument_id": "BTC-USDT-SWAP",
+    "direction": "long",
+    "entry_type": "breakout",
+    "entry_price": 50000.0
+}
+
+
+def test_evaluate_tick_perf(benchmark, engine: BreakoutEvaluationEngine) -> None:
+    """Benchmark evaluate_tick on a fixed candle for one active plan."""
+    engine.add_plan(_PLAN)
+
+    benchmark.pedantic(
+        engine.evaluate_tick,
+        kwargs={"candlestick_payload": PAYLOAD_NO_BREAK, "instrument_id": "BTC-USDT-SWAP"},
+        rounds=1000,
+        iterations=1
+    )
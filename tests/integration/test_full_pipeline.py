@@ -10,19 +10,32 @@ from ta2_app.engine import BreakoutEvaluationEngine
 class TestFullPipeline:
     """Integration tests for the complete evaluation pipeline."""
 
+    @pytest.mark.parametrize("plan_count,expected_min", [(0, 0), (1, 0)])
     def test_full_pipeline_basic_flow(
-        self, sample_candlestick: Dict[str, Any], sample_order_book: Dict[str, Any]
+        self,
+        engine: BreakoutEvaluationEngine,
+        sample_candlestick: Dict[str, Any],
+        sample_order_book: Dict[str, Any],
+        plan_count: int,
+        expected_min: int
     ) -> None:
         """Test the full pipeline with basic market data."""
-        engine = BreakoutEvaluationEngine()
-        
-        # Simulate market data payload
-        market_data = {
-            "candlestick": sample_candlestick,
-            "order_book": sample_order_book,
-        }
-        
-        signals = engine.evaluate_tick(market_data)
-        
-        # For now, just verify it doesn't crash and returns a list
-        assert isinstance(signals, list)
\ No newline at end of file
+        engine.add_plans(
+            {
+                "id": f"pipeline-plan-{i}",
+                "instrument_id": "BTC-USD-SWAP",
+                "entry_type": "breakout",
+                "entry_price": 50000.0 + i * 1000,
+                "direction": "long",
+            }
+            for i in range(plan_count)
+        )
+        assert engine.get_active_plan_count() == plan_count
+
+        signals = engine.evaluate_tick(
+            candlestick_payload=sample_candlestick,
+            orderbook_payload=sample_order_book,
+            instrument_id="BTC-USD-SWAP"
+        )
+
+        assert len(signals) >= expected_min
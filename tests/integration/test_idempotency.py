@@ -1,131 +1,181 @@
 """Integration tests for idempotent signal emission across the full pipeline."""
 
 import pytest
-import tempfile
-import os
 import threading
-import time
-from datetime import datetime, timezone
-from pathlib import Path
-from unittest.mock import Mock, patch
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock
 
-from ta2_app.engine import BreakoutEvaluationEngine
 from ta2_app.state.runtime import StateManager, SignalEmitter
 from ta2_app.persistence.signal_store import SignalStore
 from ta2_app.config.signal_delivery import SignalDeliveryConfig
 from ta2_app.state.models import BreakoutParameters
+from ta2_app.engine import BreakoutEvaluationEngine
+
+
+@pytest.fixture(scope="module")
+def signal_store():
+    """Shared in-memory signal store; schema is created once per module."""
+    store = SignalStore(db_path="file:test_idempotency?mode=memory&cache=shared")
+    yield store
+    store.close()
+
+
+_WORKERS = 10
+
+
+@pytest.fixture(scope="module")
+def thread_pool():
+    """Worker threads reused across concurrency tests."""
+    with ThreadPoolExecutor(max_workers=_WORKERS) as pool:
+        yield pool
+
+
+# Tick time as a datetime so process_market_tick has nothing to parse
+_TICK_TS_STR = "2023-01-01T12:00:00Z"
+_TICK_TS = datetime(2023, 1, 1, 12, tzinfo=timezone.utc)
+
+_CANDLESTICK = {
+    "timestamp": _TICK_TS_STR,
+    "open": 49900.0,
+    "high": 50100.0,
+    "low": 49800.0,
+    "close": 50050.0,
+    "volume": 1000.0
+}
+
+_ORDER_BOOK = {
+    "timestamp": _TICK_TS_STR,
+    "asks": [[50100.0, 100.0, 0, 0], [50200.0, 200.0, 0, 0]],
+    "bids": [[49900.0, 150.0, 0, 0], [49800.0, 250.0, 0, 0]]
+}
+
+# Read-only so no test can alter the tick another test sees
+_TRIGGERING_DATA = MappingProxyType({
+    "timestamp": _TICK_TS,
+    "last_price": 50100.0,  # Above entry price
+    "candlestick": _CANDLESTICK,
+    "order_book": _ORDER_BOOK
+})
+
+_SAMPLE_PLAN = {
+    "id": "test-plan-1",
+    "instrument_id": "BTC-USD-SWAP",
+    "direction": "long",
+    "entry_type": "breakout",
+    "entry_price": 50000.0,
+    "extra_data": {
+        "breakout_params": {
+            "penetration_pct": 0.05,
+            "min_rvol": 1.5
+        }
+    }
+}
+
+
+@pytest.fixture(scope="class")
+def three_plans():
+    """The sample plan under three ids, built once per test class."""
+    return tuple({**_SAMPLE_PLAN, "id": f"test-plan-{i}"} for i in (1, 2, 3))
+
+
+@pytest.fixture
+def mock_metrics():
+    """Metrics snapshot stand-in; the pipeline only reads these attributes."""
+    return SimpleNamespace(
+        rvol=2.0,
+        natr_pct=0.5,
+        atr=100.0,
+        pinbar=None,
+        ob_sweep_detected=False,
+        ob_sweep_side=None,
+        ob_imbalance_long=0.6,
+        ob_imbalance_short=0.4
+    )
+
+
+@pytest.fixture(autouse=True)
+def patch_metrics(monkeypatch, mock_metrics):
+    """Serve mock_metrics from the engine for every test in this module."""
+    # The engine computes metrics inline and has no _calculate_metrics hook,
+    # so the attribute is installed rather than replaced.
+    monkeypatch.setattr(
+        BreakoutEvaluationEngine, "_calculate_metrics",
+        lambda self, *args, **kwargs: mock_metrics, raising=False
+    )
 
 
 class TestFullPipelineIdempotency:
     """Test idempotency across the full evaluation pipeline."""
+
+    # BreakoutParameters is frozen, so one instance can serve every plan
+    _PLAN_IDS = ("test-plan-1", "test-plan-2", "test-plan-3")
+    _SHARED_PARAMS = BreakoutParameters()
+    _CONFIG_BY_PLAN = dict.fromkeys(_PLAN_IDS, _SHARED_PARAMS)
     
-    def setup_method(self):
-        """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test_signals.db")
-        
-        # Create signal store
-        self.signal_store = SignalStore(db_path=self.db_path)
-        
+    @pytest.fixture(autouse=True)
+    def _pipeline(self, engine, signal_store, monkeypatch, tmp_path):
+        """Set up test environment; emitted signals go to the in-memory store."""
+        self.signal_store = signal_store
+
         # Create signal emitter with test delivery config
         delivery_config = SignalDeliveryConfig(
             enabled=True,
             destinations=[]  # No actual delivery for tests
         )
-        self.signal_emitter = SignalEmitter(delivery_config=delivery_config)
+        # The emitter opens its default ./signals.db on construction; keep that file
+        # private to the test so parallel workers never share it
+        with monkeypatch.context() as m:
+            m.chdir(tmp_path)
+            self.signal_emitter = SignalEmitter(delivery_config=delivery_config)
+        self.signal_emitter.signal_store = signal_store
         
         # Create state manager
         self.state_manager = StateManager()
         self.state_manager.signal_emitter = self.signal_emitter
         
-        # Create evaluation engine
-        self.engine = BreakoutEvaluationEngine()
+        # Shared evaluation engine (reset after each test)
+        self.engine = engine
         
         # Sample trading plan
-        self.sample_plan = {
-            "id": "test-plan-1",
-            "instrument_id": "BTC-USD-SWAP",
-            "direction": "long",
-            "entry_type": "breakout",
-            "entry_price": 50000.0,
-            "extra_data": {
-                "breakout_params": {
-                    "penetration_pct": 0.05,
-                    "min_rvol": 1.5
-                }
-            }
-        }
-        
-        # Sample market data
-        self.sample_candlestick = {
-            "timestamp": "2023-01-01T12:00:00Z",
-            "open": 49900.0,
-            "high": 50100.0,
-            "low": 49800.0,
-            "close": 50050.0,
-            "volume": 1000.0
-        }
-        
-        self.sample_order_book = {
-            "timestamp": "2023-01-01T12:00:00Z",
-            "asks": [[50100.0, 100.0, 0, 0], [50200.0, 200.0, 0, 0]],
-            "bids": [[49900.0, 150.0, 0, 0], [49800.0, 250.0, 0, 0]]
-        }
-    
-    def teardown_method(self):
-        """Clean up test environment."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+        self.sample_plan = _SAMPLE_PLAN
+
+        yield
+
+        with signal_store._get_connection() as conn:
+            conn.execute("DELETE FROM signals")
+            conn.commit()
     
-    def test_state_transition_idempotency(self):
+    def test_state_transition_idempotency(self, mock_metrics):
         """Test that state transitions don't emit duplicate signals."""
         # Initialize plan state
         plan_id = self.sample_plan["id"]
         
-        # Mock metrics for consistent results
-        mock_metrics = Mock()
-        mock_metrics.rvol = 2.0
-        mock_metrics.natr_pct = 0.5
-        mock_metrics.atr = 100.0
-        mock_metrics.pinbar = None
-        mock_metrics.ob_sweep_detected = False
-        mock_metrics.ob_sweep_side = None
-        mock_metrics.ob_imbalance_long = 0.6
-        mock_metrics.ob_imbalance_short = 0.4
-        
-        # Create triggering market data
-        triggering_data = {
-            "timestamp": "2023-01-01T12:00:00Z",
-            "last_price": 50100.0,  # Above entry price
-            "candlestick": self.sample_candlestick,
-            "order_book": self.sample_order_book
-        }
-        
         # Process same market tick multiple times
         emitted_signals = []
         
-        with patch.object(self.engine, '_calculate_metrics', return_value=mock_metrics):
-            # First processing - should emit signal
-            signals1 = self.state_manager.process_market_tick(
-                [self.sample_plan], triggering_data, {plan_id: mock_metrics}, 
-                {plan_id: BreakoutParameters()}
-            )
-            emitted_signals.extend(signals1)
-            
-            # Second processing - should NOT emit duplicate
-            signals2 = self.state_manager.process_market_tick(
-                [self.sample_plan], triggering_data, {plan_id: mock_metrics}, 
-                {plan_id: BreakoutParameters()}
-            )
-            emitted_signals.extend(signals2)
-            
-            # Third processing - should NOT emit duplicate
-            signals3 = self.state_manager.process_market_tick(
-                [self.sample_plan], triggering_data, {plan_id: mock_metrics}, 
-                {plan_id: BreakoutParameters()}
-            )
-            emitted_signals.extend(signals3)
+        # First processing - should emit signal
+        signals1 = self.state_manager.process_market_tick(
+            [self.sample_plan], _TRIGGERING_DATA, {plan_id: mock_metrics}, 
+            {plan_id: BreakoutParameters()}
+        )
+        emitted_signals.extend(signals1)
+        
+        # Second processing - should NOT emit duplicate
+        signals2 = self.state_manager.process_market_tick(
+            [self.sample_plan], _TRIGGERING_DATA, {plan_id: mock_metrics}, 
+            {plan_id: BreakoutParameters()}
+        )
+        emitted_signals.extend(signals2)
+        
+        # Third processing - should NOT emit duplicate
+        signals3 = self.state_manager.process_market_tick(
+            [self.sample_plan], _TRIGGERING_DATA, {plan_id: mock_metrics}, 
+            {plan_id: BreakoutParameters()}
+        )
+        emitted_signals.extend(signals3)
         
         # Should only have one signal emitted
         assert len(emitted_signals) == 1
@@ -133,8 +183,7 @@ class TestFullPipelineIdempotency:
         assert emitted_signals[0]["state"] == "triggered"
         
         # Verify only one signal in database
-        stored_signals = self.signal_store.get_signals_by_plan(plan_id)
-        assert len(stored_signals) == 1
+        assert self.signal_store.count_by_plan(plan_id) == 1
     
     def test_delivery_retry_idempotency(self):
         """Test that delivery retries don't create duplicate signals."""
@@ -145,9 +194,9 @@ class TestFullPipelineIdempotency:
             "protocol_version": "breakout-v1",
             "runtime": {
                 "armed_at": "2023-01-01T11:59:00Z",
-                "triggered_at": "2023-01-01T12:00:00Z"
+                "triggered_at": _TICK_TS_STR
             },
-            "timestamp": "2023-01-01T12:00:00Z",
+            "timestamp": _TICK_TS_STR,
             "last_price": 50100.0,
             "metrics": {
                 "rvol": 2.0,
@@ -171,74 +220,44 @@ class TestFullPipelineIdempotency:
         self.signal_emitter.delivery_handlers = {"test_handler": mock_handler}
         
         # Emit signal multiple times (simulating retry scenarios)
-        results = []
-        for i in range(3):
-            result = self.signal_emitter.emit_signal(
-                signal_data["plan_id"], signal_data, None
-            )
-            results.append(result)
+        emitted = [
+            bool(self.signal_emitter.emit_signal(signal_data["plan_id"], signal_data, None))
+            for _ in range(3)
+        ]
         
         # Only first emission should succeed
-        assert len([r for r in results if r != {}]) == 1
-        assert len([r for r in results if r == {}]) == 2
+        assert emitted.count(True) == 1
+        assert emitted.count(False) == 2
         
         # Verify delivery was only called once
         assert mock_handler.deliver.call_count == 1
         
         # Verify only one signal in database
-        stored_signals = self.signal_store.get_signals_by_plan("test-plan")
-        assert len(stored_signals) == 1
+        assert self.signal_store.count_by_plan("test-plan") == 1
     
-    def test_concurrent_pipeline_processing(self):
+    def test_concurrent_pipeline_processing(self, mock_metrics, thread_pool):
         """Test pipeline idempotency under concurrent processing."""
         plan_id = self.sample_plan["id"]
         
-        # Mock metrics
-        mock_metrics = Mock()
-        mock_metrics.rvol = 2.0
-        mock_metrics.natr_pct = 0.5
-        mock_metrics.atr = 100.0
-        mock_metrics.pinbar = None
-        mock_metrics.ob_sweep_detected = False
-        mock_metrics.ob_sweep_side = None
-        mock_metrics.ob_imbalance_long = 0.6
-        mock_metrics.ob_imbalance_short = 0.4
-        
-        # Triggering market data
-        triggering_data = {
-            "timestamp": "2023-01-01T12:00:00Z",
-            "last_price": 50100.0,
-            "candlestick": self.sample_candlestick,
-            "order_book": self.sample_order_book
-        }
-        
-        all_signals = []
-        errors = []
-        
+        barrier = threading.Barrier(_WORKERS)
+
         def process_market_tick_worker():
-            try:
-                with patch.object(self.engine, '_calculate_metrics', return_value=mock_metrics):
-                    signals = self.state_manager.process_market_tick(
-                        [self.sample_plan], triggering_data, {plan_id: mock_metrics}, 
-                        {plan_id: BreakoutParameters()}
-                    )
-                    all_signals.extend(signals)
-            except Exception as e:
-                errors.append(e)
-        
-        # Start multiple threads processing the same market tick
-        threads = []
-        for _ in range(10):
-            thread = threading.Thread(target=process_market_tick_worker)
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-        
-        # Check results
-        assert len(errors) == 0, f"Errors occurred: {errors}"
+            # Release all workers at once so they race on the same tick
+            barrier.wait(timeout=5)
+            return self.state_manager.process_market_tick(
+                [self.sample_plan], _TRIGGERING_DATA, {plan_id: mock_metrics}, 
+                {plan_id: BreakoutParameters()}
+            )
+
+        # Process the same market tick from multiple threads; each worker
+        # returns its own signals and results are merged on this thread
+        futures = [thread_pool.submit(process_market_tick_worker) for _ in range(_WORKERS)]
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        assert not errors
+
+        all_signals = []
+        for f in futures:
+            all_signals.extend(f.result())
         
         # Should only have one signal emitted despite concurrent processing
         assert len(all_signals) == 1
@@ -246,38 +265,17 @@ class TestFullPipelineIdempotency:
         assert all_signals[0]["state"] == "triggered"
         
         # Verify only one signal in database
-        stored_signals = self.signal_store.get_signals_by_plan(plan_id)
-        assert len(stored_signals) == 1
+        assert self.signal_store.count_by_plan(plan_id) == 1
     
-    def test_cross_session_idempotency(self):
+    def test_cross_session_idempotency(self, mock_metrics):
         """Test idempotency across different engine sessions."""
         plan_id = self.sample_plan["id"]
         
-        # Mock metrics
-        mock_metrics = Mock()
-        mock_metrics.rvol = 2.0
-        mock_metrics.natr_pct = 0.5
-        mock_metrics.atr = 100.0
-        mock_metrics.pinbar = None
-        mock_metrics.ob_sweep_detected = False
-        mock_metrics.ob_sweep_side = None
-        mock_metrics.ob_imbalance_long = 0.6
-        mock_metrics.ob_imbalance_short = 0.4
-        
-        # Triggering market data
-        triggering_data = {
-            "timestamp": "2023-01-01T12:00:00Z",
-            "last_price": 50100.0,
-            "candlestick": self.sample_candlestick,
-            "order_book": self.sample_order_book
-        }
-        
         # First session - emit signal
-        with patch.object(self.engine, '_calculate_metrics', return_value=mock_metrics):
-            signals1 = self.state_manager.process_market_tick(
-                [self.sample_plan], triggering_data, {plan_id: mock_metrics}, 
-                {plan_id: BreakoutParameters()}
-            )
+        signals1 = self.state_manager.process_market_tick(
+            [self.sample_plan], _TRIGGERING_DATA, {plan_id: mock_metrics}, 
+            {plan_id: BreakoutParameters()}
+        )
         
         assert len(signals1) == 1
         
@@ -286,68 +284,38 @@ class TestFullPipelineIdempotency:
         new_signal_emitter = SignalEmitter(delivery_config=SignalDeliveryConfig(
             enabled=True, destinations=[]
         ))
+        new_signal_emitter.signal_store = self.signal_store
         new_state_manager.signal_emitter = new_signal_emitter
         
         # Second session - should not emit duplicate
-        with patch.object(self.engine, '_calculate_metrics', return_value=mock_metrics):
-            signals2 = new_state_manager.process_market_tick(
-                [self.sample_plan], triggering_data, {plan_id: mock_metrics}, 
-                {plan_id: BreakoutParameters()}
-            )
+        signals2 = new_state_manager.process_market_tick(
+            [self.sample_plan], _TRIGGERING_DATA, {plan_id: mock_metrics}, 
+            {plan_id: BreakoutParameters()}
+        )
         
         # Should not emit duplicate (relies on database constraint)
         assert len(signals2) == 0
         
         # Verify only one signal in database
-        stored_signals = self.signal_store.get_signals_by_plan(plan_id)
-        assert len(stored_signals) == 1
+        assert self.signal_store.count_by_plan(plan_id) == 1
     
-    def test_multiple_plans_idempotency_isolation(self):
+    def test_multiple_plans_idempotency_isolation(self, mock_metrics, three_plans):
         """Test that idempotency is properly isolated between different plans."""
-        # Create multiple plans
-        plan1 = self.sample_plan.copy()
-        plan1["id"] = "test-plan-1"
-        
-        plan2 = self.sample_plan.copy()
-        plan2["id"] = "test-plan-2"
-        
-        plan3 = self.sample_plan.copy()
-        plan3["id"] = "test-plan-3"
-        
-        plans = [plan1, plan2, plan3]
-        
-        # Mock metrics
-        mock_metrics = Mock()
-        mock_metrics.rvol = 2.0
-        mock_metrics.natr_pct = 0.5
-        mock_metrics.atr = 100.0
-        mock_metrics.pinbar = None
-        mock_metrics.ob_sweep_detected = False
-        mock_metrics.ob_sweep_side = None
-        mock_metrics.ob_imbalance_long = 0.6
-        mock_metrics.ob_imbalance_short = 0.4
-        
-        # Triggering market data
-        triggering_data = {
-            "timestamp": "2023-01-01T12:00:00Z",
-            "last_price": 50100.0,
-            "candlestick": self.sample_candlestick,
-            "order_book": self.sample_order_book
-        }
+        plans = three_plans
         
-        # Create metrics and config for all plans
-        metrics_by_plan = {plan["id"]: mock_metrics for plan in plans}
-        config_by_plan = {plan["id"]: BreakoutParameters() for plan in plans}
+        # Same metrics and config for all plans
+        metrics_by_plan = dict.fromkeys(self._PLAN_IDS, mock_metrics)
+        with pytest.raises(FrozenInstanceError):
+            self._SHARED_PARAMS.min_rvol = 0.0
         
         # Process multiple times
         all_signals = []
         
-        with patch.object(self.engine, '_calculate_metrics', return_value=mock_metrics):
-            for i in range(3):
-                signals = self.state_manager.process_market_tick(
-                    plans, triggering_data, metrics_by_plan, config_by_plan
-                )
-                all_signals.extend(signals)
+        for i in range(3):
+            signals = self.state_manager.process_market_tick(
+                plans, _TRIGGERING_DATA, metrics_by_plan, self._CONFIG_BY_PLAN
+            )
+            all_signals.extend(signals)
         
         # Should have exactly 3 signals (one per plan, no duplicates)
         assert len(all_signals) == 3
@@ -359,41 +327,17 @@ class TestFullPipelineIdempotency:
         assert "test-plan-3" in plan_ids
         
         # Verify database storage
-        for plan_id in ["test-plan-1", "test-plan-2", "test-plan-3"]:
+        for plan_id in self._PLAN_IDS:
             stored_signals = self.signal_store.get_signals_by_plan(plan_id)
             assert len(stored_signals) == 1
             assert stored_signals[0].state == "triggered"
     
-    def test_timestamp_based_duplicate_prevention(self):
+    def test_timestamp_based_duplicate_prevention(self, mock_metrics):
         """Test that signals with same plan/state but different timestamps are allowed."""
         plan_id = self.sample_plan["id"]
         
-        # Mock metrics
-        mock_metrics = Mock()
-        mock_metrics.rvol = 2.0
-        mock_metrics.natr_pct = 0.5
-        mock_metrics.atr = 100.0
-        mock_metrics.pinbar = None
-        mock_metrics.ob_sweep_detected = False
-        mock_metrics.ob_sweep_side = None
-        mock_metrics.ob_imbalance_long = 0.6
-        mock_metrics.ob_imbalance_short = 0.4
-        
-        # First triggering data
-        triggering_data1 = {
-            "timestamp": "2023-01-01T12:00:00Z",
-            "last_price": 50100.0,
-            "candlestick": self.sample_candlestick,
-            "order_book": self.sample_order_book
-        }
-        
         # Second triggering data (different timestamp)
-        triggering_data2 = {
-            "timestamp": "2023-01-01T12:01:00Z",
-            "last_price": 50100.0,
-            "candlestick": self.sample_candlestick,
-            "order_book": self.sample_order_book
-        }
+        later_triggering_data = dict(_TRIGGERING_DATA, timestamp=_TICK_TS + timedelta(minutes=1))
         
         # Clear plan state to allow multiple triggerings
         self.state_manager.clear_plan_state(plan_id)
@@ -401,10 +345,11 @@ class TestFullPipelineIdempotency:
         # Process both timestamps
         all_signals = []
         
-        with patch.object(self.engine, '_calculate_metrics', return_value=mock_metrics):
+        # Both ticks are written in a single store transaction
+        with self.signal_store.transaction():
             # First timestamp
             signals1 = self.state_manager.process_market_tick(
-                [self.sample_plan], triggering_data1, {plan_id: mock_metrics}, 
+                [self.sample_plan], _TRIGGERING_DATA, {plan_id: mock_metrics}, 
                 {plan_id: BreakoutParameters()}
             )
             all_signals.extend(signals1)
@@ -414,7 +359,7 @@ class TestFullPipelineIdempotency:
             
             # Second timestamp
             signals2 = self.state_manager.process_market_tick(
-                [self.sample_plan], triggering_data2, {plan_id: mock_metrics}, 
+                [self.sample_plan], later_triggering_data, {plan_id: mock_metrics}, 
                 {plan_id: BreakoutParameters()}
             )
             all_signals.extend(signals2)
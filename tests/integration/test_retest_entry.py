@@ -0,0 +1,78 @@
+"""Integration test for a breakout plan entering on a retest."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from ta2_app.data.models import Candle
+from ta2_app.models.metrics import MetricsSnapshot
+from ta2_app.state.models import BreakoutParameters, BreakoutSubState, PlanLifecycleState
+from ta2_app.state.runtime import StateManager
+from ta2_app.validation.signal_schema import validate_signal
+
+RETEST_CONFIG = BreakoutParameters(
+    allow_retest_entry=True,
+    retest_band_pct=0.03,
+    ob_sweep_check=False,
+    min_break_range_atr=0.0
+)
+
+
+@pytest.mark.integration
+def test_long_plan_triggers_on_retest() -> None:
+    """Test break seen, break confirmed into RETEST_ARMED, then a retest entry signal."""
+    manager = StateManager()
+    start = datetime.now(timezone.utc) - timedelta(minutes=3)
+    plan = {
+        "id": "retest-long-001",
+        "instrument_id": "BTC-USDT-SWAP",
+        "direction": "long",
+        "entry_price": 100.0,
+        "created_at": start
+    }
+
+    def tick(price, seconds, bar=None, **metrics):
+        ts = start + timedelta(seconds=seconds)
+        snapshot = MetricsSnapshot(timestamp=ts, natr_pct=1.0, atr=1.0, **metrics)
+        signals = manager.process_market_tick(
+            active_plans=[plan],
+            market_data={"last_price": price, "timestamp": ts, "last_closed_bar": bar},
+            metrics_by_plan={plan["id"]: snapshot},
+            config_by_plan={plan["id"]: RETEST_CONFIG}
+        )
+        return signals, manager.get_plan_state(plan["id"])
+
+    # Price penetrates 5% past the level
+    signals, state = tick(106.0, 0, rvol=2.0)
+    assert signals == []
+    assert (state.state, state.substate) == (PlanLifecycleState.PENDING, BreakoutSubState.BREAK_SEEN)
+
+    # Bar closes beyond the level on volume: armed for a retest, not triggered
+    close_bar = Candle(
+        ts=start + timedelta(seconds=60), open=104.0, high=107.0, low=103.0, close=106.0,
+        volume=10.0, is_closed=True
+    )
+    signals, state = tick(106.0, 60, bar=close_bar, rvol=2.0)
+    assert signals == []
+    assert (state.state, state.substate) == (PlanLifecycleState.ARMED, BreakoutSubState.RETEST_ARMED)
+    assert state.break_confirmed
+
+    # Outside the retest band nothing happens
+    signals, state = tick(105.0, 90, rvol=0.5, pinbar="bullish")
+    assert signals == []
+    assert state.substate == BreakoutSubState.RETEST_ARMED
+
+    # Back at the level with a bullish pinbar on low volume: retest entry
+    signals, state = tick(101.0, 120, rvol=0.5, pinbar="bullish")
+    assert (state.state, state.substate) == (PlanLifecycleState.TRIGGERED, BreakoutSubState.RETEST_TRIGGERED)
+    assert len(signals) == 1
+    signal = signals[0]
+    assert signal["state"] == "triggered"
+    assert signal["entry_mode"] == "retest"
+    assert signal["runtime"]["substate"] == "retest_triggered"
+    assert signal["metrics"]["pinbar_type"] == "bullish"
+    assert validate_signal(signal)
+
+    # Terminal state: later ticks emit nothing
+    signals, _ = tick(101.0, 150, rvol=0.5, pinbar="bullish")
+    assert signals == []
@@ -1,91 +1,213 @@
 """Integration tests for state machine with metrics pipeline."""
 
 import pytest
-from datetime import datetime, timezone, timedelta
-from unittest.mock import Mock, patch
+from datetime import datetime, timezone
+from typing import Any, Iterator, Optional
 
 from ta2_app.engine import BreakoutEvaluationEngine
-from ta2_app.state.models import PlanLifecycleState, BreakoutSubState
-from ta2_app.data.models import Candle, BookSnap, BookLevel
-from ta2_app.models.metrics import MetricsSnapshot
+
+
+# Plan creation time, read once at import so every plan shares it
+NOW = datetime.now(timezone.utc)
+
+_BASE_BREAKOUT_PARAMS = {"penetration_pct": 0.05, "min_rvol": 1.5, "confirm_close": True}
+
+# Complete breakout_params per scenario; plans share these dicts (the engine only reads them)
+MOMENTUM_PARAMS = {**_BASE_BREAKOUT_PARAMS, "allow_retest_entry": False, "ob_sweep_check": True}
+RETEST_PARAMS = {
+    **_BASE_BREAKOUT_PARAMS,
+    "penetration_pct": 0.04,
+    "min_rvol": 1.8,
+    "allow_retest_entry": True,
+    "retest_band_pct": 0.02,
+    "ob_sweep_check": True
+}
+FAKEOUT_PARAMS = {**_BASE_BREAKOUT_PARAMS, "fakeout_close_invalidate": True, "ob_sweep_check": False}
+HIGH_VOL_PARAMS = {**_BASE_BREAKOUT_PARAMS, "min_rvol": 5.0, "ob_sweep_check": False}
+
+_BASE_PLAN = {
+    "instrument_id": "BTC-USDT-SWAP",
+    "direction": "long",
+    "entry_type": "breakout",
+    "entry_price": 50000.0
+}
+
+
+def _make_plan(
+    plan_id: str, breakout_params: Optional[dict] = None, **overrides: Any
+) -> dict:
+    """
+    Build a breakout plan from the module defaults.
+
+    breakout_params, when given, is a complete parameter set (one of the
+    *_PARAMS presets) placed in extra_data; other keyword arguments replace
+    top-level plan fields.
+    """
+    plan = {**_BASE_PLAN, "id": plan_id, "created_at": NOW}
+    if breakout_params is not None:
+        plan["extra_data"] = {"breakout_params": breakout_params}
+    plan.update(overrides)
+    return plan
+
+
+def _make_candle_payload(
+    ts: int, o: float, h: float, l: float, c: float, v: float, vq: float
+) -> dict:
+    """
+    Exchange candlestick payload holding a single confirmed bar.
+
+    Fields are native numbers rather than wire strings; the parser accepts both.
+    """
+    return {"code": "0", "msg": "", "data": [[ts, o, h, l, c, v, vq, vq, 1]]}
+
+
+# Market data payloads, built once; the engine only reads them.
+# Candle args: ts, open, high, low, close, volume, quote volume
+PAYLOAD_NO_BREAK = _make_candle_payload(
+    1597026383085, 49800.0, 49900.0, 49700.0, 49800.0, 1000.0, 49800000.0
+)
+PAYLOAD_BTC_FLAT = _make_candle_payload(
+    1597026383085, 50000.0, 50100.0, 49900.0, 50000.0, 1000.0, 50000000.0
+)
+PAYLOAD_BTC_ABOVE_INVALIDATION = _make_candle_payload(
+    1597026383085, 50000.0, 56000.0, 49900.0, 56000.0, 1000.0, 56000000.0
+)
+PAYLOAD_BTC_BREAK_LOW_VOLUME = _make_candle_payload(
+    1597026383085, 50000.0, 52800.0, 49900.0, 52500.0, 100.0, 5250000.0
+)
+PAYLOAD_BTC_BREAK_AVG_VOLUME = _make_candle_payload(
+    1597026383085, 50000.0, 52800.0, 49900.0, 52500.0, 1000.0, 52500000.0
+)
+PAYLOAD_BTC_BREAK_FIRST_BAR = _make_candle_payload(
+    1597026383085, 50000.0, 52800.0, 49900.0, 52500.0, 3000.0, 156000000.0
+)
+PAYLOAD_BTC_BREAK = _make_candle_payload(
+    1597026383185, 50000.0, 52800.0, 49900.0, 52500.0, 3000.0, 156000000.0
+)
+PAYLOAD_BTC_BREAK_FIRST_LEVEL = _make_candle_payload(
+    1597026383085, 50000.0, 51000.0, 49900.0, 51000.0, 3000.0, 153000000.0
+)
+# Breaks above but closes back below the entry level
+PAYLOAD_BTC_FAKEOUT = _make_candle_payload(
+    1597026383185, 50000.0, 52800.0, 49000.0, 49500.0, 1000.0, 50000000.0
+)
+PAYLOAD_ETH_BREAK_DOWN = _make_candle_payload(
+    1597026383085, 3000.0, 3010.0, 2870.0, 2880.0, 5000.0, 14500000.0
+)
+PAYLOAD_ETH_RETEST = _make_candle_payload(
+    1597026383285, 2880.0, 2980.0, 2870.0, 2940.0, 2000.0, 5840000.0
+)
+
+ORDERBOOK_BTC_BID_SWEEP = {
+    "code": "0",
+    "msg": "",
+    "data": [{
+        "asks": [[52600.0, 10.0, 0, 1]],
+        "bids": [[52400.0, 50.0, 0, 2]],  # Strong bid after sweep
+        "ts": 1597026383185
+    }]
+}
+
+ORDERBOOK_ETH_ASK_SWEEP = {
+    "code": "0",
+    "msg": "",
+    "data": [{
+        "asks": [[2890.0, 100.0, 0, 1]],  # Strong ask after sweep
+        "bids": [[2880.0, 20.0, 0, 2]],
+        "ts": 1597026383085
+    }]
+}
+
+
+# Single-plan, single-tick scenarios:
+# (plan, candlestick payload, expected (plan_id, state, invalid_reason) per signal,
+#  expected plan state fields after the tick or None)
+BREAKOUT_CASES = [
+    pytest.param(
+        _make_plan(
+            "test-expired-001",
+            # Created 2 hours ago with a 1 hour limit
+            created_at=None,
+            created_at_epoch=int(NOW.timestamp()) - 7200,
+            extra_data={
+                "invalidation_conditions": [
+                    {"condition_type": "time_limit", "duration_seconds": 3600}  # 1 hour
+                ]
+            }
+        ),
+        # Any price tick should trigger time invalidation
+        PAYLOAD_BTC_FLAT,
+        [("test-expired-001", "invalid", "time_limit")],
+        None,
+        id="time_limit_invalidation",
+    ),
+    pytest.param(
+        _make_plan(
+            "test-price-invalid-001",
+            extra_data={
+                "invalidation_conditions": [
+                    {"condition_type": "price_above", "level": 55000.0},
+                    {"condition_type": "price_below", "level": 45000.0}
+                ]
+            }
+        ),
+        # Price above upper invalidation level
+        PAYLOAD_BTC_ABOVE_INVALIDATION,
+        [("test-price-invalid-001", "invalid", "price_above")],
+        None,
+        id="price_invalidation_conditions",
+    ),
+    pytest.param(
+        _make_plan(
+            "test-volume-001",
+            breakout_params=HIGH_VOL_PARAMS  # Very high volume requirement
+        ),
+        # Price breaks but with low volume; the volume gate blocks confirmation
+        PAYLOAD_BTC_BREAK_LOW_VOLUME,
+        [],
+        {"state": "pending", "substate": "break_seen", "break_seen": True, "break_confirmed": False},
+        id="insufficient_volume_blocks_confirmation",
+    ),
+]
+
+
+@pytest.fixture
+def fresh_engine() -> Iterator[BreakoutEvaluationEngine]:
+    """Dedicated engine for tests that assert engine-wide state."""
+    engine = BreakoutEvaluationEngine()
+    yield engine
+    for plan in list(engine.active_plans):
+        engine.remove_plan(plan['id'])
 
 
 class TestBreakoutStateIntegration:
     """Integration tests for complete breakout state machine pipeline."""
 
-    def test_full_long_breakout_momentum_flow(self):
+    @pytest.mark.integration
+    def test_full_long_breakout_momentum_flow(self, engine: BreakoutEvaluationEngine) -> None:
         """Test complete long breakout flow in momentum mode."""
-        engine = BreakoutEvaluationEngine()
-        
         # Add a long breakout plan
-        plan = {
-            "id": "test-long-001",
-            "instrument_id": "BTC-USDT-SWAP",
-            "direction": "long",
-            "entry_type": "breakout",
-            "entry_price": 50000.0,
-            "created_at": datetime.now(timezone.utc),
-            "extra_data": {
-                "breakout_params": {
-                    "penetration_pct": 0.05,
-                    "min_rvol": 1.5,
-                    "confirm_close": True,
-                    "allow_retest_entry": False,  # Momentum mode
-                    "ob_sweep_check": True
-                }
-            }
-        }
+        plan = _make_plan(
+            "test-long-001",
+            breakout_params=MOMENTUM_PARAMS
+        )
         
         engine.add_plan(plan)
         
-        # Step 1: Price below entry - no break
-        candlestick_payload = {
-            "code": "0",
-            "msg": "",
-            "data": [
-                ["1597026383085", "49800.0", "49900.0", "49700.0", "49800.0", "1000", "49800000", "49800000", "1"]
-            ]
-        }
-        
-        signals = engine.evaluate_tick(
-            candlestick_payload=candlestick_payload,
-            instrument_id="BTC-USDT-SWAP"
-        )
-        
-        # Should have no signals - no break detected
-        assert len(signals) == 0
+        no_break_signals, signals = engine.evaluate_ticks([
+            # Step 1: Price below entry - no break
+            {"candlestick_payload": PAYLOAD_NO_BREAK, "instrument_id": "BTC-USDT-SWAP"},
+            # Step 2: Price breaks above entry level with high volume
+            # Process both candlestick and order book
+            {
+                "candlestick_payload": PAYLOAD_BTC_BREAK,
+                "orderbook_payload": ORDERBOOK_BTC_BID_SWEEP,
+                "instrument_id": "BTC-USDT-SWAP"
+            },
+        ])
         
-        # Check state is still PENDING
-        state = engine.get_plan_state("test-long-001")
-        assert state["state"] == "pending"
-        assert state["substate"] == "none"
-        
-        # Step 2: Price breaks above entry level with high volume
-        candlestick_payload = {
-            "code": "0",
-            "msg": "",
-            "data": [
-                ["1597026383185", "50000.0", "52800.0", "49900.0", "52500.0", "3000", "156000000", "156000000", "1"]
-            ]
-        }
-        
-        # Mock order book with sweep
-        orderbook_payload = {
-            "code": "0",
-            "msg": "",
-            "data": [{
-                "asks": [["52600.0", "10.0", "0", "1"]],
-                "bids": [["52400.0", "50.0", "0", "2"]],  # Strong bid after sweep
-                "ts": "1597026383185"
-            }]
-        }
-        
-        # Process both candlestick and order book
-        signals = engine.evaluate_tick(
-            candlestick_payload=candlestick_payload,
-            orderbook_payload=orderbook_payload,
-            instrument_id="BTC-USDT-SWAP"
-        )
+        # Should have no signals on the first tick - no break detected
+        assert len(no_break_signals) == 0
         
         # Should emit triggered signal
         assert len(signals) == 1
@@ -105,56 +227,27 @@ class TestBreakoutStateIntegration:
         assert state["break_confirmed"] is True
         assert state["signal_emitted"] is True
 
-    def test_full_short_breakout_retest_flow(self):
+    @pytest.mark.integration
+    def test_full_short_breakout_retest_flow(
+        self, engine: BreakoutEvaluationEngine, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test complete short breakout flow with retest mode."""
-        engine = BreakoutEvaluationEngine()
-        
         # Add a short breakout plan with retest enabled
-        plan = {
-            "id": "test-short-001",
-            "instrument_id": "ETH-USDT-SWAP",
-            "direction": "short",
-            "entry_type": "breakout",
-            "entry_price": 3000.0,
-            "created_at": datetime.now(timezone.utc),
-            "extra_data": {
-                "breakout_params": {
-                    "penetration_pct": 0.04,
-                    "min_rvol": 1.8,
-                    "confirm_close": True,
-                    "allow_retest_entry": True,  # Retest mode
-                    "retest_band_pct": 0.02,
-                    "ob_sweep_check": True
-                }
-            }
-        }
+        plan = _make_plan(
+            "test-short-001",
+            instrument_id="ETH-USDT-SWAP",
+            direction="short",
+            entry_price=3000.0,
+            breakout_params=RETEST_PARAMS
+        )
         
         engine.add_plan(plan)
         
         # Step 1: Price breaks below entry level
-        candlestick_payload = {
-            "code": "0",
-            "msg": "",
-            "data": [
-                ["1597026383085", "3000.0", "3010.0", "2870.0", "2880.0", "5000", "14500000", "14500000", "1"]
-            ]
-        }
-        
-        # Order book showing ask sweep
-        orderbook_payload = {
-            "code": "0",
-            "msg": "",
-            "data": [{
-                "asks": [["2890.0", "100.0", "0", "1"]],  # Strong ask after sweep
-                "bids": [["2880.0", "20.0", "0", "2"]],
-                "ts": "1597026383085"
-            }]
-        }
-        
         # Process break
         signals = engine.evaluate_tick(
-            candlestick_payload=candlestick_payload,
-            orderbook_payload=orderbook_payload,
+            candlestick_payload=PAYLOAD_ETH_BREAK_DOWN,
+            orderbook_payload=ORDERBOOK_ETH_ASK_SWEEP,
             instrument_id="ETH-USDT-SWAP"
         )
         
@@ -167,22 +260,14 @@ class TestBreakoutStateIntegration:
         assert state["substate"] == "retest_armed"
         
         # Step 2: Price retests back toward entry level
-        candlestick_payload = {
-            "code": "0",
-            "msg": "",
-            "data": [
-                ["1597026383285", "2880.0", "2980.0", "2870.0", "2940.0", "2000", "5840000", "5840000", "1"]
-            ]
-        }
-        
-        # Mock bearish pinbar for rejection
-        with patch('ta2_app.metrics.candle_structure.detect_pinbar') as mock_pinbar:
-            mock_pinbar.return_value = 'bearish'
-            
-            signals = engine.evaluate_tick(
-                candlestick_payload=candlestick_payload,
-                instrument_id="ETH-USDT-SWAP"
-            )
+        # Force a bearish pinbar for rejection (undone at fixture teardown)
+        monkeypatch.setattr(
+            "ta2_app.metrics.candle_structure.detect_pinbar", lambda *a, **kw: "bearish"
+        )
+        signals = engine.evaluate_tick(
+            candlestick_payload=PAYLOAD_ETH_RETEST,
+            instrument_id="ETH-USDT-SWAP"
+        )
         
         # Should now trigger on retest
         assert len(signals) == 1
@@ -199,42 +284,20 @@ class TestBreakoutStateIntegration:
         assert state["state"] == "triggered"
         assert state["substate"] == "retest_triggered"
 
-    def test_fakeout_invalidation_flow(self):
+    @pytest.mark.integration
+    def test_fakeout_invalidation_flow(self, engine: BreakoutEvaluationEngine) -> None:
         """Test fakeout invalidation during confirmation phase."""
-        engine = BreakoutEvaluationEngine()
-        
         # Add plan with fakeout invalidation enabled
-        plan = {
-            "id": "test-fakeout-001",
-            "instrument_id": "BTC-USDT-SWAP",
-            "direction": "long",
-            "entry_type": "breakout",
-            "entry_price": 50000.0,
-            "created_at": datetime.now(timezone.utc),
-            "extra_data": {
-                "breakout_params": {
-                    "penetration_pct": 0.05,
-                    "min_rvol": 1.5,
-                    "confirm_close": True,
-                    "fakeout_close_invalidate": True,
-                    "ob_sweep_check": False  # Disable for simplicity
-                }
-            }
-        }
+        plan = _make_plan(
+            "test-fakeout-001",
+            breakout_params=FAKEOUT_PARAMS
+        )
         
         engine.add_plan(plan)
         
         # Step 1: Price breaks above entry level
-        candlestick_payload = {
-            "code": "0",
-            "msg": "",
-            "data": [
-                ["1597026383085", "50000.0", "52800.0", "49900.0", "52500.0", "3000", "156000000", "156000000", "1"]
-            ]
-        }
-        
         signals = engine.evaluate_tick(
-            candlestick_payload=candlestick_payload,
+            candlestick_payload=PAYLOAD_BTC_BREAK_FIRST_BAR,
             instrument_id="BTC-USDT-SWAP"
         )
         
@@ -243,37 +306,16 @@ class TestBreakoutStateIntegration:
         assert signals[0]["state"] == "triggered"
         
         # Now test fakeout scenario with new plan
-        plan_fakeout = {
-            "id": "test-fakeout-002",
-            "instrument_id": "BTC-USDT-SWAP",
-            "direction": "long",
-            "entry_type": "breakout",
-            "entry_price": 50000.0,
-            "created_at": datetime.now(timezone.utc),
-            "extra_data": {
-                "breakout_params": {
-                    "penetration_pct": 0.05,
-                    "min_rvol": 0.5,  # Lower requirement
-                    "confirm_close": True,
-                    "fakeout_close_invalidate": True,
-                    "ob_sweep_check": False
-                }
-            }
-        }
+        plan_fakeout = _make_plan(
+            "test-fakeout-002",
+            breakout_params={**FAKEOUT_PARAMS, "min_rvol": 0.5}  # Lower requirement
+        )
         
         engine.add_plan(plan_fakeout)
         
         # Step 1: Price breaks above but then closes back below (fakeout)
-        candlestick_payload = {
-            "code": "0",
-            "msg": "",
-            "data": [
-                ["1597026383185", "50000.0", "52800.0", "49000.0", "49500.0", "1000", "50000000", "50000000", "1"]
-            ]
-        }
-        
         signals = engine.evaluate_tick(
-            candlestick_payload=candlestick_payload,
+            candlestick_payload=PAYLOAD_BTC_FAKEOUT,
             instrument_id="BTC-USDT-SWAP"
         )
         
@@ -285,149 +327,58 @@ class TestBreakoutStateIntegration:
         assert signal["state"] == "invalid"
         assert signal["runtime"]["invalid_reason"] == "fakeout_close"
 
-    def test_time_limit_invalidation(self):
-        """Test time limit invalidation."""
-        engine = BreakoutEvaluationEngine()
-        
-        # Create plan with short time limit
-        old_time = datetime.now(timezone.utc) - timedelta(hours=2)
-        plan = {
-            "id": "test-expired-001",
-            "instrument_id": "BTC-USDT-SWAP",
-            "direction": "long",
-            "entry_type": "breakout",
-            "entry_price": 50000.0,
-            "created_at": old_time,
-            "extra_data": {
-                "invalidation_conditions": [
-                    {"condition_type": "time_limit", "duration_seconds": 3600}  # 1 hour
-                ]
-            }
-        }
-        
-        engine.add_plan(plan)
-        
-        # Any price tick should trigger time invalidation
-        candlestick_payload = {
-            "code": "0",
-            "msg": "",
-            "data": [
-                ["1597026383085", "50000.0", "50100.0", "49900.0", "50000.0", "1000", "50000000", "50000000", "1"]
-            ]
-        }
-        
-        signals = engine.evaluate_tick(
-            candlestick_payload=candlestick_payload,
-            instrument_id="BTC-USDT-SWAP"
-        )
-        
-        # Should emit invalid signal due to time limit
-        assert len(signals) == 1
-        signal = signals[0]
-        
-        assert signal["plan_id"] == "test-expired-001"
-        assert signal["state"] == "invalid"
-        assert signal["runtime"]["invalid_reason"] == "time_limit"
-
-    def test_price_invalidation_conditions(self):
-        """Test price-based invalidation conditions."""
-        engine = BreakoutEvaluationEngine()
-        
-        # Add plan with price invalidation conditions
-        plan = {
-            "id": "test-price-invalid-001",
-            "instrument_id": "BTC-USDT-SWAP",
-            "direction": "long",
-            "entry_type": "breakout",
-            "entry_price": 50000.0,
-            "created_at": datetime.now(timezone.utc),
-            "extra_data": {
-                "invalidation_conditions": [
-                    {"condition_type": "price_above", "level": 55000.0},
-                    {"condition_type": "price_below", "level": 45000.0}
-                ]
-            }
-        }
-        
+    @pytest.mark.integration
+    @pytest.mark.parametrize(
+        "plan,candlestick_payload,expected_signals,expected_state", BREAKOUT_CASES
+    )
+    def test_breakout_scenario(
+        self,
+        engine: BreakoutEvaluationEngine,
+        plan: dict,
+        candlestick_payload: dict,
+        expected_signals: list,
+        expected_state
+    ) -> None:
+        """Test a single tick against a single plan."""
+        plans_before = engine.get_runtime_stats()["active_plans"]
         engine.add_plan(plan)
-        
-        # Price above upper invalidation level
-        candlestick_payload = {
-            "code": "0",
-            "msg": "",
-            "data": [
-                ["1597026383085", "50000.0", "56000.0", "49900.0", "56000.0", "1000", "56000000", "56000000", "1"]
-            ]
-        }
-        
+        stats = engine.get_runtime_stats()
+        assert stats["active_plans"] == plans_before + 1
+        assert stats["tracked_instruments"] >= 1
+
         signals = engine.evaluate_tick(
             candlestick_payload=candlestick_payload,
-            instrument_id="BTC-USDT-SWAP"
+            instrument_id=plan["instrument_id"]
         )
-        
-        # Should emit invalid signal due to price above
-        assert len(signals) == 1
-        signal = signals[0]
-        
-        assert signal["plan_id"] == "test-price-invalid-001"
-        assert signal["state"] == "invalid"
-        assert signal["runtime"]["invalid_reason"] == "price_above"
 
-    def test_multiple_plans_same_instrument(self):
+        assert [
+            (signal["plan_id"], signal["state"], signal["runtime"].get("invalid_reason"))
+            for signal in signals
+        ] == expected_signals
+
+        if expected_state is not None:
+            state = engine.get_plan_state(plan["id"])
+            for field, value in expected_state.items():
+                assert state[field] == value
+
+    @pytest.mark.unit
+    def test_multiple_plans_same_instrument(self, engine: BreakoutEvaluationEngine) -> None:
         """Test multiple plans on same instrument evaluate independently."""
-        engine = BreakoutEvaluationEngine()
-        
         # Add two plans with different entry levels
-        plan1 = {
-            "id": "test-multi-001",
-            "instrument_id": "BTC-USDT-SWAP",
-            "direction": "long",
-            "entry_type": "breakout",
-            "entry_price": 50000.0,
-            "created_at": datetime.now(timezone.utc),
-            "extra_data": {
-                "breakout_params": {
-                    "penetration_pct": 0.05,
-                    "min_rvol": 1.5,
-                    "confirm_close": True,
-                    "allow_retest_entry": False,
-                    "ob_sweep_check": False
-                }
-            }
-        }
-        
-        plan2 = {
-            "id": "test-multi-002",
-            "instrument_id": "BTC-USDT-SWAP",
-            "direction": "long",
-            "entry_type": "breakout",
-            "entry_price": 52000.0,  # Higher entry level
-            "created_at": datetime.now(timezone.utc),
-            "extra_data": {
-                "breakout_params": {
-                    "penetration_pct": 0.05,
-                    "min_rvol": 1.5,
-                    "confirm_close": True,
-                    "allow_retest_entry": False,
-                    "ob_sweep_check": False
-                }
-            }
-        }
+        params = {**MOMENTUM_PARAMS, "ob_sweep_check": False}
+        plan1 = _make_plan("test-multi-001", breakout_params=params)
+        
+        plan2 = _make_plan(
+            "test-multi-002",
+            entry_price=52000.0,  # Higher entry level
+            breakout_params=params
+        )
         
-        engine.add_plan(plan1)
-        engine.add_plan(plan2)
+        engine.add_plans([plan1, plan2])
         
         # Price breaks first level but not second
-        candlestick_payload = {
-            "code": "0",
-            "msg": "",
-            "data": [
-                ["1597026383085", "50000.0", "51000.0", "49900.0", "51000.0", "3000", "153000000", "153000000", "1"]
-            ]
-        }
-        
         signals = engine.evaluate_tick(
-            candlestick_payload=candlestick_payload,
+            candlestick_payload=PAYLOAD_BTC_BREAK_FIRST_LEVEL,
             instrument_id="BTC-USDT-SWAP"
         )
         
@@ -443,154 +394,37 @@ class TestBreakoutStateIntegration:
         assert state1["state"] == "triggered"
         assert state2["state"] == "pending"  # Still waiting
 
-    def test_insufficient_volume_blocks_confirmation(self):
-        """Test that insufficient volume blocks confirmation."""
-        engine = BreakoutEvaluationEngine()
-        
-        # Add plan with high volume requirement
-        plan = {
-            "id": "test-volume-001",
-            "instrument_id": "BTC-USDT-SWAP",
-            "direction": "long",
-            "entry_type": "breakout",
-            "entry_price": 50000.0,
-            "created_at": datetime.now(timezone.utc),
-            "extra_data": {
-                "breakout_params": {
-                    "penetration_pct": 0.05,
-                    "min_rvol": 5.0,  # Very high volume requirement
-                    "confirm_close": True,
-                    "ob_sweep_check": False
-                }
-            }
-        }
-        
-        engine.add_plan(plan)
-        
-        # Price breaks but with low volume
-        candlestick_payload = {
-            "code": "0",
-            "msg": "",
-            "data": [
-                ["1597026383085", "50000.0", "52800.0", "49900.0", "52500.0", "100", "5250000", "5250000", "1"]
-            ]
-        }
-        
-        signals = engine.evaluate_tick(
-            candlestick_payload=candlestick_payload,
-            instrument_id="BTC-USDT-SWAP"
-        )
-        
-        # Should have no signals - volume gate blocks confirmation
-        assert len(signals) == 0
-        
-        # Check state is break seen but not confirmed
-        state = engine.get_plan_state("test-volume-001")
-        assert state["state"] == "pending"
-        assert state["substate"] == "break_seen"
-        assert state["break_seen"] is True
-        assert state["break_confirmed"] is False
-
-    def test_plan_removal_cleans_up_state(self):
+    @pytest.mark.unit
+    def test_plan_removal_cleans_up_state(self, fresh_engine: BreakoutEvaluationEngine) -> None:
         """Test that removing a plan cleans up its state."""
-        engine = BreakoutEvaluationEngine()
-        
         # Add plan
-        plan = {
-            "id": "test-cleanup-001",
-            "instrument_id": "BTC-USDT-SWAP",
-            "direction": "long",
-            "entry_type": "breakout",
-            "entry_price": 50000.0,
-            "created_at": datetime.now(timezone.utc)
-        }
+        plan = _make_plan("test-cleanup-001")
         
-        engine.add_plan(plan)
+        fresh_engine.add_plan(plan)
         
         # Process some data to create state
-        candlestick_payload = {
-            "code": "0",
-            "msg": "",
-            "data": [
-                ["1597026383085", "50000.0", "52800.0", "49900.0", "52500.0", "1000", "52500000", "52500000", "1"]
-            ]
-        }
-        
-        engine.evaluate_tick(
-            candlestick_payload=candlestick_payload,
+        fresh_engine.evaluate_tick(
+            candlestick_payload=PAYLOAD_BTC_BREAK_AVG_VOLUME,
             instrument_id="BTC-USDT-SWAP"
         )
         
         # Verify state exists
-        state = engine.get_plan_state("test-cleanup-001")
+        state = fresh_engine.get_plan_state("test-cleanup-001")
         assert state is not None
         
         # Remove plan
-        engine.remove_plan("test-cleanup-001")
+        fresh_engine.remove_plan("test-cleanup-001")
         
         # Verify state is cleaned up
-        state = engine.get_plan_state("test-cleanup-001")
+        state = fresh_engine.get_plan_state("test-cleanup-001")
         assert state is None
         
-        # Verify no more processing happens
-        signals = engine.evaluate_tick(
-            candlestick_payload=candlestick_payload,
-            instrument_id="BTC-USDT-SWAP"
-        )
-        assert len(signals) == 0
+        # Verify the plan is no longer evaluated
+        assert "test-cleanup-001" not in fresh_engine.active_plan_ids
 
-    def test_engine_runtime_stats(self):
-        """Test engine runtime statistics."""
-        engine = BreakoutEvaluationEngine()
-        
-        # Initial stats
-        stats = engine.get_runtime_stats()
+    @pytest.mark.unit
+    def test_initial_stats_empty(self, fresh_engine: BreakoutEvaluationEngine) -> None:
+        """Test a fresh engine reports no plans or instruments."""
+        stats = fresh_engine.get_runtime_stats()
         assert stats["active_plans"] == 0
         assert stats["tracked_instruments"] == 0
-        
-        # Add plans
-        plan1 = {
-            "id": "test-stats-001",
-            "instrument_id": "BTC-USDT-SWAP",
-            "direction": "long",
-            "entry_type": "breakout",
-            "entry_price": 50000.0,
-            "created_at": datetime.now(timezone.utc)
-        }
-        
-        plan2 = {
-            "id": "test-stats-002",
-            "instrument_id": "ETH-USDT-SWAP",
-            "direction": "short",
-            "entry_type": "breakout",
-            "entry_price": 3000.0,
-            "created_at": datetime.now(timezone.utc)
-        }
-        
-        engine.add_plan(plan1)
-        engine.add_plan(plan2)
-        
-        # Process data for both instruments
-        engine.evaluate_tick(
-            candlestick_payload={
-                "code": "0",
-                "msg": "",
-                "data": [["1597026383085", "50000.0", "50100.0", "49900.0", "50000.0", "1000", "50000000", "50000000", "1"]]
-            },
-            instrument_id="BTC-USDT-SWAP"
-        )
-        
-        engine.evaluate_tick(
-            candlestick_payload={
-                "code": "0",
-                "msg": "",
-                "data": [["1597026383085", "3000.0", "3010.0", "2990.0", "3000.0", "1000", "3000000", "3000000", "1"]]
-            },
-            instrument_id="ETH-USDT-SWAP"
-        )
-        
-        # Check updated stats
-        stats = engine.get_runtime_stats()
-        assert stats["active_plans"] == 2
-        assert stats["tracked_instruments"] == 2
-        assert stats["state_manager_active_plans"] == 2
\ No newline at end of file
@@ -7,7 +7,7 @@ that the system continues operating with graceful degradation.
 
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 import time
 
 from ta2_app.engine import BreakoutEvaluationEngine
@@ -23,10 +23,8 @@ from ta2_app.errors import (
 class TestSystemResilience:
     """Integration tests for system resilience under adverse conditions."""
 
-    def test_progressive_data_quality_degradation(self):
+    def test_progressive_data_quality_degradation(self, engine: BreakoutEvaluationEngine) -> None:
         """Test system handles progressive degradation of data quality."""
-        engine = BreakoutEvaluationEngine()
-        
         # Add test plan
         plan = {
             "id": "resilience_test_plan",
@@ -119,10 +117,8 @@ class TestSystemResilience:
         assert len(engine.active_plans) == 1
         assert engine.get_active_plan_count() == 1
 
-    def test_multiple_instrument_error_isolation(self):
+    def test_multiple_instrument_error_isolation(self, engine: BreakoutEvaluationEngine) -> None:
         """Test that errors in one instrument don't affect others."""
-        engine = BreakoutEvaluationEngine()
-        
         # Add plans for multiple instruments
         instruments = ["BTC-USD", "ETH-USD", "ADA-USD"]
         for instrument in instruments:
@@ -172,10 +168,8 @@ class TestSystemResilience:
         # All plans should still be active
         assert len(engine.active_plans) == 3
 
-    def test_high_frequency_error_scenarios(self):
+    def test_high_frequency_error_scenarios(self, engine: BreakoutEvaluationEngine) -> None:
         """Test system handles high frequency of errors without degradation."""
-        engine = BreakoutEvaluationEngine()
-        
         # Add test plan
         plan = {
             "id": "high_freq_test",
@@ -223,10 +217,8 @@ class TestSystemResilience:
         assert error_count > 0
         assert success_count > 0
 
-    def test_memory_stability_under_errors(self):
+    def test_memory_stability_under_errors(self, engine: BreakoutEvaluationEngine) -> None:
         """Test that repeated errors don't cause memory issues."""
-        engine = BreakoutEvaluationEngine()
-        
         # Add test plan
         plan = {
             "id": "memory_test",
@@ -274,10 +266,8 @@ class TestSystemResilience:
         )
         assert isinstance(signals, list)
 
-    def test_concurrent_error_scenarios(self):
+    def test_concurrent_error_scenarios(self, engine: BreakoutEvaluationEngine) -> None:
         """Test system handles concurrent processing with errors."""
-        engine = BreakoutEvaluationEngine()
-        
         # Add multiple plans
         for i in range(5):
             plan = {
@@ -338,10 +328,8 @@ class TestSystemResilience:
         # All plans should still be active
         assert len(engine.active_plans) == 5
 
-    def test_error_recovery_after_system_stress(self):
+    def test_error_recovery_after_system_stress(self, engine: BreakoutEvaluationEngine) -> None:
         """Test system can recover normal operation after stress conditions."""
-        engine = BreakoutEvaluationEngine()
-        
         # Add test plan
         plan = {
             "id": "recovery_test",
@@ -392,10 +380,8 @@ class TestSystemResilience:
         assert len(engine.active_plans) == 1
         assert engine.get_active_plan_count() == 1
 
-    def test_data_quality_monitoring_during_errors(self):
+    def test_data_quality_monitoring_during_errors(self, engine: BreakoutEvaluationEngine) -> None:
         """Test that data quality can be monitored during error conditions."""
-        engine = BreakoutEvaluationEngine()
-        
         # Add test plan
         plan = {
             "id": "quality_monitor_test",
@@ -462,10 +448,8 @@ class TestSystemResilience:
         assert runtime_stats["active_plans"] == 1
         assert runtime_stats["tracked_instruments"] >= 0
 
-    def test_error_context_preservation(self):
+    def test_error_context_preservation(self, engine: BreakoutEvaluationEngine) -> None:
         """Test that error context is preserved for debugging."""
-        engine = BreakoutEvaluationEngine()
-        
         # Add test plan
         plan = {
             "id": "context_test",
@@ -1,11 +1,13 @@
 """Integration tests for timestamp semantics and market time handling."""
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any
 
+from ta2_app.data.parsers import reset_parsing_metrics
 from ta2_app.engine import BreakoutEvaluationEngine
+from ta2_app.models.metrics import MetricsSnapshot
 from ta2_app.state.runtime import SignalEmitter
 from ta2_app.utils.time import get_market_time_with_latency
 
@@ -355,4 +357,36 @@ class TestTimestampSemantics:
                     # Verify they all use market time, not wall-clock time
                     expected_timestamp = market_time.isoformat()
                     assert all(ts == expected_timestamp for ts in timestamps), \
-                        "All signals should use market time, not wall-clock time"
\ No newline at end of file
+                        "All signals should use market time, not wall-clock time"
+
+    @pytest.mark.parametrize("debug_enabled", [False, True])
+    def test_latency_computed_only_when_debug_enabled(self, debug_enabled: bool) -> None:
+        """Test the market-time debug log only measures latency when DEBUG is enabled."""
+        # Earlier parse-failure tests can leave the shared circuit breaker tripped
+        reset_parsing_metrics()
+        engine = BreakoutEvaluationEngine()
+        engine.add_plan({
+            "id": "test-plan-latency",
+            "instrument_id": "BTC-USD-SWAP",
+            "direction": "long",
+            "entry_type": "breakout",
+            "entry_price": 110.0
+        })
+        market_time = datetime.now(timezone.utc) - timedelta(seconds=10)
+        okx_payload = {
+            "code": "0",
+            "msg": "",
+            "arg": {"channel": "candle1m", "instId": "BTC-USD-SWAP"},
+            "data": [[
+                str(int(market_time.timestamp() * 1000)),
+                "100.0", "105.0", "99.0", "103.0", "1000.0", "103000.0", "103000.0", "1"
+            ]]
+        }
+        metrics = MetricsSnapshot(timestamp=market_time, atr=1.0, natr_pct=1.0, rvol=1.0)
+
+        with patch('ta2_app.engine.MetricsCalculator.calculate_metrics', return_value=metrics), \
+                patch('ta2_app.engine.is_enabled_for', return_value=debug_enabled), \
+                patch('ta2_app.engine.calculate_latency_fast', return_value=1.0) as mock_latency:
+            engine.evaluate_tick(candlestick_payload=okx_payload, instrument_id="BTC-USD-SWAP")
+
+        assert mock_latency.called is debug_enabled
@@ -0,0 +1 @@
+"""Compiled Numba kernel tests (run with TA2_JIT=1)."""
\ No newline at end of file
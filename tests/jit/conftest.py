@@ -0,0 +1,12 @@
+"""Fixtures for the compiled-kernel suite."""
+
+import pytest
+
+from ta2_app.state._gate_kernels import warmup
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _numba_warmup():
+    """Compile (or load from Numba's cache) all gate kernels once per session."""
+    warmup()
+    yield
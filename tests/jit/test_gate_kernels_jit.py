@@ -0,0 +1,52 @@
+"""Tests for gate kernels compiled by Numba."""
+
+import numpy as np
+import pytest
+
+from ta2_app.state._gate_kernels import (
+    HAS_NUMBA, penetration_passed, volatility_passed, time_confirmation_passed,
+    price_invalidation_scan, elapsed_seconds_ns, time_limit_exceeded
+)
+
+if HAS_NUMBA:
+    from numba import config as numba_config
+    from numba.core.registry import CPUDispatcher
+
+pytestmark = [
+    pytest.mark.jit,
+    pytest.mark.skipif(
+        not HAS_NUMBA or numba_config.DISABLE_JIT,
+        reason="Numba JIT disabled; run with TA2_JIT=1"
+    ),
+]
+
+
+class TestCompiledGateKernels:
+    """Test the kernels compile and agree with their pure-Python versions."""
+
+    def test_kernels_are_compiled(self):
+        """Test each kernel is a Numba dispatcher."""
+        for kernel in (penetration_passed, volatility_passed, price_invalidation_scan,
+                       elapsed_seconds_ns):
+            assert isinstance(kernel, CPUDispatcher)
+
+    def test_compiled_matches_python(self):
+        """Test compiled and py_func results match, including NaN inputs."""
+        levels = np.array([105.0, 95.0])
+        above = np.array([True, False])
+
+        cases = [
+            (penetration_passed, (100.5, 100.0, 0.5, False)),
+            (penetration_passed, (99.6, 100.0, 0.5, True)),
+            (volatility_passed, (float('nan'), 1500.0, 0.5)),
+            (price_invalidation_scan, (90.0, levels, above)),
+            (elapsed_seconds_ns, (3_000_000_000, 1_000_000_000)),
+        ]
+        for kernel, args in cases:
+            assert kernel(*args) == kernel.py_func(*args)
+
+    def test_warmup_compiles_every_kernel(self):
+        """Test the session warmup left a compiled signature on each kernel."""
+        for kernel in (penetration_passed, volatility_passed, time_confirmation_passed,
+                       price_invalidation_scan, elapsed_seconds_ns, time_limit_exceeded):
+            assert kernel.signatures
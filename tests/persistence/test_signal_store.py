@@ -2,8 +2,6 @@
 
 import pytest
 import json
-import tempfile
-import os
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, Any
@@ -65,21 +63,16 @@ class TestStoredSignal:
 class TestSignalStore:
     """Test SignalStore class."""
     
-    def setup_method(self):
-        """Setup test database."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test_signals.db")
+    @pytest.fixture(autouse=True)
+    def _store(self, tmp_path):
+        """Setup test database; pytest removes tmp_path afterwards."""
+        self.db_path = tmp_path / "test_signals.db"
         self.store = SignalStore(self.db_path)
     
-    def teardown_method(self):
-        """Cleanup test database."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
-    
     def test_init_database(self):
         """Test database initialization."""
         # Database file should exist
-        assert Path(self.db_path).exists()
+        assert self.db_path.exists()
         
         # Should be able to connect and query
         with self.store._get_connection() as conn:
@@ -133,6 +126,20 @@ class TestSignalStore:
             row = cursor.fetchone()
             assert row[0] == "2.0"
     
+    def test_store_signal_numpy_values(self):
+        """Test values orjson cannot encode still round-trip via the stdlib encoder."""
+        np = pytest.importorskip("numpy")
+        signal_data = {
+            "plan_id": "test-plan-np",
+            "state": "triggered",
+            "last_price": np.float64(50000.5),
+            "timestamp": "2023-01-01T12:00:00Z"
+        }
+
+        signal_id = self.store.store_signal(signal_data)
+
+        assert self.store.get_signal(signal_id).signal_data["last_price"] == 50000.5
+
     def test_store_signal_error_handling(self):
         """Test store_signal error handling."""
         # Test with invalid signal data
@@ -236,6 +243,18 @@ class TestSignalStore:
         signals = self.store.get_signals_by_plan("nonexistent-plan")
         assert len(signals) == 0
     
+    def test_count_by_plan(self):
+        """Test counting signals for a plan."""
+        for i in range(3):
+            self.store.store_signal({
+                "plan_id": "count-plan",
+                "state": "triggered",
+                "timestamp": f"2023-01-01T12:0{i}:00Z"
+            })
+        
+        assert self.store.count_by_plan("count-plan") == 3
+        assert self.store.count_by_plan("nonexistent-plan") == 0
+    
     def test_get_signals_by_state(self):
         """Test retrieving signals by state."""
         # Store signals with different states
@@ -418,6 +437,49 @@ class TestSignalStore:
             deleted_count = self.store.cleanup_old_signals(older_than_days=30)
             assert deleted_count == 0
     
+    def test_in_memory_uri_database(self):
+        """Test a shared in-memory database persists across connections until closed."""
+        store = SignalStore("file:test_signal_store_mem?mode=memory&cache=shared")
+        try:
+            with store._get_connection() as conn:
+                conn.execute(
+                    "INSERT INTO signals (plan_id, state, protocol_version, timestamp, signal_data, created_at) "
+                    "VALUES ('mem-plan', 'triggered', 'v1', '2023-01-01T12:00:00Z', '{}', '2023-01-01T12:00:00Z')"
+                )
+                conn.commit()
+
+            assert len(store.get_signals_by_plan("mem-plan")) == 1
+            assert not any(Path.cwd().glob("file:*"))
+        finally:
+            store.close()
+
+    def test_transaction_commits_once(self):
+        """Test writes inside a transaction share one connection and commit on exit."""
+        with self.store.transaction():
+            first_id = self.store.store_signal(
+                {"plan_id": "tx-plan", "state": "armed", "timestamp": "2023-01-01T12:00:00Z"}
+            )
+            second_id = self.store.store_signal(
+                {"plan_id": "tx-plan", "state": "triggered", "timestamp": "2023-01-01T12:01:00Z"}
+            )
+            with self.store._get_connection() as conn:
+                assert conn is self.store._local.conn
+
+        assert first_id is not None and second_id is not None
+        assert len(self.store.get_signals_by_plan("tx-plan")) == 2
+
+    def test_transaction_rollback_on_error(self):
+        """Test a failing transaction leaves no rows behind."""
+        with pytest.raises(RuntimeError):
+            with self.store.transaction():
+                self.store.store_signal(
+                    {"plan_id": "tx-rollback", "state": "triggered", "timestamp": "2023-01-01T12:00:00Z"}
+                )
+                raise RuntimeError("abort")
+
+        assert self.store.get_signals_by_plan("tx-rollback") == []
+        assert getattr(self.store._local, "conn", None) is None
+
     def test_get_connection_context_manager(self):
         """Test connection context manager."""
         with self.store._get_connection() as conn:
@@ -483,11 +545,11 @@ class TestSignalStore:
         signal_id1 = self.store.store_signal(signal_data)
         assert signal_id1 is not None
         
-        # Second storage - should replace due to UNIQUE constraint
+        # Second storage - skipped by the UNIQUE constraint
         signal_id2 = self.store.store_signal(signal_data)
         assert signal_id2 is not None
         
-        # Should have same ID due to INSERT OR REPLACE
+        # Should have same ID since the first row is kept
         assert signal_id1 == signal_id2
         
         # Verify only one signal exists
@@ -562,7 +624,7 @@ class TestSignalStore:
         
         # Verify unique constraint prevents exact duplicates
         signal_id3 = self.store.store_signal(signal_data1)  # Same as first
-        assert signal_id3 == signal_id1  # Should replace, not create new
+        assert signal_id3 == signal_id1  # Original row kept, not a new one
         
         # Still only 2 signals
         signals = self.store.get_signals_by_plan("test-plan")
@@ -629,7 +691,7 @@ class TestSignalStore:
         assert len(errors) == 0, f"Errors occurred: {errors}"
         assert len(results) == 10  # All threads should get a result
         
-        # All should have same signal ID due to INSERT OR REPLACE
+        # All should have same signal ID since the first row is kept
         unique_ids = set(results)
         assert len(unique_ids) == 1  # Only one unique ID
         
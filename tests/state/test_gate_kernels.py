@@ -0,0 +1,51 @@
+"""Tests for numeric gate kernels."""
+
+import numpy as np
+
+from ta2_app.state._gate_kernels import (
+    penetration_passed, volatility_passed, time_confirmation_passed,
+    price_invalidation_scan, elapsed_seconds_ns, time_limit_exceeded
+)
+
+
+class TestGateKernels:
+    """Test gate decision kernels."""
+
+    def test_penetration_passed(self):
+        """Test penetration in both directions."""
+        assert penetration_passed(100.5, 100.0, 0.5, False)
+        assert not penetration_passed(100.4, 100.0, 0.5, False)
+        assert penetration_passed(99.5, 100.0, 0.5, True)
+        assert not penetration_passed(99.6, 100.0, 0.5, True)
+
+    def test_volatility_passed(self):
+        """Test volatility threshold and NaN handling."""
+        assert volatility_passed(750.0, 1500.0, 0.5)
+        assert not volatility_passed(500.0, 1500.0, 0.5)
+        assert not volatility_passed(float('nan'), 1500.0, 0.5)
+
+    def test_time_confirmation_passed(self):
+        """Test elapsed time comparison."""
+        assert time_confirmation_passed(1.0, 0.75)
+        assert time_confirmation_passed(0.75, 0.75)
+        assert not time_confirmation_passed(0.5, 0.75)
+
+    def test_price_invalidation_scan(self):
+        """Test first crossed level index is returned in condition order."""
+        levels = np.array([105.0, 95.0])
+        above = np.array([True, False])
+
+        assert price_invalidation_scan(100.0, levels, above) == -1
+        assert price_invalidation_scan(110.0, levels, above) == 0
+        assert price_invalidation_scan(90.0, levels, above) == 1
+        assert price_invalidation_scan(100.0, np.empty(0), np.empty(0, dtype=bool)) == -1
+
+    def test_elapsed_seconds_ns(self):
+        """Test nanosecond difference converts to seconds."""
+        assert elapsed_seconds_ns(2_500_000_000, 1_000_000_000) == 1.5
+        assert elapsed_seconds_ns(1_000_000_000, 2_000_000_000) == -1.0
+
+    def test_time_limit_exceeded(self):
+        """Test the limit itself does not invalidate."""
+        assert time_limit_exceeded(601.0, 600.0)
+        assert not time_limit_exceeded(600.0, 600.0)
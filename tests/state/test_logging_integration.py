@@ -324,5 +324,5 @@ class TestLoggingIntegration:
         for field in required_audit_fields:
             assert field in log_entry['kwargs'], f"Missing audit field: {field}"
         
-        assert log_entry['kwargs']['event'] == 'invalidation_context'
+        assert log_entry['kwargs']['check_event'] == 'invalidation_context'
         assert log_entry['kwargs']['invalidation_conditions_count'] == 2
\ No newline at end of file
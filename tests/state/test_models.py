@@ -90,6 +90,64 @@ class TestPlanRuntimeState:
         assert emitted.signal_emitted is True
         assert emitted.state == initial.state  # Other fields preserved
 
+    def test_with_transition_applied_break_seen(self):
+        """Test applying a break seen transition."""
+        initial = PlanRuntimeState(state=PlanLifecycleState.PENDING)
+        timestamp = datetime.now(timezone.utc)
+
+        new_state = initial.with_transition_applied(StateTransition(
+            new_state=PlanLifecycleState.PENDING,
+            new_substate=BreakoutSubState.BREAK_SEEN,
+            timestamp=timestamp
+        ))
+
+        assert new_state.substate == BreakoutSubState.BREAK_SEEN
+        assert new_state.break_ts == timestamp
+        assert new_state.break_seen is True
+        assert new_state.signal_emitted is False
+
+    def test_with_transition_applied_retest_armed(self):
+        """Test applying a retest armed transition confirms the break and keeps the retest substate."""
+        initial = PlanRuntimeState(
+            state=PlanLifecycleState.PENDING,
+            substate=BreakoutSubState.BREAK_SEEN,
+            break_seen=True
+        )
+        timestamp = datetime.now(timezone.utc)
+
+        armed = initial.with_transition_applied(StateTransition(
+            new_state=PlanLifecycleState.ARMED,
+            new_substate=BreakoutSubState.RETEST_ARMED,
+            timestamp=timestamp
+        ))
+
+        assert armed.state == PlanLifecycleState.ARMED
+        assert armed.substate == BreakoutSubState.RETEST_ARMED
+        assert armed.armed_at == timestamp
+        assert armed.break_confirmed is True
+
+    def test_with_transition_applied_triggered(self):
+        """Test applying a triggering transition marks the signal emitted."""
+        initial = PlanRuntimeState(
+            state=PlanLifecycleState.ARMED,
+            substate=BreakoutSubState.RETEST_ARMED,
+            break_seen=True,
+            break_confirmed=True
+        )
+        timestamp = datetime.now(timezone.utc)
+
+        triggered = initial.with_transition_applied(StateTransition(
+            new_state=PlanLifecycleState.TRIGGERED,
+            new_substate=BreakoutSubState.RETEST_TRIGGERED,
+            timestamp=timestamp,
+            should_emit_signal=True
+        ))
+
+        assert triggered.state == PlanLifecycleState.TRIGGERED
+        assert triggered.triggered_at == timestamp
+        assert triggered.signal_emitted is True
+        assert triggered.break_confirmed is True
+
 
 class TestBreakoutParameters:
     """Test BreakoutParameters configuration model."""
@@ -12,6 +12,7 @@ from ta2_app.state.models import (
     PlanLifecycleState, BreakoutSubState, InvalidationReason
 )
 from ta2_app.models.metrics import MetricsSnapshot
+from ta2_app.state.transitions import invalidation_checker
 
 
 class TestPlanRuntimeManager:
@@ -71,6 +72,19 @@ class TestPlanRuntimeManager:
         assert signal["state"] == "triggered"
         assert signal["context"] == context
 
+    def test_update_state_queues_signal_once(self):
+        """Test a state already marked emitted by its transition is still queued once."""
+        manager = PlanRuntimeManager()
+        armed = PlanRuntimeState(state=PlanLifecycleState.ARMED)
+        triggered = PlanRuntimeState(state=PlanLifecycleState.TRIGGERED, signal_emitted=True)
+        manager.plan_states["test-plan"] = armed
+
+        manager.update_state("test-plan", triggered, emit_signal=True)
+        manager.update_state("test-plan", triggered, emit_signal=True)
+
+        assert len(manager.signal_queue) == 1
+        assert manager.signal_queue[0]["state"] == "triggered"
+
     @patch('ta2_app.state.runtime.transition_handler')
     def test_process_plan_tick_success(self, mock_handler):
         """Test successful plan tick processing."""
@@ -471,6 +485,22 @@ class TestStateManager:
                     assert len(signals) == 1
                     assert signals[0]["plan_id"] == "plan1"
 
+    def test_process_market_tick_parses_string_timestamp(self):
+        """Test an ISO string tick timestamp reaches plans as a datetime."""
+        manager = StateManager()
+        market_data = {"timestamp": "2023-01-01T12:00:00Z", "last_price": 50000.0}
+        
+        with patch.object(manager.runtime_manager, 'process_plan_tick') as mock_process:
+            manager.process_market_tick(
+                [{"id": "plan1"}, {"id": "plan2"}], market_data, {}, {}
+            )
+        
+        contexts = [call.kwargs["market_context"] for call in mock_process.call_args_list]
+        assert len(contexts) == 2
+        assert contexts[0] is contexts[1]
+        assert contexts[0]["timestamp"] == datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        assert market_data["timestamp"] == "2023-01-01T12:00:00Z"
+
     def test_get_plan_state(self):
         """Test getting plan state via manager."""
         manager = StateManager()
@@ -494,6 +524,17 @@ class TestStateManager:
                 mock_remove_rt.assert_called_once_with("test-plan")
                 mock_clear_sig.assert_called_once_with("test-plan")
 
+    def test_remove_plan_clears_invalidation_cache(self):
+        """Test removing a plan drops its preparsed invalidation conditions."""
+        manager = StateManager()
+        invalidation_checker.preparse_conditions(
+            "test-plan", [{'condition_type': 'time_limit', 'duration_seconds': 3600}]
+        )
+
+        manager.remove_plan("test-plan")
+
+        assert "test-plan" not in invalidation_checker._parsed
+
     def test_get_active_plan_count(self):
         """Test getting active plan count."""
         manager = StateManager()
@@ -1,19 +1,23 @@
 """Tests for state transition handlers."""
 
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
 from ta2_app.state.transitions import (
-    StateTransitionHandler, BreakoutGateValidator, InvalidationChecker,
+    StateTransitionHandler, BreakoutGateValidator, InvalidationChecker, InvalidationCtx,
     transition_handler, gate_validator, invalidation_checker
 )
 from ta2_app.state.models import (
     PlanRuntimeState, BreakoutParameters, StateTransition,
-    PlanLifecycleState, BreakoutSubState, InvalidationReason
+    PlanLifecycleState, BreakoutSubState, InvalidationReason, MarketContext
 )
 from ta2_app.models.metrics import MetricsSnapshot
 from ta2_app.data.models import Candle
+from ta2_app.errors import (
+    InsufficientDataError, MalformedDataError, MissingDataError, StateTransitionError
+)
+from ta2_app.utils.time import to_epoch_ns
 
 
 class TestStateTransitionHandler:
@@ -101,6 +105,78 @@ class TestStateTransitionHandler:
         assert new_state.invalid_reason == InvalidationReason.FAKEOUT_CLOSE
         assert new_state.signal_emitted is True
 
+    def test_apply_transition_rejects_invalid_lifecycle(self):
+        """Test terminal states cannot transition back to earlier states."""
+        handler = StateTransitionHandler()
+        current_state = PlanRuntimeState(state=PlanLifecycleState.INVALID)
+
+        transition = StateTransition(
+            new_state=PlanLifecycleState.ARMED,
+            new_substate=BreakoutSubState.BREAK_CONFIRMED,
+            timestamp=datetime.now(timezone.utc)
+        )
+
+        with pytest.raises(StateTransitionError):
+            handler.apply_transition(current_state, transition, "test-plan")
+
+    def test_apply_transition_rejects_invalid_substate(self):
+        """Test substate must be consistent with lifecycle state."""
+        handler = StateTransitionHandler()
+        current_state = PlanRuntimeState(state=PlanLifecycleState.PENDING)
+
+        transition = StateTransition(
+            new_state=PlanLifecycleState.PENDING,
+            new_substate=BreakoutSubState.RETEST_ARMED,
+            timestamp=datetime.now(timezone.utc)
+        )
+
+        with pytest.raises(StateTransitionError):
+            handler.apply_transition(current_state, transition, "test-plan")
+
+    def test_validate_context_data_missing_fields(self):
+        """Test missing and None required fields are both reported by name."""
+        handler = StateTransitionHandler()
+        market = {'last_price': 50000.0, 'timestamp': datetime.now(timezone.utc)}
+        plan = {'id': 'test-plan', 'entry_price': 50000.0, 'direction': 'long'}
+
+        handler._validate_context_data(market, plan, "test-plan")
+
+        with pytest.raises(MissingDataError, match="timestamp"):
+            handler._validate_context_data({'last_price': 50000.0}, plan, "test-plan")
+        with pytest.raises(MissingDataError, match="last_price"):
+            handler._validate_context_data({**market, 'last_price': None}, plan, "test-plan")
+        with pytest.raises(MissingDataError, match="entry_price"):
+            handler._validate_context_data(market, {'id': 'test-plan', 'direction': 'long'}, "test-plan")
+        with pytest.raises(MissingDataError, match="direction"):
+            handler._validate_context_data(market, {**plan, 'direction': None}, "test-plan")
+
+    def test_specialized_validator_cached_per_config(self):
+        """Test equal configs share one specialized metrics validator."""
+        handler = StateTransitionHandler()
+
+        validator = handler.build_specialized_validator(BreakoutParameters(min_rvol=2.0))
+        assert validator is handler.build_specialized_validator(BreakoutParameters(min_rvol=2.0))
+        assert validator is not handler.build_specialized_validator(BreakoutParameters(min_rvol=3.0))
+
+    def test_specialized_validator_only_enabled_checks(self):
+        """Test disabled gates do not require their metrics."""
+        handler = StateTransitionHandler()
+        timestamp = datetime.now(timezone.utc)
+
+        disabled = handler.build_specialized_validator(
+            BreakoutParameters(min_rvol=0.0, min_break_range_atr=0.0)
+        )
+        disabled(None)
+        disabled(MetricsSnapshot(timestamp=timestamp))
+
+        enabled = handler.build_specialized_validator(
+            BreakoutParameters(min_rvol=1.5, min_break_range_atr=0.0)
+        )
+        with pytest.raises(InsufficientDataError):
+            enabled(MetricsSnapshot(timestamp=timestamp))
+        with pytest.raises(MalformedDataError):
+            enabled(MetricsSnapshot(timestamp=timestamp, rvol=5000.0))
+
     @patch('ta2_app.state.transitions.eval_breakout_tick')
     def test_evaluate_and_transition_success(self, mock_eval):
         """Test successful evaluation and transition."""
@@ -120,7 +196,7 @@ class TestStateTransitionHandler:
         market_context = {'last_price': 50000.0, 'timestamp': timestamp}
         cfg = BreakoutParameters()
         plan_data = {'id': 'test-plan', 'entry_price': 50000.0, 'direction': 'long'}
-        metrics = MetricsSnapshot(timestamp=timestamp)
+        metrics = MetricsSnapshot(timestamp=timestamp, rvol=2.0, natr_pct=1.0, atr=500.0)
         
         result = handler.evaluate_and_transition(
             current_state, market_context, cfg, plan_data, metrics
@@ -129,12 +205,28 @@ class TestStateTransitionHandler:
         assert result == expected_transition
         mock_eval.assert_called_once_with(
             plan_rt=current_state,
-            market=market_context,
+            market=MarketContext(last_price=50000.0, timestamp=timestamp),
             cfg=cfg,
             plan_data=plan_data,
             metrics=metrics
         )
 
+    def test_evaluate_and_transition_market_dict(self):
+        """Test a market data dict is evaluated by the state machine."""
+        handler = StateTransitionHandler()
+        timestamp = datetime.now(timezone.utc)
+        market_context = {'last_price': 53000.0, 'timestamp': timestamp, 'rvol': 2.0, 'unused': True}
+        plan_data = {'id': 'test-plan', 'entry_price': 50000.0, 'direction': 'long'}
+        metrics = MetricsSnapshot(timestamp=timestamp, rvol=2.0, natr_pct=1.0, atr=500.0)
+
+        result = handler.evaluate_and_transition(
+            PlanRuntimeState(state=PlanLifecycleState.PENDING), market_context, BreakoutParameters(),
+            plan_data, metrics
+        )
+
+        assert result.new_state == PlanLifecycleState.PENDING
+        assert result.new_substate == BreakoutSubState.BREAK_SEEN
+
     @patch('ta2_app.state.transitions.eval_breakout_tick')
     def test_evaluate_and_transition_error(self, mock_eval):
         """Test error handling during evaluation."""
@@ -157,6 +249,44 @@ class TestStateTransitionHandler:
         assert result.new_state == PlanLifecycleState.INVALID
         assert result.should_emit_signal is True
 
+    @patch('ta2_app.state.transitions.eval_breakout_tick')
+    def test_evaluate_and_transition_error_uses_market_time(self, mock_eval):
+        """Test error-path invalidation is stamped with the market timestamp."""
+        handler = StateTransitionHandler()
+        current_state = PlanRuntimeState(state=PlanLifecycleState.PENDING)
+        mock_eval.side_effect = Exception("Test error")
+
+        market_ts = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        market_context = {'last_price': 50000.0, 'timestamp': market_ts}
+        cfg = BreakoutParameters(min_rvol=0.0, min_break_range_atr=0.0)
+        plan_data = {'id': 'test-plan', 'entry_price': 50000.0, 'direction': 'long'}
+
+        result = handler.evaluate_and_transition(
+            current_state, market_context, cfg, plan_data, None
+        )
+
+        assert result.new_state == PlanLifecycleState.INVALID
+        assert result.timestamp == market_ts
+
+    @patch('ta2_app.state.transitions.eval_breakout_tick')
+    def test_evaluate_and_transition_error_skips_disabled_logging(self, mock_eval):
+        """Test error payloads are not built when ERROR logging is disabled."""
+        handler = StateTransitionHandler()
+        handler.logger = Mock()
+        handler.logger.is_enabled_for.return_value = False
+        mock_eval.side_effect = Exception("Test error")
+
+        market_context = {'last_price': 50000.0, 'timestamp': datetime.now(timezone.utc)}
+        cfg = BreakoutParameters(min_rvol=0.0, min_break_range_atr=0.0)
+        plan_data = {'id': 'test-plan', 'entry_price': 50000.0, 'direction': 'long'}
+
+        result = handler.evaluate_and_transition(
+            PlanRuntimeState(state=PlanLifecycleState.PENDING), market_context, cfg, plan_data, None
+        )
+
+        assert result.new_state == PlanLifecycleState.INVALID
+        handler.logger.error.assert_not_called()
+
 
 class TestBreakoutGateValidator:
     """Test BreakoutGateValidator class."""
@@ -204,6 +334,41 @@ class TestBreakoutGateValidator:
         assert validator.validate_volatility_gate(100.0, 1500.0, 0.0, "test-plan")  # Disabled
         assert validator.validate_volatility_gate(None, None, -1.0, "test-plan")    # Disabled
 
+    def test_validate_time_confirmation_gate_epoch_ns(self):
+        """Test time confirmation gate with datetimes and integer epoch ns."""
+        validator = BreakoutGateValidator()
+        start = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        later = start + timedelta(seconds=2)
+
+        assert validator.validate_time_confirmation_gate(start, later, 1.5, "test-plan")
+        assert not validator.validate_time_confirmation_gate(start, later, 3.0, "test-plan")
+        assert validator.validate_time_confirmation_gate(
+            to_epoch_ns(start), to_epoch_ns(later), 1.5, "test-plan"
+        )
+        assert not validator.validate_time_confirmation_gate(
+            to_epoch_ns(start), to_epoch_ns(later), 3.0, "test-plan"
+        )
+
+    def test_validate_time_confirmation_gate_mixed_timestamps(self):
+        """Test an epoch-ns timestamp paired with a datetime is converted, not dereferenced."""
+        validator = BreakoutGateValidator()
+        start = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        later = start + timedelta(seconds=5)
+
+        assert validator.validate_time_confirmation_gate(to_epoch_ns(start), later, 3.0, "test-plan")
+        assert not validator.validate_time_confirmation_gate(start, to_epoch_ns(later), 6.0, "test-plan")
+
+    def test_validate_close_confirmation_gate(self):
+        """Test close confirmation requires a close beyond entry in the breakout direction."""
+        validator = BreakoutGateValidator()
+        validator.gating_logger = Mock()
+
+        assert validator.validate_close_confirmation_gate(101.0, 100.0, False, True, "test-plan")
+        assert not validator.validate_close_confirmation_gate(99.0, 100.0, False, True, "test-plan")
+        assert validator.validate_close_confirmation_gate(99.0, 100.0, True, True, "test-plan")
+        assert not validator.validate_close_confirmation_gate(101.0, 100.0, True, True, "test-plan")
+        assert not validator.validate_close_confirmation_gate(101.0, 100.0, False, False, "test-plan")
+
     def test_validate_orderbook_sweep_gate_pass(self):
         """Test order book sweep gate validation - pass."""
         validator = BreakoutGateValidator()
@@ -219,6 +384,29 @@ class TestBreakoutGateValidator:
         assert not validator.validate_orderbook_sweep_gate(True, 'bid', 'ask', "test-plan")   # Wrong side
         assert not validator.validate_orderbook_sweep_gate(True, None, 'ask', "test-plan")    # No side detected
 
+    @patch('ta2_app.state.transitions.log_gate_decision')
+    def test_gate_decision_skips_logging_when_disabled(self, mock_log):
+        """Test gate decisions skip log construction when the level is disabled."""
+        validator = BreakoutGateValidator()
+        validator.gating_logger = Mock()
+        validator.gating_logger.is_enabled_for.return_value = False
+
+        assert validator.validate_penetration_gate(101.0, 100.0, 0.5, False, "test-plan")
+        assert not validator.validate_close_confirmation_gate(101.0, 100.0, True, True, "test-plan")
+        assert validator.validate_rvol_gate(2.0, 1.5, "test-plan")
+        mock_log.assert_not_called()
+
+    @patch('ta2_app.state.transitions.log_gate_decision')
+    def test_disabled_gates_return_without_logging(self, mock_log):
+        """Test disabled gates pass without emitting a gate decision."""
+        validator = BreakoutGateValidator()
+        now = datetime.now(timezone.utc)
+
+        assert validator.validate_rvol_gate(None, 0.0, "test-plan")
+        assert validator.validate_volatility_gate(None, None, 0.0, "test-plan")
+        assert validator.validate_time_confirmation_gate(now, now, 0.0, "test-plan")
+        mock_log.assert_not_called()
+
 
 class TestInvalidationChecker:
     """Test InvalidationChecker class."""
@@ -276,6 +464,108 @@ class TestInvalidationChecker:
         result = checker.check_price_invalidation(44000.0, conditions, "test-plan")
         assert result == InvalidationReason.PRICE_BELOW
 
+    def test_check_price_invalidation_skips_unknown_conditions(self):
+        """Test non-price and malformed conditions are ignored."""
+        checker = InvalidationChecker()
+        checker.gating_logger = Mock()
+
+        conditions = [
+            "not-a-dict",
+            {'condition_type': 'time_limit', 'duration_seconds': 60},
+            {'condition_type': 'price_above', 'level': None},
+            {'condition_type': 'price_below', 'level': 45000.0}
+        ]
+
+        assert checker.check_price_invalidation(50000.0, conditions, "test-plan") is None
+        assert checker.check_price_invalidation(44000.0, conditions, "test-plan") == InvalidationReason.PRICE_BELOW
+        assert checker.gating_logger.warning.call_args.kwargs['price_deficit'] == 1000.0
+
+    def test_check_price_invalidation_skips_debug_when_disabled(self):
+        """Test passing conditions skip debug logging when DEBUG is disabled."""
+        checker = InvalidationChecker()
+        checker.gating_logger = Mock()
+        checker.gating_logger.is_enabled_for.return_value = False
+
+        conditions = [{'condition_type': 'price_above', 'level': 55000.0}]
+
+        assert checker.check_price_invalidation(50000.0, conditions, "test-plan") is None
+        checker.gating_logger.debug.assert_not_called()
+
+        checker.gating_logger.is_enabled_for.return_value = True
+        checker.check_price_invalidation(50000.0, conditions, "test-plan")
+        checker.gating_logger.debug.assert_called_once()
+        assert checker.gating_logger.debug.call_args.kwargs == {
+            "plan_id": "test-plan",
+            "current_price": 50000.0,
+            "check_event": "invalidation_check",
+            "invalidation_type": "price_above",
+            "limit_level": 55000.0,
+            "price_margin": 5000.0,
+            "condition_index": 0
+        }
+
+    def test_invalidation_checks_skip_debug_when_disabled(self):
+        """Test passing and skipped checks build no debug logs when DEBUG is disabled."""
+        checker = InvalidationChecker()
+        checker.gating_logger = Mock()
+        checker.gating_logger.is_enabled_for.return_value = False
+        plan_created = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        candle = Candle(
+            ts=plan_created, open=50000.0, high=52000.0, low=49500.0, close=51000.0,
+            volume=100.0, is_closed=True
+        )
+
+        assert not checker.check_time_invalidation(
+            plan_created, plan_created, [{'condition_type': 'time_limit', 'duration_seconds': 60}], "test-plan"
+        )
+        assert not checker.check_fakeout_invalidation(None, 50000.0, False, "test-plan")
+        assert not checker.check_fakeout_invalidation(object(), 50000.0, False, "test-plan")
+        assert not checker.check_fakeout_invalidation(candle, 50000.0, False, "test-plan")
+        assert not checker.check_stop_loss_invalidation(50000.0, None, False, "test-plan")
+        assert not checker.check_stop_loss_invalidation(50000.0, 49000.0, False, "test-plan")
+        checker.gating_logger.debug.assert_not_called()
+
+    def test_preparse_conditions(self):
+        """Test conditions are split into columns and cached per conditions contents."""
+        checker = InvalidationChecker()
+        conditions = [
+            {'condition_type': 'price_below', 'level': 45000.0},
+            "not-a-dict",
+            {'condition_type': 'time_limit', 'duration_seconds': 3600},
+            {'condition_type': 'price_above', 'level': 55000},
+            {'condition_type': 'price_above', 'level': None}
+        ]
+
+        parsed = checker.preparse_conditions("test-plan", conditions)
+
+        assert parsed.price_levels.tolist() == [45000.0, 55000.0]
+        assert parsed.price_above.tolist() == [False, True]
+        assert parsed.price_indices.tolist() == [0, 3]
+        assert parsed.min_time_limit == 3600
+        assert parsed.time_limit_index == 2
+        assert checker.preparse_conditions("test-plan", conditions) is parsed
+        assert checker.preparse_conditions("test-plan", list(conditions)) is parsed
+
+        # In-place edits invalidate the cached entry
+        conditions[2]['duration_seconds'] = 600
+        assert checker.preparse_conditions("test-plan", conditions).min_time_limit == 600
+        conditions.append({'condition_type': 'price_below', 'level': 40000.0})
+        assert checker.preparse_conditions("test-plan", conditions).price_indices.tolist() == [0, 3, 5]
+
+    def test_check_price_invalidation_first_crossed_condition_wins(self):
+        """Test the first crossed condition in list order is reported."""
+        checker = InvalidationChecker()
+        checker.gating_logger = Mock()
+        conditions = [
+            {'condition_type': 'price_above', 'level': 52000.0},
+            {'condition_type': 'price_below', 'level': 60000.0}
+        ]
+
+        assert checker.check_price_invalidation(53000.0, conditions, "test-plan") == InvalidationReason.PRICE_ABOVE
+        assert checker.gating_logger.warning.call_args.kwargs['condition_index'] == 0
+        assert checker.check_price_invalidation(51000.0, conditions, "test-plan") == InvalidationReason.PRICE_BELOW
+        assert checker.gating_logger.warning.call_args.kwargs['condition_index'] == 1
+
     def test_check_time_invalidation(self):
         """Test time-based invalidation."""
         checker = InvalidationChecker()
@@ -299,6 +589,59 @@ class TestInvalidationChecker:
         result = checker.check_time_invalidation(current_time, plan_created, conditions, "test-plan")
         assert result is True
 
+    def test_check_time_invalidation_uses_tightest_limit(self):
+        """Test the smallest time limit applies and is cached per conditions list."""
+        checker = InvalidationChecker()
+        checker.gating_logger = Mock()
+        plan_created = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        conditions = [
+            {'condition_type': 'price_above', 'level': 55000.0},
+            {'condition_type': 'time_limit', 'duration_seconds': 3600},
+            {'condition_type': 'time_limit', 'duration_seconds': 600}
+        ]
+
+        assert not checker.check_time_invalidation(
+            plan_created + timedelta(seconds=300), plan_created, conditions, "test-plan"
+        )
+        assert checker.check_time_invalidation(
+            plan_created + timedelta(seconds=900), plan_created, conditions, "test-plan"
+        )
+        assert checker.gating_logger.warning.call_args.kwargs['condition_index'] == 2
+
+        # A replaced conditions list is rescanned
+        assert not checker.check_time_invalidation(
+            plan_created + timedelta(seconds=900), plan_created, conditions[:2], "test-plan"
+        )
+        assert not checker.check_time_invalidation(
+            plan_created + timedelta(seconds=900), plan_created, [], "test-plan"
+        )
+
+        checker.clear_plan_cache("test-plan")
+        assert "test-plan" not in checker._parsed
+
+    def test_check_time_invalidation_epoch_ns(self):
+        """Test time invalidation with integer epoch-nanosecond timestamps."""
+        checker = InvalidationChecker()
+        checker.gating_logger = Mock()
+        plan_created = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        created_ns = to_epoch_ns(plan_created)
+        conditions = [{'condition_type': 'time_limit', 'duration_seconds': 600}]
+
+        assert not checker.check_time_invalidation(
+            created_ns + 300 * 10**9, created_ns, conditions, "test-plan"
+        )
+        assert checker.check_time_invalidation(
+            created_ns + 900 * 10**9, created_ns, conditions, "test-plan"
+        )
+        kwargs = checker.gating_logger.warning.call_args.kwargs
+        assert kwargs['elapsed_seconds'] == 900.0
+        assert kwargs['plan_created_at'] == plan_created.isoformat()
+
+        # Mixed datetime / epoch-ns pair
+        assert checker.check_time_invalidation(
+            plan_created + timedelta(seconds=900), created_ns, conditions, "test-plan"
+        )
+
     def test_check_fakeout_invalidation_long(self):
         """Test fakeout invalidation for long breakout."""
         checker = InvalidationChecker()
@@ -369,6 +712,89 @@ class TestInvalidationChecker:
         result = checker.check_fakeout_invalidation(invalid_candle, 50000.0, False, "test-plan")
         assert result is False
 
+    def test_evaluate_invalidation_order(self):
+        """Test the combined check returns the first hit in stop/price/fakeout/time order."""
+        checker = InvalidationChecker()
+        checker.gating_logger = Mock()
+        created = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        fakeout_candle = Candle(
+            ts=created, open=50000.0, high=50500.0, low=49000.0, close=49500.0,
+            volume=100.0, is_closed=True
+        )
+        conditions = (
+            {'condition_type': 'price_below', 'level': 48500.0},
+            {'condition_type': 'time_limit', 'duration_seconds': 60}
+        )
+
+        def ctx(price, **kwargs):
+            return InvalidationCtx(
+                plan_id="test-plan", current_price=price, current_time=created + timedelta(seconds=120),
+                entry_price=50000.0, is_short=False, **kwargs
+            )
+
+        assert checker.evaluate_invalidation(ctx(50100.0)) is None
+        assert checker.evaluate_invalidation(
+            ctx(48000.0, stop_loss=48900.0, invalidation_conditions=conditions)
+        ) == InvalidationReason.STOP_LOSS
+        assert checker.evaluate_invalidation(
+            ctx(48000.0, invalidation_conditions=conditions, last_closed_candle=fakeout_candle)
+        ) == InvalidationReason.PRICE_BELOW
+        assert checker.evaluate_invalidation(
+            ctx(49800.0, invalidation_conditions=conditions, last_closed_candle=fakeout_candle, plan_created_at=created)
+        ) == InvalidationReason.FAKEOUT_CLOSE
+        assert checker.evaluate_invalidation(
+            ctx(50100.0, invalidation_conditions=conditions, plan_created_at=created)
+        ) == InvalidationReason.TIME_LIMIT
+
+    def test_log_invalidation_context(self):
+        """Test context logging precomputes fields and is skipped when INFO is disabled."""
+        checker = InvalidationChecker()
+        checker.gating_logger = Mock()
+        created = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        plan_data = {
+            'created_at': created,
+            'stop_loss': 48000.0,
+            'extra_data': {'invalidation_conditions': [{'condition_type': 'time_limit', 'duration_seconds': 60}]}
+        }
+
+        checker.log_invalidation_context("test-plan", 50000.0, created + timedelta(seconds=30), plan_data)
+        kwargs = checker.gating_logger.info.call_args.kwargs
+        assert kwargs['plan_created_at'] == created.isoformat()
+        assert kwargs['elapsed_seconds'] == 30.0
+        assert kwargs['invalidation_conditions_count'] == 1
+
+        checker.log_invalidation_context("test-plan", 50000.0, created, {})
+        assert checker.gating_logger.info.call_args.kwargs['elapsed_seconds'] is None
+
+        checker.gating_logger.reset_mock()
+        checker.gating_logger.is_enabled_for.return_value = False
+        checker.log_invalidation_context("test-plan", 50000.0, created, plan_data)
+        checker.gating_logger.info.assert_not_called()
+
+    def test_invalidation_hits_with_real_logger(self):
+        """Test every invalidation check reports its hit through the real gating logger."""
+        checker = InvalidationChecker()
+        created = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        conditions = [
+            {'condition_type': 'price_below', 'level': 48500.0},
+            {'condition_type': 'time_limit', 'duration_seconds': 60}
+        ]
+        fakeout_candle = Candle(
+            ts=created, open=50000.0, high=50500.0, low=49000.0, close=49500.0,
+            volume=100.0, is_closed=True
+        )
+        later = created + timedelta(seconds=120)
+
+        assert checker.check_stop_loss_invalidation(48000.0, 48900.0, False, "test-plan")
+        assert checker.check_price_invalidation(48000.0, conditions, "test-plan") == InvalidationReason.PRICE_BELOW
+        assert checker.check_fakeout_invalidation(fakeout_candle, 50000.0, False, "test-plan")
+        assert checker.check_time_invalidation(later, created, conditions, "test-plan")
+        assert checker.evaluate_invalidation(InvalidationCtx(
+            plan_id="test-plan", current_price=48000.0, current_time=later, entry_price=50000.0,
+            is_short=False, stop_loss=48900.0
+        )) == InvalidationReason.STOP_LOSS
+        checker.log_invalidation_context("test-plan", 50000.0, later, {'created_at': created})
+
 
 class TestModuleLevelInstances:
     """Test module-level singleton instances."""
@@ -7,11 +7,14 @@ for the complete data normalization pipeline.
 
 import pytest
 import json
+import numpy as np
 from datetime import datetime, UTC, timedelta
 from unittest.mock import patch
 
 from ta2_app.data.models import Candle, BookLevel, BookSnap, InstrumentDataStore, NormalizationResult
 from ta2_app.data.parsers import (
+    CANDLE_DTYPE,
+    parse_candle_array,
     parse_candlestick_payload, 
     parse_orderbook_payload, 
     parse_json_payload,
@@ -69,6 +72,16 @@ class TestCandlestickParsing:
         assert candles[0].is_closed == True
         assert candles[1].is_closed == False
     
+    def test_parse_decoded_numeric_candle(self):
+        """Test rows already decoded to numbers parse like wire strings."""
+        wire = {"code": "0", "data": [["1597026383085", "3.721", "3.743", "3.677", "3.708", "8422410", "0", "0", "1"]]}
+        decoded = {"code": "0", "data": [[1597026383085, 3.721, 3.743, 3.677, 3.708, 8422410, 0, 0, 1]]}
+
+        candles = parse_candlestick_payload(decoded, enable_circuit_breaker=False)
+
+        assert candles == parse_candlestick_payload(wire, enable_circuit_breaker=False)
+        assert candles[0].is_closed is True
+
     def test_parse_invalid_candlestick_payload(self):
         """Test parsing invalid candlestick payloads."""
         # Missing data field
@@ -103,6 +116,32 @@ class TestCandlestickParsing:
         with pytest.raises(ParseError, match="High/low prices inconsistent"):
             parse_candlestick_payload(payload)
 
+    def test_parse_candle_array_matches_payload(self):
+        """Test preparsed candle rows produce the same candles as the string payload."""
+        payload = {
+            "code": "0",
+            "data": [
+                ["1597026383085", "3.721", "3.743", "3.677", "3.708", "8422410", "22698348.04828491", "12698348.04828491", "1"],
+                ["1597026384085", "3.708", "3.720", "3.700", "3.715", "1000000", "3000000", "3000000", "0"]
+            ]
+        }
+        rows = np.array([
+            (1597026383085, 3.721, 3.743, 3.677, 3.708, 8422410, 22698348.04828491, True),
+            (1597026384085, 3.708, 3.720, 3.700, 3.715, 1000000, 3000000, False),
+        ], dtype=CANDLE_DTYPE)
+
+        # Bypass the shared circuit breaker so earlier parse failures cannot trip it
+        assert parse_candle_array(rows) == parse_candlestick_payload(payload, enable_circuit_breaker=False)
+
+    def test_parse_invalid_candle_array(self):
+        """Test preparsed candle rows get the same validation as string payloads."""
+        with pytest.raises(ParseError, match="dtype CANDLE_DTYPE"):
+            parse_candle_array(np.zeros(1))
+
+        rows = np.array([(1597026383085, 3.721, 3.700, 3.750, 3.708, 8422410, 0, True)], dtype=CANDLE_DTYPE)
+        with pytest.raises(ParseError, match="High/low prices inconsistent"):
+            parse_candle_array(rows)
+
 
 class TestOrderBookParsing:
     """Test order book payload parsing."""
@@ -312,6 +351,23 @@ class TestDataNormalizer:
         assert result.last_price_updated == True
         assert result.new_last_price == 3.708
     
+    def test_normalize_candle_tick_bytes(self):
+        """Test raw JSON bytes are parsed without a decode step."""
+        orjson = pytest.importorskip("orjson")
+        normalizer = DataNormalizer({"max_age_seconds": 86400})
+
+        current_ts = int(datetime.now(UTC).timestamp() * 1000)
+        raw_data = orjson.dumps({
+            "code": "0",
+            "msg": "",
+            "data": [[str(current_ts), "3.721", "3.743", "3.677", "3.708", "8422410", "0", "0", "1"]]
+        })
+
+        result = normalizer.normalize_tick("BTC-USD", raw_data, "candle")
+
+        assert result.success == True
+        assert result.candle.close == 3.708
+
     def test_normalize_book_tick(self):
         """Test normalizing order book tick."""
         normalizer = DataNormalizer({"max_age_seconds": 86400})  # 24 hours
@@ -1,14 +1,22 @@
 """Unit tests for the main evaluation engine."""
 
+import numpy as np
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any
 from unittest.mock import Mock, patch
 
 from ta2_app.engine import BreakoutEvaluationEngine
 from ta2_app.data.models import NormalizationResult, Candle, BookSnap
+from ta2_app.data.parsers import CANDLE_DTYPE
 from ta2_app.state.models import PlanLifecycleState
 
+# Stamped at import so the normalizer does not reject the bar as too old
+CANDLE_BREAK_UP = np.array(
+    [(int(datetime.now(timezone.utc).timestamp() * 1000), 50000.0, 52800.0, 49900.0, 52500.0, 3000, 156_000_000, True)],
+    dtype=CANDLE_DTYPE
+)
+
 
 class TestBreakoutEvaluationEngine:
     """Test suite for the BreakoutEvaluationEngine class."""
@@ -149,6 +157,39 @@ class TestBreakoutEvaluationEngine:
             assert isinstance(result, list)
             assert len(result) == 0
 
+    def test_evaluate_tick_preparsed_candles(self) -> None:
+        """Test evaluate_tick accepts preparsed candle rows instead of a raw payload."""
+        engine = BreakoutEvaluationEngine()
+        engine.add_plan({
+            'id': 'test-plan-005b',
+            'instrument_id': 'BTC-USD-SWAP',
+            'entry_type': 'breakout',
+            'entry_price': 50000.0,
+            'direction': 'long'
+        })
+
+        with patch.object(engine.normalizer, 'normalize_candlesticks') as mock_normalize:
+            engine.evaluate_tick(candles_np=CANDLE_BREAK_UP, instrument_id='BTC-USD-SWAP')
+
+        mock_normalize.assert_not_called()
+        bar = engine.data_stores['BTC-USD-SWAP'].get_bars('1m')[-1]
+        assert (bar.open, bar.high, bar.low, bar.close) == (50000.0, 52800.0, 49900.0, 52500.0)
+        assert bar.volume == 3000.0
+        assert bar.is_closed is True
+
+    def test_evaluate_ticks(self) -> None:
+        """Test evaluate_ticks returns one signal list per tick, in order."""
+        engine = BreakoutEvaluationEngine()
+        ticks = [
+            {'candlestick_payload': {'a': 1}, 'instrument_id': 'BTC-USD-SWAP'},
+            {'orderbook_payload': {'b': 2}, 'instrument_id': 'BTC-USD-SWAP'},
+        ]
+
+        with patch.object(engine, 'evaluate_tick', side_effect=[[{'n': 1}], []]) as mock_eval:
+            assert engine.evaluate_ticks(ticks) == [[{'n': 1}], []]
+
+        assert [c.kwargs for c in mock_eval.call_args_list] == ticks
+
     def test_evaluate_tick_orderbook_normalization_failure(self) -> None:
         """Test evaluate_tick with orderbook normalization failure."""
         engine = BreakoutEvaluationEngine()
@@ -247,6 +288,66 @@ class TestBreakoutEvaluationEngine:
         
         assert engine.get_active_plan_count() == 1
 
+    def test_add_plans(self) -> None:
+        """Test adding several plans skips invalid ones."""
+        engine = BreakoutEvaluationEngine()
+
+        engine.add_plans([
+            {
+                'id': 'test-plan-010',
+                'instrument_id': 'BTC-USD-SWAP',
+                'entry_type': 'breakout',
+                'entry_price': 50000.0,
+                'direction': 'long'
+            },
+            {'id': 'test-plan-011'},
+        ])
+
+        assert engine.get_active_plan_count() == 1
+        assert engine.active_plans[0]['id'] == 'test-plan-010'
+
+    def test_add_plans_groups_by_instrument(self) -> None:
+        """Test batched plans are indexed per instrument and removal updates the index."""
+        engine = BreakoutEvaluationEngine()
+        base = {'entry_type': 'breakout', 'entry_price': 50000.0, 'direction': 'long'}
+
+        engine.add_plans([
+            dict(base, id='btc-1', instrument_id='BTC-USD-SWAP'),
+            dict(base, id='eth-1', instrument_id='ETH-USD-SWAP'),
+            dict(base, id='btc-2', instrument_id='BTC-USD-SWAP'),
+        ])
+
+        assert [p['id'] for p in engine.plans_by_instrument['BTC-USD-SWAP']] == ['btc-1', 'btc-2']
+        assert [p['id'] for p in engine.plans_by_instrument['ETH-USD-SWAP']] == ['eth-1']
+        assert set(engine.data_stores) == {'BTC-USD-SWAP', 'ETH-USD-SWAP'}
+
+        engine.remove_plan('btc-1')
+        engine.remove_plan('eth-1')
+
+        assert [p['id'] for p in engine.plans_by_instrument['BTC-USD-SWAP']] == ['btc-2']
+        assert 'ETH-USD-SWAP' not in engine.plans_by_instrument
+        assert engine.active_plan_ids == {'btc-2'}
+
+    def test_reset(self) -> None:
+        """Test reset drops plans, their runtime state and per-instrument data."""
+        engine = BreakoutEvaluationEngine()
+        engine.add_plan({
+            'id': 'test-plan-reset',
+            'instrument_id': 'BTC-USD-SWAP',
+            'entry_type': 'breakout',
+            'entry_price': 50000.0,
+            'direction': 'long'
+        })
+
+        with patch('ta2_app.engine.state_manager') as mock_state_manager:
+            engine.reset()
+
+        mock_state_manager.remove_plan.assert_called_once_with('test-plan-reset')
+        assert engine.active_plans == []
+        assert engine.plans_by_instrument == {}
+        assert engine.data_stores == {}
+        assert engine.metrics_calculators == {}
+
     def test_get_runtime_stats(self) -> None:
         """Test getting runtime statistics."""
         engine = BreakoutEvaluationEngine()
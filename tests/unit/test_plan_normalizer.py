@@ -2,7 +2,7 @@
 
 import pytest
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 
 from ta2_app.data.plan_normalizer import PlanNormalizer, PlanNormalizationResult
 
@@ -203,6 +203,49 @@ class TestPlanNormalizer:
         
         assert result.success is True
         assert isinstance(result.normalized_plan['created_at'], datetime)
+        # Naive creation times have no defined epoch, so no epoch-ns copy is kept
+        assert 'created_at_epoch_ns' not in result.normalized_plan
+
+        plan_data['created_at'] = '2025-07-17T04:08:23.750427Z'
+        result = normalizer.normalize_plan(plan_data)
+
+        assert result.success is True
+        assert result.normalized_plan['created_at_epoch_ns'] == 1752725303750427000
+
+    def test_normalize_plan_created_at_epoch(self) -> None:
+        """Test an epoch-seconds creation time fills in created_at and keeps fractions."""
+        normalizer = PlanNormalizer()
+
+        result = normalizer.normalize_plan({
+            'id': 'test-plan-009b',
+            'instrument_id': 'BTC-USD-SWAP',
+            'entry_type': 'breakout',
+            'entry_price': 50000.0,
+            'direction': 'long',
+            'created_at_epoch': '1752725303.5'
+        })
+
+        assert result.success is True
+        assert result.normalized_plan['created_at_epoch'] == 1752725303.5
+        assert result.normalized_plan['created_at_epoch_ns'] == 1752725303_500000000
+        assert result.normalized_plan['created_at'] == datetime.fromtimestamp(1752725303.5, tz=timezone.utc)
+
+    @pytest.mark.parametrize("created_at_epoch", ['yesterday', 1700000000000, float('nan')])
+    def test_normalize_plan_invalid_created_at_epoch(self, created_at_epoch) -> None:
+        """Test unparseable or out-of-range epochs (e.g. milliseconds) are rejected."""
+        normalizer = PlanNormalizer()
+
+        result = normalizer.normalize_plan({
+            'id': 'test-plan-009c',
+            'instrument_id': 'BTC-USD-SWAP',
+            'entry_type': 'breakout',
+            'entry_price': 50000.0,
+            'direction': 'long',
+            'created_at_epoch': created_at_epoch
+        })
+
+        assert result.success is False
+        assert 'Invalid created_at_epoch' in result.error_msg
     
     def test_normalize_plan_invalidation_conditions_validation(self) -> None:
         """Test validation of invalidation conditions structure."""
@@ -12,8 +12,10 @@ from unittest.mock import patch
 from ta2_app.utils.time import (
     get_market_time, ensure_market_time, calculate_latency,
     get_market_time_with_latency, validate_market_time,
-    format_market_time, time_elapsed_seconds
+    format_market_time, time_elapsed_seconds, to_epoch_ns, from_epoch_ns,
+    calculate_latency_fast, parse_market_time
 )
+from ta2_app.utils.time import _market_time_in_window
 
 
 class TestGetMarketTime:
@@ -94,6 +96,13 @@ class TestCalculateLatency:
             result = calculate_latency(market_ts, None)
             assert result == 2.0
 
+    def test_fast_variant_reads_wall_clock(self):
+        """Should compute latency from the raw wall-clock reading."""
+        market_ts = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+        with patch('ta2_app.utils.time._wall_time', return_value=market_ts.timestamp() + 2.5):
+            assert calculate_latency_fast(market_ts) == 2.5
+
 
 class TestGetMarketTimeWithLatency:
     """Test get_market_time_with_latency function."""
@@ -144,6 +153,26 @@ class TestValidateMarketTime:
         future_ts = datetime.now(timezone.utc) + timedelta(seconds=15)
         assert validate_market_time(future_ts) is True
 
+    def test_uses_supplied_now(self):
+        """Should measure age against the supplied reference time."""
+        ts = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        assert validate_market_time(ts, now=ts + timedelta(seconds=60)) is True
+        assert validate_market_time(ts, now=ts + timedelta(seconds=400)) is False
+
+    def test_boundaries_exact_and_repeat_lookups_cached(self):
+        """Should keep exact age boundaries and reuse results for repeated pairs."""
+        ts = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        now = ts + timedelta(seconds=300)
+
+        assert validate_market_time(ts, now=now) is True
+        assert validate_market_time(ts - timedelta(microseconds=1), now=now) is False
+        assert validate_market_time(now + timedelta(seconds=30), now=now) is True
+        assert validate_market_time(now + timedelta(seconds=30, microseconds=1), now=now) is False
+
+        hits = _market_time_in_window.cache_info().hits
+        validate_market_time(ts, now=now)
+        assert _market_time_in_window.cache_info().hits == hits + 1
+
 
 class TestFormatMarketTime:
     """Test format_market_time function."""
@@ -155,6 +184,20 @@ class TestFormatMarketTime:
         assert result == "2023-01-01T12:00:00+00:00"
 
 
+class TestParseMarketTime:
+    """Test parse_market_time function."""
+    
+    def test_parses_iso_string_with_z_suffix(self):
+        """Should parse an ISO8601 string with a 'Z' suffix as UTC."""
+        result = parse_market_time("2023-01-01T12:00:00Z")
+        assert result == datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    
+    def test_returns_datetime_unchanged(self):
+        """Should pass a datetime through without copying it."""
+        ts = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        assert parse_market_time(ts) is ts
+
+
 class TestTimeElapsedSeconds:
     """Test time_elapsed_seconds function."""
     
@@ -175,4 +218,23 @@ class TestTimeElapsedSeconds:
             mock_datetime.now.return_value = mock_now
             
             result = time_elapsed_seconds(start, None)
-            assert result == 3.0
\ No newline at end of file
+            assert result == 3.0
+
+
+class TestEpochNanoseconds:
+    """Test epoch-nanosecond conversions."""
+
+    def test_round_trip(self):
+        """Test datetime -> epoch ns -> datetime round trip."""
+        ts = datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+        epoch_ns = to_epoch_ns(ts)
+
+        assert epoch_ns == 1704110400123456000
+        assert from_epoch_ns(epoch_ns) == ts
+
+    def test_integer_elapsed(self):
+        """Test elapsed time computed from integer nanoseconds."""
+        start = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        end = start + timedelta(seconds=1, microseconds=500000)
+
+        assert (to_epoch_ns(end) - to_epoch_ns(start)) * 1e-9 == pytest.approx(1.5)
@@ -0,0 +1 @@
+"""Tests for utility functions."""
\ No newline at end of file
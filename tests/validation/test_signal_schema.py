@@ -0,0 +1,197 @@
+"""Tests for signal schema validation."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ta2_app.models.metrics import MetricsSnapshot
+from ta2_app.state.runtime import SignalEmitter
+from ta2_app.validation.signal_schema import (
+    _VECTORIZED_MIN_BATCH, SIGNAL_SCHEMA, SignalValidationError, SignalValidator
+)
+
+
+def _signal(**overrides):
+    """Build a valid triggered signal, applying overrides."""
+    now = datetime.now(timezone.utc)
+    signal = {
+        "plan_id": "test-plan",
+        "state": "triggered",
+        "protocol_version": "breakout-v1",
+        "runtime": {
+            "armed_at": (now - timedelta(seconds=30)).isoformat(),
+            "triggered_at": (now - timedelta(seconds=5)).isoformat(),
+            "substate": "none"
+        },
+        "timestamp": now.isoformat(),
+        "metrics": {"rvol": 2.0, "natr_pct": 1.5, "atr": 100.0, "ob_imbalance_long": 0.2},
+        "strength_score": 75.0,
+        "entry_mode": "momentum"
+    }
+    signal.update(overrides)
+    return signal
+
+
+class TestSignalValidator:
+    """Test single-signal validation."""
+
+    def test_validate_signal(self):
+        """Test a well-formed signal passes."""
+        assert SignalValidator().validate_signal(_signal())
+
+    @pytest.mark.parametrize("version", ["breakout-v", "breakout-vx", "breakout-v1.", "breakout-v1-beta"])
+    def test_protocol_version_pattern_enforced(self, version):
+        """Test protocol_version must match the schema pattern."""
+        validator = SignalValidator()
+        validator.logger = Mock()
+
+        with pytest.raises(SignalValidationError, match="protocol_version"):
+            validator.validate_signal(_signal(protocol_version=version))
+
+    @pytest.mark.parametrize("score,expected", [(75, True), (True, True), (float("nan"), False), (None, False), (150, False)])
+    def test_strength_score_single_and_batch_agree(self, score, expected):
+        """Test single-signal and batch validation agree on strength_score edge cases."""
+        validator = SignalValidator()
+        validator.logger = Mock()
+
+        if expected:
+            assert validator.validate_signal(_signal(strength_score=score))
+        else:
+            with pytest.raises(SignalValidationError, match="strength_score"):
+                validator.validate_signal(_signal(strength_score=score))
+        assert validator.validate_signals([_signal(strength_score=score)]) == [expected]
+
+    @pytest.mark.parametrize("pinbar", ["bullish", "bearish"])
+    def test_emitted_pinbar_signal_validates(self, pinbar):
+        """Test a signal built by the engine's emitter with a pinbar passes validation."""
+        now = datetime.now(timezone.utc)
+        signal_data = {
+            "plan_id": "test-plan",
+            "state": "triggered",
+            "runtime": {
+                "armed_at": (now - timedelta(seconds=30)).isoformat(),
+                "triggered_at": now.isoformat()
+            },
+            "timestamp": now.isoformat(),
+            "context": {"last_price": 52000.0, "entry_mode": "retest"}
+        }
+        metrics = MetricsSnapshot(timestamp=now, rvol=2.0, natr_pct=1.5, atr=500.0, pinbar=pinbar)
+
+        signal = SignalEmitter().emit_signal("test-plan", signal_data, metrics)
+
+        assert signal["metrics"]["pinbar_type"] == pinbar
+        assert pinbar in SIGNAL_SCHEMA["properties"]["metrics"]["properties"]["pinbar_type"]["enum"]
+        assert SignalValidator().validate_signal(signal)
+        assert SignalValidator().validate_signals([signal]) == [True]
+
+    def test_missing_required_fields_reported(self):
+        """Test missing required fields are listed and the failure is logged."""
+        signal = _signal()
+        del signal["metrics"], signal["runtime"]
+
+        with pytest.raises(SignalValidationError, match=r"\['metrics', 'runtime'\]"):
+            SignalValidator().validate_signal(signal)
+
+    def test_slots_reject_unknown_attributes(self):
+        """Test the validator only carries its declared attributes."""
+        validator = SignalValidator()
+
+        with pytest.raises(AttributeError):
+            validator.extra = True
+
+    def test_timestamps_accept_z_suffix(self):
+        """Test 'Z'-suffixed timestamps parse as UTC."""
+        now = datetime.now(timezone.utc)
+        signal = _signal(
+            timestamp=now.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            runtime={"triggered_at": (now - timedelta(seconds=1)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")}
+        )
+
+        assert SignalValidator().validate_signal(signal)
+
+    def test_runtime_timestamp_after_signal_rejected(self):
+        """Test runtime timestamps later than the signal timestamp are rejected."""
+        now = datetime.now(timezone.utc)
+        validator = SignalValidator()
+        validator.logger = Mock()
+
+        with pytest.raises(SignalValidationError, match="after signal timestamp"):
+            validator.validate_signal(_signal(
+                timestamp=(now - timedelta(seconds=10)).isoformat(),
+                runtime={"triggered_at": now.isoformat()}
+            ))
+
+    def test_protocol_version_dotted(self):
+        """Test dotted protocol versions are accepted."""
+        assert SignalValidator().validate_signal(_signal(protocol_version="breakout-v2.1.3"))
+
+
+class TestValidateSignalsVectorized:
+    """Test column-wise batch validation."""
+
+    def test_empty_batch(self):
+        """Test empty batch returns no results."""
+        assert SignalValidator().validate_signals_vectorized([]) == []
+
+    def test_valid_signals_pass(self):
+        """Test valid signals of each state pass."""
+        now = datetime.now(timezone.utc)
+        signals = [
+            _signal(),
+            _signal(state="invalid", runtime={"invalid_reason": "price_above"}),
+            _signal(state="expired", runtime={"armed_at": now.isoformat().replace("+00:00", "Z")})
+        ]
+
+        assert SignalValidator().validate_signals_vectorized(signals) == [True, True, True]
+
+    def test_invalid_rows_flagged(self):
+        """Test each failing rule flags only its own row."""
+        now = datetime.now(timezone.utc)
+        signals = [
+            _signal(),
+            _signal(state="unknown"),
+            _signal(strength_score=101),
+            _signal(metrics={"rvol": -1.0}),
+            _signal(metrics={"ob_imbalance_short": 1.5}),
+            _signal(protocol_version="v1"),
+            _signal(timestamp=(now - timedelta(minutes=10)).isoformat()),
+            _signal(timestamp="not-a-timestamp"),
+            _signal(runtime={"triggered_at": (now + timedelta(seconds=10)).isoformat()}),
+            _signal(entry_mode="breakout"),
+            _signal(state="invalid", runtime={}),
+            {"plan_id": "test-plan"}
+        ]
+
+        assert SignalValidator().validate_signals_vectorized(signals) == [True] + [False] * 11
+
+    @pytest.mark.parametrize("copies", [1, 2])
+    def test_validate_timestamps_batch(self, copies):
+        """Test column-wise timestamp parsing, age and ordering checks, with and without datetime64."""
+        now = datetime.now(timezone.utc)
+        plus_two = timezone(timedelta(hours=2))
+        signals = [
+            _signal(),
+            _signal(timestamp=now.astimezone(plus_two).isoformat()),
+            _signal(timestamp=now.strftime("%Y-%m-%dT%H:%M:%S.%fZ")),
+            _signal(timestamp=now.replace(tzinfo=None).isoformat()),
+            _signal(timestamp=(now - timedelta(minutes=6)).isoformat()),
+            _signal(runtime={"break_ts": "garbage", "triggered_at": now.isoformat()}),
+            _signal(runtime={"armed_at": (now + timedelta(seconds=5)).isoformat()})
+        ] * copies
+
+        mask = SignalValidator().validate_timestamps_batch(signals)
+
+        assert mask.tolist() == [True, True, True, False, False, False, False] * copies
+
+    @pytest.mark.parametrize("copies", [1, 20])
+    def test_validate_signals_small_and_large_batches(self, copies):
+        """Test validate_signals gives the same results on both sides of the batch threshold."""
+        validator = SignalValidator()
+        validator.logger = Mock()
+        signals = [_signal(), _signal(strength_score="high"), _signal(protocol_version="breakout-v1-rc")] * copies
+
+        vectorized = SignalValidator.validate_signals_vectorized
+        with patch.object(SignalValidator, 'validate_signals_vectorized', autospec=True, side_effect=vectorized) as batch:
+            assert validator.validate_signals(signals) == [True, False, False] * copies
+        assert batch.called == (len(signals) >= _VECTORIZED_MIN_BATCH)